@@ -0,0 +1,170 @@
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+import threading
+
+from pygfssss import tables
+
+# buttsoft/QR Code/gfshare prime polynomial
+GFSHARE_PRIME_POLY = 0x11d
+
+# Rijndael prime polynomial, x^8 + x^4 + x^3 + x + 1
+RIJNDAEL_PRIME_POLY = 0x11b
+
+
+class GF256Field:
+    """A GF(256) field defined by a prime polynomial, with its precomputed tables -
+   log/exp for a primitive generator, full multiplication (whose rows are the
+   per-constant bytes.translate() tables) and inverse.
+   Fields are immutable, so one field can be shared by any number of threads.
+   Use GF256Field.get() to get the cached field of a prime polynomial, so tables
+   are only built once per process. Tables of the gfshare field are precomputed (see tables)."""
+
+    __fields = {}
+    __fields_lock = threading.Lock()
+
+    def __init__(self, prime_poly, generator=None):
+        if not 0x100 <= prime_poly <= 0x1ff:
+            raise Exception(f'Prime polynomial {prime_poly:#x} must be of degree 8')
+
+        if prime_poly == tables.PRIME_POLY and generator in (None, tables.GENERATOR):
+            self.__prime_poly = prime_poly
+            self.__generator = tables.GENERATOR
+            self.__exptable = list(tables.EXPTABLE)
+            self.__logtable = list(tables.LOGTABLE)
+            self.__mul_table = tables.mul_rows()
+            self.__inv_table = tables.INVTABLE
+            return
+
+        if generator is None:
+            generator = GF256Field.__find_generator(prime_poly)
+        elif GF256Field.__order(generator, prime_poly) != 255:
+            raise Exception(f'{generator:#x} is not a generator of GF(256) with prime polynomial {prime_poly:#x}')
+
+        self.__prime_poly = prime_poly
+        self.__generator = generator
+
+        # exptable[255] = exptable[0] = 1, logtable[0] is undefined and set to 0
+        self.__exptable = [1] * 256
+        self.__logtable = [0] * 256
+        for i in range(1, 256):
+            self.__exptable[i] = GF256Field.__multiply(self.__exptable[i - 1], generator, prime_poly)
+        for i in range(0, 255):
+            self.__logtable[self.__exptable[i]] = i
+
+        self.__mul_table = [bytes(256)]
+        for a in range(1, 256):
+            log_a = self.__logtable[a]
+            self.__mul_table.append(bytes([0] + [self.__exptable[(log_a + self.__logtable[b]) % 255]
+                                                 for b in range(1, 256)]))
+
+        # The inverse of 0 is undefined and set to 0
+        self.__inv_table = bytes([0] + [self.__exptable[(255 - self.__logtable[a]) % 255] for a in range(1, 256)])
+
+    @staticmethod
+    def get(prime_poly=GFSHARE_PRIME_POLY, generator=None):
+        """Return the (cached) field of 'prime_poly', with 'generator' (the smallest primitive element if None)."""
+
+        key = (prime_poly, generator)
+        with GF256Field.__fields_lock:
+            field = GF256Field.__fields.get(key)
+            if field is None:
+                field = GF256Field(prime_poly, generator)
+                GF256Field.__fields[key] = field
+                # The same field is returned when its generator is given explicitly
+                GF256Field.__fields.setdefault((prime_poly, field.generator()), field)
+            return field
+
+    def __reduce__(self):
+        # Unpickled fields are the cached ones (the tables aren't pickled)
+        return GF256Field.get, (self.__prime_poly, self.__generator)
+
+    def __repr__(self):
+        return f'GF256Field({self.__prime_poly:#x}, {self.__generator:#x})'
+
+    @staticmethod
+    def __multiply(a, b, prime_poly):
+        """Multiply 'a' by 'b' bit by bit, only used to build the tables."""
+
+        result = 0
+        while b:
+            if b & 1:
+                result ^= a
+            a <<= 1
+            if a & 0x100:
+                a ^= prime_poly
+            b >>= 1
+
+        return result
+
+    @staticmethod
+    def __order(g, prime_poly):
+        """Return the multiplicative order of 'g' (0 if 'g' isn't invertible)."""
+
+        x = g
+        for order in range(1, 256):
+            if x == 1:
+                return order
+            x = GF256Field.__multiply(x, g, prime_poly)
+
+        return 0
+
+    @staticmethod
+    def __find_generator(prime_poly):
+        for g in range(2, 256):
+            if GF256Field.__order(g, prime_poly) == 255:
+                return g
+
+        raise Exception(f'Prime polynomial {prime_poly:#x} is not irreducible')
+
+    def prime_poly(self):
+        return self.__prime_poly
+
+    def generator(self):
+        return self.__generator
+
+    def logtable(self):
+        """Return the logarithm table (a list, which must not be modified)."""
+        return self.__logtable
+
+    def exptable(self):
+        """Return the exponential table (a list, which must not be modified), exptable[255] = exptable[0]."""
+        return self.__exptable
+
+    def mul_table(self):
+        """Return the product table. Row 'a' is a 256 bytes object whose element 'b' is a*b."""
+        return self.__mul_table
+
+    def translate_table(self, c):
+        """Return the bytes.translate() table for multiplying by 'c'."""
+        return self.__mul_table[c]
+
+    def inv_table(self):
+        """Return the inverse table, a 256 bytes object. The inverse of 0 is undefined and set to 0."""
+        return self.__inv_table
+
+    def mul(self, a, b):
+        return self.__mul_table[a][b]
+
+    def div(self, a, b):
+        if b == 0:
+            raise Exception()
+        return self.__mul_table[a][self.__inv_table[b]]
+
+    def inv(self, a):
+        if a == 0:
+            raise Exception()
+        return self.__inv_table[a]
@@ -15,65 +15,107 @@
 #  limitations under the License.
 #
 
+from pygfssss import tables
+
+
+def import_numpy():
+    """
+    Return the numpy module, None if NumPy isn't installed.
+    NumPy is an optional dependency, only imported on first use (it takes longer to import than most commands run).
+    """
+    global numpy
+    if "numpy" not in globals():
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+    return numpy
+
+
+def __getattr__(name):
+    # "from pygfssss.GF256elt import numpy" imports NumPy
+    if name == "numpy":
+        return import_numpy()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class GF256elt:
     """A class for representing GF256 (GF(2^8)) elements.
    Those elements are representations of polynomials over GF(2) with
    each bit being the coefficient of x^k for k an integer in [0,7].
-   The log/exp tables are generated by generate_logexp_tables or generate_pplogexp_tables."""
+   The log/exp tables are generated by generate_logexp_tables or generate_pplogexp_tables,
+   or loaded by load_tables (the precomputed gfshare tables are loaded on import).
+   Those tables are process-wide, see GF256Field for fields that can be used side by side.
+   Elements are immutable, and GF256elt(value) returns one of 256 interned instances."""
+
+    __slots__ = ("__bytevalue",)
 
     __logtable = []
     __exptable = []
+    # Product table, built on demand from the log/exp tables
+    __multable = None
+
+    # Interned instances, element i has value i
+    __instances = []
+
+    def __new__(cls, value):
+        if cls is GF256elt:
+            return GF256elt.__instances[value % 256]
 
-    def __init__(self, value):
+        # Subclasses aren't interned
+        self = object.__new__(cls)
         self.__bytevalue = value % 256
+        return self
+
+    def __reduce__(self):
+        return GF256elt, (self.__bytevalue,)
 
     def __add__(self, other):
-        if isinstance(other, GF256elt):
-            return GF256elt(self.__bytevalue ^ other.__bytevalue)
-        else:
+        try:
+            return GF256elt.__instances[self.__bytevalue ^ other.__bytevalue]
+        except AttributeError:
             raise Exception()
 
     def __sub__(self, other):
         """In GF256 (and more generally in GF(2^n)) a + b = a - b so just call __add__"""
-        if isinstance(other, GF256elt):
-            return self.__add__(other)
-        else:
+        try:
+            return GF256elt.__instances[self.__bytevalue ^ other.__bytevalue]
+        except AttributeError:
             raise Exception()
 
     def __mul__(self, other):
-        if not isinstance(other, GF256elt):
+        try:
+            a = self.__bytevalue
+            b = other.__bytevalue
+        except AttributeError:
             raise Exception()
 
         # If one of the terms is 0, return 0
-        if self.__bytevalue == 0 or other.__bytevalue == 0:
-            return GF256elt(0)
-
-        # Extract the log of each term then determine the new power
+        if a == 0 or b == 0:
+            return GF256elt.__instances[0]
 
-        p = (self.log() + other.log()) % 255
-
-        return GF256elt(GF256elt.__exptable[p])
+        # Add the logs of the terms to determine the new power
+        logtable = GF256elt.__logtable
+        return GF256elt.__instances[GF256elt.__exptable[(logtable[a] + logtable[b]) % 255]]
 
     def __truediv__(self, other):
-        if not isinstance(other, GF256elt):
+        try:
+            a = self.__bytevalue
+            b = other.__bytevalue
+        except AttributeError:
             raise Exception()
 
         # If second term is 0, raise an exception
-        if other.__bytevalue == 0:
+        if b == 0:
             raise Exception()
 
         # If first term is 0, return 0
-        if self.__bytevalue == 0:
-            return GF256elt(0)
-
-        # Compute the new power from the logs of the operands
+        if a == 0:
+            return GF256elt.__instances[0]
 
-        p = (self.log() - other.log()) % 255
-
-        if p < 0:
-            p += 255
-
-        return GF256elt(GF256elt.__exptable[p])
+        # Subtract the logs of the terms to determine the new power
+        logtable = GF256elt.__logtable
+        return GF256elt.__instances[GF256elt.__exptable[(logtable[a] - logtable[b]) % 255]]
 
     def log(self):
         """Compute the power n so that x^n is equivalent to self in GF256."""
@@ -94,7 +136,25 @@ class GF256elt:
         return str(self.__bytevalue)
 
     def __eq__(self, other):
-        return self.__bytevalue == other.__bytevalue
+        try:
+            return self.__bytevalue == other.__bytevalue
+        except AttributeError:
+            return NotImplemented
+
+    def __hash__(self):
+        return self.__bytevalue
+
+    @staticmethod
+    def generate_instances():
+        """Generate the 256 interned instances returned by GF256elt(value)."""
+
+        instances = []
+        for value in range(256):
+            elt = object.__new__(GF256elt)
+            elt.__bytevalue = value
+            instances.append(elt)
+
+        GF256elt.__instances = instances
 
     @staticmethod
     def generate_pplogexp_tables(prime_poly):
@@ -105,6 +165,7 @@ class GF256elt:
 
         GF256elt.__logtable = [0] * gf_order
         GF256elt.__exptable = [0] * gf_order
+        GF256elt.__multable = None
 
         GF256elt.__logtable[0] = (1 - gf_order) & 0xff
         GF256elt.__exptable[0] = 1
@@ -117,6 +178,15 @@ class GF256elt:
             GF256elt.__exptable[i] &= 0xff
             GF256elt.__logtable[GF256elt.__exptable[i]] = i
 
+    @staticmethod
+    def load_tables(logtable, exptable, multable=None):
+        """Use precomputed log/exp tables (256 entries each, exptable[255] = 1),
+       and product table 'multable' (as returned by mul_table) if provided."""
+
+        GF256elt.__logtable = list(logtable)
+        GF256elt.__exptable = list(exptable)
+        GF256elt.__multable = multable
+
     @staticmethod
     def generate_logexp_tables():
         """Generate logarithm and exponential tables for the GF(256) generator 0x03
@@ -129,6 +199,7 @@ class GF256elt:
 
         GF256elt.__logtable = [0] * 256
         GF256elt.__exptable = [0] * 256
+        GF256elt.__multable = None
 
         # First exponential is 0x03 to the 0th power
         exp = 1
@@ -155,6 +226,174 @@ class GF256elt:
         print(GF256elt.__exptable)
         print(GF256elt.__logtable)
 
+    @staticmethod
+    def tables():
+        """Return the current (logtable, exptable) pair. The tables must not be modified."""
+        return GF256elt.__logtable, GF256elt.__exptable
+
+    @staticmethod
+    def mul_table():
+        """Return the product table of the current field. Row 'a' is a 256 bytes object
+       whose element 'b' is a*b, usable as a bytes.translate() table for multiplying by 'a'."""
+
+        if GF256elt.__multable is None:
+            logtable = GF256elt.__logtable
+            exptable = GF256elt.__exptable
+
+            rows = [bytes(256)]
+            for a in range(1, 256):
+                log_a = logtable[a]
+                rows.append(bytes([0] + [exptable[(log_a + logtable[b]) % 255] for b in range(1, 256)]))
+
+            GF256elt.__multable = rows
+
+        return GF256elt.__multable
+
+
+class GF256Array:
+    """A class for representing arrays of GF256 elements, stored as a uint8 NumPy array.
+   Arithmetic is vectorized through gathers from the log/exp tables of a GF256Field,
+   or from the same log/exp tables as GF256elt if no field is given. Products by a GF256elt
+   are translated through its row of the product table instead.
+   Requires NumPy, which is an optional dependency."""
+
+    # NumPy tables per source exptable id - (exptable, logtable, exptable repeated twice)
+    __tables = {}
+
+    def __init__(self, values, field=None):
+        if import_numpy() is None:
+            raise Exception('GF256Array requires NumPy')
+
+        if isinstance(values, GF256Array):
+            values = values.__values
+        elif isinstance(values, (bytes, bytearray, memoryview)):
+            values = numpy.frombuffer(values, dtype=numpy.uint8)
+
+        self.__values = numpy.asarray(values, dtype=numpy.uint8)
+        self.__field = field
+
+    def __logexp(self):
+        if self.__field is not None:
+            logtable, exptable = self.__field.logtable(), self.__field.exptable()
+        else:
+            logtable, exptable = GF256elt.tables()
+
+        tables = GF256Array.__tables.get(id(exptable))
+        if tables is None or tables[0] is not exptable:
+            # Exponents are the sum of two logs, so repeat the exptable instead of reducing modulo 255
+            tables = (exptable,
+                      numpy.array(logtable, dtype=numpy.uint16),
+                      numpy.array(exptable[:255] * 2 + exptable[:1], dtype=numpy.uint8))
+            GF256Array.__tables[id(exptable)] = tables
+
+        return tables[1], tables[2]
+
+    @staticmethod
+    def __operand(other):
+        if isinstance(other, GF256Array):
+            return other.__values
+        if isinstance(other, GF256elt):
+            return numpy.uint8(int(other))
+        raise Exception()
+
+    def __mul_row(self, value):
+        """Return the 256 bytes translate table of all products by 'value'."""
+        if self.__field is not None:
+            return self.__field.translate_table(value)
+
+        return GF256elt.mul_table()[value]
+
+    def __bytes(self):
+        """Return the values as a bytes object, not copied if the array is a whole view of one."""
+        values = self.__values
+        if isinstance(values.base, bytes) and len(values.base) == len(values) and values.strides == (1,):
+            return values.base
+
+        return values.tobytes()
+
+    def __add__(self, other):
+        return GF256Array(self.__values ^ GF256Array.__operand(other), self.__field)
+
+    def __iadd__(self, other):
+        """In place addition, the array must be writable (e.g. created from a bytearray)."""
+        numpy.bitwise_xor(self.__values, GF256Array.__operand(other), out=self.__values)
+        return self
+
+    def __sub__(self, other):
+        """In GF256 (and more generally in GF(2^n)) a + b = a - b so just call __add__"""
+        return self.__add__(other)
+
+    def __mul__(self, other):
+        if isinstance(other, GF256elt):
+            # A single gather from the row of products by 'other', bytes.translate() is faster than NumPy's gathers
+            return GF256Array(self.__bytes().translate(self.__mul_row(int(other))), self.__field)
+
+        b = GF256Array.__operand(other)
+        logtable, exptable = self.__logexp()
+
+        result = exptable[logtable[self.__values] + logtable[b]]
+        # If one of the terms is 0, the product is 0
+        result[(self.__values == 0) | (b == 0)] = 0
+
+        return GF256Array(result, self.__field)
+
+    def __truediv__(self, other):
+        b = GF256Array.__operand(other)
+
+        # If second term is 0, raise an exception
+        if numpy.any(b == 0):
+            raise Exception()
+
+        logtable, exptable = self.__logexp()
+
+        result = exptable[logtable[self.__values] + 255 - logtable[b]]
+        # If first term is 0, the quotient is 0
+        result[self.__values == 0] = 0
+
+        return GF256Array(result, self.__field)
+
+    def __pow__(self, exponent):
+        if not isinstance(exponent, int) or exponent < 0:
+            raise Exception()
+
+        logtable, exptable = self.__logexp()
+
+        result = exptable[(logtable[self.__values].astype(numpy.int64) * exponent) % 255]
+        if exponent > 0:
+            result[self.__values == 0] = 0
+
+        return GF256Array(result, self.__field)
+
+    def __len__(self):
+        return len(self.__values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return GF256Array(self.__values[index], self.__field)
+        return GF256elt(int(self.__values[index]))
+
+    def __eq__(self, other):
+        return isinstance(other, GF256Array) and numpy.array_equal(self.__values, other.__values)
+
+    def __str__(self):
+        return str(self.__values)
+
+    def field(self):
+        """Return the GF256Field of this array, None for the GF256elt tables."""
+        return self.__field
+
+    def array(self):
+        """Return the underlying uint8 NumPy array."""
+        return self.__values
+
+    def tobytes(self):
+        return self.__values.tobytes()
+
+
+#
+# Generate the interned elements
+#
+GF256elt.generate_instances()
 
 #
 # Generate log/exp tables based on a prime polynomial
@@ -169,6 +408,7 @@ class GF256elt:
 # GF256elt.generate_logexp_tables()
 
 #
-# For buttsoft/QR Code/gfshare compatibility (0x11d prime polynomial)
+# For buttsoft/QR Code/gfshare compatibility (0x11d prime polynomial), same as
+# GF256elt.generate_pplogexp_tables(0x11d), but precomputed
 #
-GF256elt.generate_pplogexp_tables(0x11d)
+GF256elt.load_tables(tables.LOGTABLE, tables.EXPTABLE, tables.mul_rows())
@@ -19,84 +19,70 @@ from pygfssss.GF256elt import GF256elt
 
 
 class PGF256:
-    """Class for representing polynomials whose coefficients are GF256elt."""
+    """Class for representing polynomials whose coefficients are GF256elt.
+   Coefficients are stored as a bytes object, element i being the coefficient for x^i,
+   and arithmetic is done with the GF256elt product table."""
 
     def __init__(self, coeffs):
         # Polynomial coefficients, element i is the coefficient for x^i
-        self.__coefficients = []
+        coefficients = bytearray()
 
         for coeff in coeffs:
             if not isinstance(coeff, GF256elt):
                 raise Exception()
-            self.__coefficients.append(coeff)
+            coefficients.append(int(coeff))
 
-    def __add__(self, other):
-        if isinstance(other, GF256elt):
-            c = self.coeffs()
-            c[0] += other
-            return PGF256(c)
-
-        if not isinstance(other, PGF256):
-            raise Exception()
+        self.__coefficients = bytes(coefficients)
 
-        min_deg = min(self.deg(), other.deg())
-        max_deg = max(self.deg(), other.deg())
+    @staticmethod
+    def from_bytes(coefficients):
+        """Return the polynomial whose coefficient for x^i is byte i of 'coefficients'.
+       Every byte is a valid GF256 element, so no validation is needed."""
 
-        coeffs = []
-
-        for i in range(0, min_deg):
-            coeffs.append(self.coeff(i) + other.coeff(i))
+        p = PGF256.__new__(PGF256)
+        p.__coefficients = bytes(coefficients)
+        return p
 
-        for i in range(min_deg, max_deg):
-            if self.deg() > other.deg():
-                coeffs.append(self.coeff(i))
-            else:
-                coeffs.append(other.coeff(i))
+    def to_bytes(self):
+        """Return the coefficients as a bytes object, byte i being the coefficient for x^i."""
+        return self.__coefficients
 
-        return PGF256(coeffs)
+    @staticmethod
+    def __xor(a, b):
+        """Add coefficient byte strings 'a' and 'b', the result has the length of the longest one."""
+        length = max(len(a), len(b))
+        return (int.from_bytes(a, "little") ^ int.from_bytes(b, "little")).to_bytes(length, "little")
 
-    def __sub__(self, other):
+    def __add__(self, other):
         if isinstance(other, GF256elt):
-            c = self.coeffs()
-            c[0] -= other
-            return PGF256(c)
+            return PGF256.from_bytes(PGF256.__xor(self.__coefficients, bytes([int(other)])))
 
         if not isinstance(other, PGF256):
             raise Exception()
 
-        min_deg = min(self.deg(), other.deg())
-        max_deg = max(self.deg(), other.deg())
-
-        coeffs = []
+        return PGF256.from_bytes(PGF256.__xor(self.__coefficients, other.__coefficients))
 
-        for i in range(0, min_deg + 1):
-            coeffs.append(self.coeff(i) - other.coeff(i))
-
-        zero = GF256elt(0)
-
-        for i in range(min_deg + 1, max_deg + 1):
-            if self.deg() > other.deg():
-                coeffs.append(self.coeff(i))
-            else:
-                coeffs.append(zero - other.coeff(i))
-
-        return PGF256(coeffs)
+    def __sub__(self, other):
+        """In GF256 a + b = a - b, so subtraction is addition"""
+        return self.__add__(other)
 
     def __mul__(self, other):
+        mul = GF256elt.mul_table()
+
         if isinstance(other, GF256elt):
-            c = self.coeffs()
-            return PGF256(map(lambda x: x * other, c))
+            return PGF256.from_bytes(self.__coefficients.translate(mul[int(other)]))
 
         if not isinstance(other, PGF256):
             raise Exception()
 
-        rescoeffs = [GF256elt(0)] * (self.deg() + other.deg() + 1)
+        # Sum of the other polynomial multiplied by every coefficient, shifted to its power
+        result = 0
+        for i, c in enumerate(self.__coefficients):
+            if c != 0:
+                result ^= int.from_bytes(other.__coefficients.translate(mul[c]), "little") << (8 * i)
 
-        for i in range(0, self.deg() + 1):
-            for j in range(0, other.deg() + 1):
-                rescoeffs[i + j] += self.coeff(i) * other.coeff(j)
-
-        return PGF256(rescoeffs)
+        length = max(0, len(self.__coefficients) + len(other.__coefficients) - 1)
+        return PGF256.from_bytes(result.to_bytes(length, "little"))
 
     def coeff(self, i):
         """Return the coefficient for x^i."""
@@ -104,28 +90,21 @@ class PGF256:
         if i >= len(self.__coefficients):
             return GF256elt(0)
         else:
-            return self.__coefficients[i]
+            return GF256elt(self.__coefficients[i])
 
     def coeffs(self):
         """Return a clone of the array of coefficients"""
 
-        c = []
-
-        zero = GF256elt(0)
-
-        for i in range(0, self.deg() + 1):
-            c.append(self.coeff(i) + zero)
-
-        return c
+        return [GF256elt(c) for c in self.__coefficients]
 
     def __repr__(self):
 
         p = ""
         for i in range(0, len(self.__coefficients)):
             if i == 0:
-                p = str(self.coeff(i))
-            elif str(self.coeff(i)) != "0":
-                p = str(self.coeff(i)) + "*x^" + str(i) + " + " + p
+                p = str(self.__coefficients[i])
+            elif self.__coefficients[i] != 0:
+                p = str(self.__coefficients[i]) + "*x^" + str(i) + " + " + p
 
         return p
 
@@ -139,10 +118,11 @@ class PGF256:
         if not isinstance(x, GF256elt):
             raise Exception()
 
-        result = GF256elt(0)
+        mul_x = GF256elt.mul_table()[int(x)]
+
+        result = 0
 
-        for i in range(1, len(self.__coefficients) + 1):
-            result = result * x
-            result += self.__coefficients[len(self.__coefficients) - i]
+        for c in reversed(self.__coefficients):
+            result = mul_x[result] ^ c
 
-        return result
+        return GF256elt(result)
@@ -26,13 +26,7 @@ class PGF256Interpolator:
     def interpolate(self, points):
         """Returns a PGF256 polynomial interpolating all GF256xGF256 tuples in points."""
 
-        #
-        # Check that all points have different X
-        #
-
-        for i in range(0, len(points)):
-            if points[i][0] in map(lambda t: t[0], points[i + 1:]):
-                raise Exception("Duplicate point exception")
+        PGF256Interpolator.__check_points(points)
 
         #
         # Special case for k=2
@@ -60,6 +54,64 @@ class PGF256Interpolator:
 
         return result
 
+    def interpolate_at(self, points, x, weights=None):
+        """Returns the value at GF256 'x' of the polynomial interpolating all GF256xGF256 tuples in points,
+        without building the polynomial.
+        'weights' are the barycentric weights of the X values of points (in the same order), as returned
+        by barycentric_weights. If they aren't provided they're computed, in O(k^2). Otherwise this is O(k)."""
+
+        if weights is None:
+            PGF256Interpolator.__check_points(points)
+            weights = PGF256Interpolator.barycentric_weights([p[0] for p in points])
+        elif len(weights) != len(points):
+            raise Exception(f'Amount of weights {len(weights)} must be identical to amount of points {len(points)}')
+
+        #
+        # Barycentric formula -
+        # L(x) = l(x) * sigma(j=0,j <= k,yj * wj / (x - xj))
+        # Where l(x) = pi(i=0,i <= k, x - xi)
+        #
+
+        zero = GF256elt(0)
+        lx = GF256elt(1)
+        result = zero
+
+        for (xj, yj), wj in zip(points, weights):
+            d = x - xj
+            if d == zero:
+                # x is one of the points
+                return yj
+            lx = lx * d
+            result = result + yj * wj / d
+
+        return lx * result
+
+    @staticmethod
+    def barycentric_weights(x_values):
+        """Returns the barycentric weights wj = 1 / pi(i != j, xj - xi) of GF256 'x_values'.
+        They only depend on the X values, so they can be reused for any Ys."""
+
+        PGF256Interpolator.__check_points([(x, None) for x in x_values])
+
+        one = GF256elt(1)
+        weights = []
+
+        for j in range(0, len(x_values)):
+            d = one
+            for i in range(0, len(x_values)):
+                if i != j:
+                    d = d * (x_values[j] - x_values[i])
+            weights.append(one / d)
+
+        return weights
+
+    @staticmethod
+    def __check_points(points):
+        """Check that all points have different X"""
+
+        if len({int(p[0]) for p in points}) != len(points):
+            raise Exception("Duplicate point exception")
+
     # noinspection PyPep8Naming
     @staticmethod
     def __Lj(points, j):
@@ -0,0 +1,143 @@
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+#
+# asyncio split and combine.
+# Readers are asyncio.StreamReader objects or 'async def read(n)' callables, writers are
+# asyncio.StreamWriter objects or 'async def write(data)' callables.
+# Chunks are split/combined in an executor, so the event loop is never blocked by the
+# field arithmetic, and the writes to all the share sinks are done concurrently.
+#
+
+import asyncio
+import functools
+
+from pygfssss.core import DEFAULT_CHUNK_SIZE, check_chunk_size, pick_random_x_values, split_block
+from pygfssss.engine import combine_engine, split_engine
+
+
+def reader_function(reader):
+    """Return an 'async def read(n)' function for 'reader'."""
+    if hasattr(reader, "read"):
+        return reader.read
+    return reader
+
+
+def writer_function(writer):
+    """Return an 'async def write(data)' function for 'writer'."""
+    if hasattr(writer, "write") and hasattr(writer, "drain"):
+        async def write(data):
+            writer.write(data)
+            await writer.drain()
+        return write
+    return writer
+
+
+async def read_block(read, size):
+    """
+    Read 'size' bytes with 'read', retrying on short reads.
+    Less than 'size' bytes are returned only on EOF.
+    """
+    block = bytearray()
+    while len(block) < size:
+        data = await read(size - len(block))
+        if len(data) == 0:
+            break
+        block += data
+
+    return bytes(block)
+
+
+async def write_all(writes, blocks):
+    await asyncio.gather(*[write(block) for write, block in zip(writes, blocks)])
+
+
+async def async_split(reader, writers, shares_count, shares_threshold, x_values=None,
+                      chunk_size=DEFAULT_CHUNK_SIZE, backend=None, random_source=None, field=None,
+                      executor=None):
+    """
+    Split bytes from 'reader' into 'shares_count' 'writers',
+    with a combine threshold of "shares_threshold".
+    If 'x_values' is provided from the outside, they aren't written to the shares.
+    Chunks are split in 'executor' (the event loop default executor if None),
+    the other arguments are the same as core.split.
+    """
+    if len(writers) != shares_count:
+        raise Exception(f'Amount of writers {len(writers)} must be identical to shares count {shares_count}')
+    check_chunk_size(chunk_size)
+
+    loop = asyncio.get_running_loop()
+    read = reader_function(reader)
+    writes = [writer_function(writer) for writer in writers]
+
+    if x_values is None:
+        # Pick and emit random X values
+        x_values = pick_random_x_values(shares_count, random_source)
+        await write_all(writes, [bytes([x]) for x in x_values])
+
+    engine = split_engine(x_values, shares_threshold, backend, field)
+
+    data = await read_block(read, chunk_size)
+    while len(data) > 0:
+        shares = await loop.run_in_executor(
+            executor, functools.partial(split_block, engine, data, shares_threshold, random_source))
+
+        # Read the next chunk while the shares are written
+        data, _ = await asyncio.gather(read_block(read, chunk_size), write_all(writes, shares))
+
+
+async def async_combine(readers, writer, x_values=None, chunk_size=DEFAULT_CHUNK_SIZE, backend=None,
+                        field=None, executor=None):
+    """
+    Combine shares from 'readers' into 'writer'.
+    If 'x_values' is provided from the outside, they aren't read from the shares.
+    Chunks are combined in 'executor' (the event loop default executor if None),
+    the other arguments are the same as core.combine.
+    """
+    if len(readers) == 0:
+        raise Exception('At least one share is required')
+    check_chunk_size(chunk_size)
+
+    loop = asyncio.get_running_loop()
+    reads = [reader_function(reader) for reader in readers]
+    write = writer_function(writer)
+
+    if x_values is None:
+        # Read X values
+        blocks = await asyncio.gather(*[read_block(read, 1) for read in reads])
+        x_values = []
+        for i in range(0, len(blocks)):
+            if len(blocks[i]) == 0:
+                raise Exception(f'Unexpected EOF while reading X of share {i}')
+            x_values.append(blocks[i][0])
+
+    engine = combine_engine(x_values, backend, field)
+
+    while True:
+        # Blocks are only short on EOF, so when the first share is shorter than another one,
+        # this is the last block anyway
+        blocks = await asyncio.gather(*[read_block(read, chunk_size) for read in reads])
+        length = len(blocks[0])
+        if length == 0:
+            break
+
+        for i in range(1, len(blocks)):
+            if len(blocks[i]) < length:
+                raise Exception(f'Unexpected EOF while reading share {i}')
+            blocks[i] = blocks[i][:length]
+
+        secret = await loop.run_in_executor(executor, engine.combine_chunk, blocks)
+        await write(secret)
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+import argparse
+import json
+import os
+import pathlib
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from io import BytesIO
+
+from pygfssss import core
+from pygfssss.GF256elt import import_numpy
+from pygfssss.engine import BACKENDS, default_backend
+
+SIZE_SUFFIXES = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+# Modules whose import time is measured by bench_startup()
+STARTUP_MODULES = ("pygfssss.core", "pygfssss.gfsplit", "pygfssss.gfcombine", "pygfssss.gfssss")
+
+# Secret size of the command line cold start measurements
+STARTUP_SECRET_SIZE = 32
+
+
+def parse_size(text):
+    """Parse a size such as '1K', '64M' or '1G' into a bytes count."""
+    text = text.strip().upper().rstrip("B")
+    suffix = text[-1:] if text[-1:] in SIZE_SUFFIXES else ""
+    return int(text[:len(text) - len(suffix)]) * SIZE_SUFFIXES[suffix]
+
+
+def parse_list(parse):
+    return lambda text: [parse(t) for t in text.split(",")]
+
+
+def megabytes_per_second(size, seconds):
+    return size / (1024 ** 2) / seconds if seconds > 0 else None
+
+
+def measure(function):
+    """Call 'function' twice, return (seconds of the second call, peak traced memory of the first call)."""
+    # Tracing slows allocations down, so memory is measured in a separate call.
+    # This call also warms up the (lazily built) field tables.
+    tracemalloc.start()
+    try:
+        function()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    start = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - start
+
+    return seconds, peak_memory
+
+
+def bench_library(secret, shares_count, shares_threshold, backend, chunk_size):
+    """Benchmark core.split and core.combine on in-memory streams, return a result per operation."""
+    shares = []
+
+    def split():
+        shares[:] = [BytesIO() for _ in range(shares_count)]
+        core.split(BytesIO(secret), shares, shares_count, shares_threshold, chunk_size=chunk_size, backend=backend)
+
+    def combine():
+        for share in shares:
+            share.seek(0)
+        output_secret = BytesIO()
+        core.combine(shares[:shares_threshold], output_secret, chunk_size=chunk_size, backend=backend)
+        if output_secret.getvalue() != secret:
+            raise Exception('Combined secret is different from the original secret')
+
+    results = []
+    for operation, function in (("split", split), ("combine", combine)):
+        seconds, peak_memory = measure(function)
+        results.append({
+            "path": "library",
+            "operation": operation,
+            "backend": backend,
+            "size": len(secret),
+            "shares_count": shares_count,
+            "threshold": shares_threshold,
+            "chunk_size": chunk_size,
+            "seconds": seconds,
+            "mb_per_s": megabytes_per_second(len(secret), seconds),
+            "peak_memory": peak_memory,
+        })
+
+    return results
+
+
+def run_command(command, stdin_path=None, stdout_path=None):
+    """Run 'command', return (seconds, peak resident memory in bytes or None if unavailable)."""
+    stdin = open(stdin_path, "rb") if stdin_path is not None else subprocess.DEVNULL
+    stdout = open(stdout_path, "wb") if stdout_path is not None else subprocess.DEVNULL
+    try:
+        start = time.perf_counter()
+        process = subprocess.Popen(command, stdin=stdin, stdout=stdout)
+        if hasattr(os, "wait4"):
+            # wait4 gives the resource usage of this specific child
+            _, status, rusage = os.wait4(process.pid, 0)
+            seconds = time.perf_counter() - start
+            process.returncode = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -1
+            # ru_maxrss is in kilobytes, except on macOS where it's in bytes
+            peak_memory = rusage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+        else:
+            process.wait()
+            seconds = time.perf_counter() - start
+            peak_memory = None
+    finally:
+        if stdin_path is not None:
+            stdin.close()
+        if stdout_path is not None:
+            stdout.close()
+
+    if process.returncode != 0:
+        raise Exception(f'Command {command} failed with exit code {process.returncode}')
+
+    return seconds, peak_memory
+
+
+def bench_cli(secret, shares_count, shares_threshold):
+    """Benchmark the pygfsplit/pygfcombine and pygfssss command line tools, return a result per operation."""
+    python_bin = sys.executable
+
+    results = []
+
+    def add_result(path, operation, measurement):
+        seconds, peak_memory = measurement
+        results.append({
+            "path": path,
+            "operation": operation,
+            "size": len(secret),
+            "shares_count": shares_count,
+            "threshold": shares_threshold,
+            "seconds": seconds,
+            "mb_per_s": megabytes_per_second(len(secret), seconds),
+            "peak_memory": peak_memory,
+        })
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir_path = pathlib.Path(temp_dir)
+        secret_path = temp_dir_path / "secret"
+        secret_path.write_bytes(secret)
+        output_path = temp_dir_path / "output"
+
+        # pygfsplit/pygfcombine
+        add_result("pygfsplit", "split", run_command(
+            [python_bin, "-m", "pygfssss.gfsplit", "-n", str(shares_threshold), "-m", str(shares_count),
+             str(secret_path)]))
+        share_paths = sorted(str(p) for p in temp_dir_path.glob("secret.*"))
+        add_result("pygfcombine", "combine", run_command(
+            [python_bin, "-m", "pygfssss.gfcombine", "-o", str(output_path)] + share_paths[:shares_threshold]))
+        if output_path.read_bytes() != secret:
+            raise Exception('pygfcombine output is different from the original secret')
+
+        # pygfssss
+        shares_path = temp_dir_path / "shares.txt"
+        add_result("pygfssss", "split", run_command(
+            [python_bin, "-m", "pygfssss.gfssss", "split", str(shares_threshold), str(shares_count)],
+            stdin_path=secret_path, stdout_path=shares_path))
+        shares_subset_path = temp_dir_path / "shares_subset.txt"
+        with open(shares_path, "rb") as shares_file, open(shares_subset_path, "wb") as shares_subset_file:
+            for _ in range(shares_threshold):
+                shares_subset_file.write(shares_file.readline())
+        add_result("pygfssss", "combine", run_command(
+            [python_bin, "-m", "pygfssss.gfssss", "combine"],
+            stdin_path=shares_subset_path, stdout_path=output_path))
+        if output_path.read_bytes() != secret:
+            raise Exception('pygfssss combine output is different from the original secret')
+
+    return results
+
+
+def bench_startup(repeat):
+    """
+    Benchmark the cold start of fresh interpreters - bare Python, importing every one of STARTUP_MODULES,
+    and running pygfsplit/pygfcombine on a tiny secret. Return a result per measurement, with the
+    median and minimal seconds of 'repeat' runs.
+    """
+    python_bin = sys.executable
+
+    results = []
+
+    def add_result(operation, command):
+        runs = sorted(run_command(command)[0] for _ in range(repeat))
+        results.append({
+            "path": "startup",
+            "operation": operation,
+            "repeat": repeat,
+            "seconds": runs[len(runs) // 2],
+            "min_seconds": runs[0],
+        })
+
+    add_result("python", [python_bin, "-c", "pass"])
+    for module in STARTUP_MODULES:
+        add_result(f"import {module}", [python_bin, "-c", f"import {module}"])
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir_path = pathlib.Path(temp_dir)
+        secret = os.urandom(STARTUP_SECRET_SIZE)
+        secret_path = temp_dir_path / "secret"
+        secret_path.write_bytes(secret)
+        output_path = temp_dir_path / "output"
+
+        # Every run writes shares of other X values, so the shares to combine are written separately
+        split_command = [python_bin, "-m", "pygfssss.gfsplit", "-n", "2", "-m", "3", str(secret_path)]
+        add_result("pygfsplit", split_command + ["split"])
+        run_command(split_command)
+        share_paths = sorted(str(p) for p in temp_dir_path.glob("secret.*"))
+        add_result("pygfcombine", [python_bin, "-m", "pygfssss.gfcombine", "-o", str(output_path)] + share_paths[:2])
+        if output_path.read_bytes() != secret:
+            raise Exception('pygfcombine output is different from the original secret')
+
+    return results
+
+
+def run_benchmarks(sizes, thresholds, shares_counts, backends, chunk_sizes, cli=False, progress=None,
+                   startup_repeat=0):
+    """
+    Run all the benchmark combinations, return the results as a JSON-serializable dict.
+    If 'startup_repeat' is positive, the cold start is measured too (see bench_startup()).
+    """
+    results = []
+
+    if startup_repeat > 0:
+        if progress is not None:
+            progress(f"startup repeat={startup_repeat}")
+        results += bench_startup(startup_repeat)
+
+    for size in sizes:
+        secret = os.urandom(size)
+        for shares_count in shares_counts:
+            for shares_threshold in thresholds:
+                if shares_threshold > shares_count:
+                    continue
+                for backend in backends:
+                    for chunk_size in chunk_sizes:
+                        if progress is not None:
+                            progress(f"library size={size} n={shares_count} k={shares_threshold} "
+                                     f"backend={backend} chunk_size={chunk_size}")
+                        results += bench_library(secret, shares_count, shares_threshold, backend, chunk_size)
+                if cli:
+                    if progress is not None:
+                        progress(f"cli size={size} n={shares_count} k={shares_threshold}")
+                    results += bench_cli(secret, shares_count, shares_threshold)
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": import_numpy().__version__ if import_numpy() is not None else None,
+        "default_backend": default_backend(),
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='pygfssss-bench - measure split and combine throughput and peak memory, output as JSON')
+
+    parser.add_argument('--sizes',
+                        action='store',
+                        type=parse_list(parse_size),
+                        default=[1024, 64 * 1024, 1024 ** 2],
+                        help='comma separated secret sizes, with an optional K/M/G suffix (default 1K,64K,1M)')
+
+    parser.add_argument('--thresholds',
+                        action='store',
+                        type=parse_list(int),
+                        default=[2, 3, 5],
+                        help='comma separated thresholds (default 2,3,5)')
+
+    parser.add_argument('--shares',
+                        dest='shares_counts',
+                        action='store',
+                        type=parse_list(int),
+                        default=[5],
+                        help='comma separated shares counts, up to 255 (default 5)')
+
+    parser.add_argument('--backends',
+                        action='store',
+                        type=parse_list(str),
+                        default=None,
+                        help=f'comma separated engine backends out of {",".join(BACKENDS)} (default all available)')
+
+    parser.add_argument('--chunk-sizes',
+                        action='store',
+                        type=parse_list(parse_size),
+                        default=[core.DEFAULT_CHUNK_SIZE],
+                        help='comma separated chunk sizes, with an optional K/M/G suffix')
+
+    parser.add_argument('--cli',
+                        action='store_true',
+                        help='also benchmark the pygfssss, pygfsplit and pygfcombine command line tools')
+
+    parser.add_argument('--startup',
+                        dest='startup_repeat',
+                        action='store',
+                        type=int,
+                        nargs="?",
+                        const=10,
+                        default=0,
+                        help='also benchmark the import time of the modules and the cold start latency of '
+                             'pygfsplit and pygfcombine, the median of STARTUP_REPEAT runs (default 10)')
+
+    parser.add_argument('-o',
+                        dest='output_file',
+                        action='store',
+                        type=str,
+                        default="",
+                        help='filename to write the JSON results to (default standard output)')
+
+    args = parser.parse_args()
+
+    backends = args.backends
+    if backends is None:
+        backends = [backend for backend in BACKENDS if backend != "numpy" or import_numpy() is not None]
+
+    report = run_benchmarks(args.sizes, args.thresholds, args.shares_counts, backends, args.chunk_sizes, args.cli,
+                            progress=lambda text: print(text, file=sys.stderr), startup_repeat=args.startup_repeat)
+
+    report_text = json.dumps(report, indent=2)
+    if args.output_file == "":
+        print(report_text)
+    else:
+        with open(args.output_file, "w") as f:
+            f.write(report_text + "\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,289 @@
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+#
+# Indexed share container format.
+#
+# A container is a share file made of a header, the share data, and a chunk index -
+#   header - magic (4 bytes) | version (1 byte) | X value (1 byte) | threshold (1 byte) | shares count (1 byte) |
+#            prime polynomial (2 bytes) | secret length (8 bytes) | chunk size (4 bytes)
+#   data   - share bytes, byte i of the share at offset HEADER_SIZE + i
+#   index  - CRC32 of every chunk of 'chunk size' bytes of the data (4 bytes each)
+# All integers are big endian.
+#
+# Unlike gfshare shares, a container holds everything needed to combine it (but the
+# other shares), and its chunks can be read and checked directly.
+#
+
+import collections
+import os
+import zlib
+
+from pygfssss.GF256Field import GF256Field
+from pygfssss.core import DEFAULT_CHUNK_SIZE, check_chunk_size, iter_blocks, iter_split, read_block
+from pygfssss.engine import combine_engine, default_field
+
+MAGIC = b"GFSC"
+VERSION = 1
+HEADER_SIZE = len(MAGIC) + 1 + 1 + 1 + 1 + 2 + 8 + 4
+CRC_SIZE = 4
+
+
+class ContainerHeader:
+    """Header of a share container."""
+
+    def __init__(self, x, shares_threshold, shares_count, prime_poly, length, chunk_size):
+        self.__x = x
+        self.__shares_threshold = shares_threshold
+        self.__shares_count = shares_count
+        self.__prime_poly = prime_poly
+        self.__length = length
+        self.__chunk_size = chunk_size
+
+    def x(self):
+        return self.__x
+
+    def shares_threshold(self):
+        return self.__shares_threshold
+
+    def shares_count(self):
+        return self.__shares_count
+
+    def prime_poly(self):
+        return self.__prime_poly
+
+    def length(self):
+        """Return the length of the secret (and of the share data)."""
+        return self.__length
+
+    def chunk_size(self):
+        return self.__chunk_size
+
+    def chunk_count(self):
+        return (self.__length + self.__chunk_size - 1) // self.__chunk_size
+
+    def index_offset(self):
+        return HEADER_SIZE + self.__length
+
+    def container_size(self):
+        return self.index_offset() + CRC_SIZE * self.chunk_count()
+
+    def parameters(self):
+        """Return the parameters shared by all containers of a secret."""
+        return self.__shares_threshold, self.__shares_count, self.__prime_poly, self.__length, self.__chunk_size
+
+    def pack(self):
+        return MAGIC + bytes([VERSION, self.__x, self.__shares_threshold, self.__shares_count]) + \
+            self.__prime_poly.to_bytes(2, "big") + self.__length.to_bytes(8, "big") + \
+            self.__chunk_size.to_bytes(4, "big")
+
+    @staticmethod
+    def unpack(data):
+        """Return the header packed in 'data', None if it isn't a valid header."""
+        if len(data) < HEADER_SIZE or data[:len(MAGIC)] != MAGIC or data[len(MAGIC)] != VERSION:
+            return None
+
+        pos = len(MAGIC) + 1
+        header = ContainerHeader(data[pos], data[pos + 1], data[pos + 2],
+                                 int.from_bytes(data[pos + 3:pos + 5], "big"),
+                                 int.from_bytes(data[pos + 5:pos + 13], "big"),
+                                 int.from_bytes(data[pos + 13:pos + 17], "big"))
+
+        if header.x() == 0 or header.shares_threshold() == 0 or header.chunk_size() == 0:
+            return None
+
+        return header
+
+
+def split(secret_stream, share_files, shares_threshold, x_values=None, chunk_size=DEFAULT_CHUNK_SIZE, backend=None,
+          random_source=None, field=None):
+    """
+    Split bytes from 'secret_stream' into containers written to seekable binary 'share_files',
+    with a combine threshold of "shares_threshold".
+    X values are picked at random if 'x_values' isn't provided from the outside.
+    The chunk index is computed per 'chunk_size' bytes.
+    """
+    check_chunk_size(chunk_size)
+    if chunk_size >= 2 ** 32:
+        raise Exception(f'Chunk size {chunk_size} must be below 4GB')
+
+    field = default_field(field)
+    shares_count = len(share_files)
+
+    # The length isn't known yet, the headers are written again at the end
+    for share_file in share_files:
+        share_file.write(bytes(HEADER_SIZE))
+
+    blocks = iter_blocks(secret_stream, chunk_size)
+    shares_iter = iter_split(blocks, shares_count, shares_threshold, x_values, backend, random_source, field)
+    if x_values is None:
+        x_values = [x[0] for x in next(shares_iter)]
+
+    length = 0
+    indices = [bytearray() for _ in share_files]
+    for shares in shares_iter:
+        for share_file, index, share in zip(share_files, indices, shares):
+            share_file.write(share)
+            index += zlib.crc32(share).to_bytes(CRC_SIZE, "big")
+        length += len(shares[0])
+
+    for share_file, index, x in zip(share_files, indices, x_values):
+        share_file.write(index)
+        share_file.seek(0)
+        share_file.write(ContainerHeader(x, shares_threshold, shares_count, field.prime_poly(), length,
+                                         chunk_size).pack())
+        share_file.seek(0, os.SEEK_END)
+
+
+def read_headers(share_files):
+    """
+    Read the headers of seekable 'share_files'.
+    Return (header, indices, x_values) - the header of the majority of the containers, the indices
+    of the containers having it and a matching size (in their order in 'share_files'), and the
+    X values of all the containers (None for invalid ones).
+    """
+    headers = []
+    for share_file in share_files:
+        share_file.seek(0)
+        headers.append(ContainerHeader.unpack(read_block(share_file, HEADER_SIZE)))
+
+    counts = collections.Counter(header.parameters() for header in headers if header is not None)
+    if len(counts) == 0:
+        raise Exception('No share is a valid container')
+
+    parameters, _ = counts.most_common(1)[0]
+    header = next(header for header in headers if header is not None and header.parameters() == parameters)
+
+    indices = []
+    x_values = set()
+    for i, share_file in enumerate(share_files):
+        if headers[i] is None or headers[i].parameters() != parameters or headers[i].x() in x_values:
+            continue
+        # Truncated containers aren't used
+        if share_file.seek(0, os.SEEK_END) != header.container_size():
+            continue
+        indices.append(i)
+        x_values.add(headers[i].x())
+
+    if len(indices) < header.shares_threshold():
+        raise Exception(f'Only {len(indices)} shares are valid containers, threshold is {header.shares_threshold()}')
+
+    return header, indices, [h.x() if h is not None else None for h in headers]
+
+
+class ContainerReader:
+    """Reads checked chunks of a set of containers, picking threshold of them."""
+
+    def __init__(self, share_files, backend=None):
+        self.__share_files = share_files
+        self.__backend = backend
+
+        self.__header, self.__candidates, self.__x_values = read_headers(share_files)
+        self.__field = GF256Field.get(self.__header.prime_poly())
+
+        # Chunk indices of the containers, read on first use
+        self.__indices = {}
+
+        # The first threshold containers are used, the others replace them on corrupted chunks
+        self.__selected = self.__candidates[:self.__header.shares_threshold()]
+
+    def header(self):
+        return self.__header
+
+    def __crc(self, i, chunk):
+        if i not in self.__indices:
+            share_file = self.__share_files[i]
+            share_file.seek(self.__header.index_offset())
+            self.__indices[i] = read_block(share_file, CRC_SIZE * self.__header.chunk_count())
+        return self.__indices[i][CRC_SIZE * chunk:CRC_SIZE * (chunk + 1)]
+
+    def __read_chunk(self, i, chunk, start, end):
+        """Return bytes [start,end) of chunk 'chunk' of container 'i' if the chunk is intact, None otherwise."""
+        chunk_size = self.__header.chunk_size()
+        chunk_start = chunk * chunk_size
+
+        share_file = self.__share_files[i]
+        share_file.seek(HEADER_SIZE + chunk_start)
+        data = read_block(share_file, min(chunk_size, self.__header.length() - chunk_start))
+
+        if zlib.crc32(data).to_bytes(CRC_SIZE, "big") != self.__crc(i, chunk):
+            return None
+        return data[start - chunk_start:end - chunk_start]
+
+    def read_chunk(self, chunk, start=None, end=None):
+        """
+        Return bytes [start,end) of the secret (by default all of them), which must be
+        within chunk number 'chunk'. Corrupted containers are replaced by other ones.
+        """
+        chunk_start = chunk * self.__header.chunk_size()
+        if start is None:
+            start = chunk_start
+        if end is None:
+            end = min(chunk_start + self.__header.chunk_size(), self.__header.length())
+
+        blocks = []
+        for position in range(0, len(self.__selected)):
+            data = self.__read_chunk(self.__selected[position], chunk, start, end)
+
+            # Replace a corrupted container by the first unused intact one
+            spares = (i for i in self.__candidates if i not in self.__selected)
+            while data is None:
+                spare = next(spares, None)
+                if spare is None:
+                    raise Exception(f'Chunk {chunk} of share {self.__x_values[self.__selected[position]]} '
+                                    f'is corrupted, and no other share can replace it')
+                data = self.__read_chunk(spare, chunk, start, end)
+                if data is not None:
+                    self.__selected[position] = spare
+
+            blocks.append(data)
+
+        engine = combine_engine([self.__x_values[i] for i in self.__selected], self.__backend, self.__field)
+        return engine.combine_chunk(blocks)
+
+
+def combine(share_files, secret_stream, backend=None):
+    """
+    Combine containers from seekable binary 'share_files' into 'secret_stream'.
+    Threshold, X values, field and length are read from the containers, only threshold
+    containers are read, unless some of their chunks are corrupted.
+    """
+    combine_range(share_files, secret_stream, 0, None, backend)
+
+
+def combine_range(share_files, secret_stream, offset, length=None, backend=None):
+    """
+    Combine bytes [offset,offset+length) of the secret (up to its end if 'length' is None)
+    from containers 'share_files' into 'secret_stream'. Only the chunks holding that range are read.
+    """
+    if len(share_files) == 0:
+        raise Exception('At least one share is required')
+    if offset < 0 or (length is not None and length < 0):
+        raise Exception(f'Offset {offset} and length {length} must not be negative')
+
+    reader = ContainerReader(share_files, backend)
+    chunk_size = reader.header().chunk_size()
+
+    end = reader.header().length()
+    if length is not None:
+        end = min(end, offset + length)
+
+    pos = offset
+    while pos < end:
+        chunk = pos // chunk_size
+        chunk_end = min((chunk + 1) * chunk_size, end)
+        secret_stream.write(reader.read_chunk(chunk, pos, chunk_end))
+        pos = chunk_end
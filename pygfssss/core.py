@@ -16,14 +16,19 @@
 #  limitations under the License.
 #
 
-import secrets
+import os
 
 from pygfssss.GF256elt import GF256elt
 from pygfssss.PGF256 import PGF256
-from pygfssss.PGF256Interpolator import PGF256Interpolator
+from pygfssss.engine import combine_engine, default_field, lagrange_weights, split_engine
+from pygfssss.rng import random_below, random_bytes
+from pygfssss.stats import stage
 
+# Default amount of secret bytes processed at once by split and combine
+DEFAULT_CHUNK_SIZE = 256 * 1024
 
-def pick_random_polynomial(degree, value):
+
+def pick_random_polynomial(degree, value, random_source=None):
     """
     Pick a random PGF256 polynomial P such that P(0) = value
     """
@@ -35,20 +40,29 @@ def pick_random_polynomial(degree, value):
     coeffs.append(value)
 
     # Pick coefficients for x^n with n <= degree
-    for c in range(1, degree + 1):
-        coeffs.append(GF256elt(secrets.SystemRandom().randint(0, 255)))
+    for c in random_bytes(random_source, degree):
+        coeffs.append(GF256elt(c))
 
     return PGF256(coeffs)
 
 
-def pick_random_x_values(n):
+def pick_random_x_values(n, random_source=None):
     # X values must be within the range [1,255], and must not have duplicates.
-    return secrets.SystemRandom().sample(range(1, 255+1), n)
+    if not 0 <= n <= 255:
+        raise Exception(f'Amount of X values {n} must be within the range [0,255]')
+
+    # Partial Fisher-Yates shuffle
+    x_values = list(range(1, 255+1))
+    for i in range(0, n):
+        j = i + random_below(random_source, 255 - i)
+        x_values[i], x_values[j] = x_values[j], x_values[i]
 
+    return x_values[:n]
 
-def split_byte(byte, shares_count, shares_threshold, x_values):
+
+def split_byte(byte, shares_count, shares_threshold, x_values, random_source=None):
     # Pick a random polynomial
-    poly = pick_random_polynomial(shares_threshold - 1, GF256elt(byte))
+    poly = pick_random_polynomial(shares_threshold - 1, GF256elt(byte), random_source)
 
     # Generate the shares
     shares = []
@@ -62,41 +76,121 @@ def split_byte(byte, shares_count, shares_threshold, x_values):
     return shares
 
 
-def split(secret_stream, share_streams, shares_count, shares_threshold, x_values=None):
+def read_block(stream, size):
+    """
+    Read 'size' bytes from 'stream', retrying on short reads.
+    Less than 'size' bytes are returned only on EOF.
+    """
+    data = stream.read(size)
+    if len(data) == size or len(data) == 0:
+        return data
+
+    block = bytearray(data)
+    while len(block) < size:
+        data = stream.read(size - len(block))
+        if len(data) == 0:
+            break
+        block += data
+
+    return bytes(block)
+
+
+def iter_blocks(stream, size, stats=None):
+    """Yield the blocks of 'size' bytes of 'stream', the last one may be shorter."""
+    while True:
+        with stage(stats, "read"):
+            data = read_block(stream, size)
+        if len(data) == 0:
+            break
+        if stats is not None:
+            stats.count("read", len(data))
+        yield data
+
+
+def check_chunk_size(chunk_size):
+    if chunk_size < 1:
+        raise Exception(f'Chunk size {chunk_size} must be positive')
+
+
+def split_block(engine, data, shares_threshold, random_source=None, stats=None):
+    """
+    Return the shares of bytes-like 'data' computed by split 'engine', one per X value.
+    If 'stats' is provided, the random and compute stages are recorded in it.
+    """
+    # Pick random coefficients for x^n with 1 <= n < threshold, for all bytes of the block
+    with stage(stats, "random", len(data) * (shares_threshold - 1)):
+        random_data = random_bytes(random_source, len(data) * (shares_threshold - 1))
+        coeffs_chunks = [random_data[j:j + len(data)] for j in range(0, len(random_data), len(data))]
+
+    with stage(stats, "compute", len(data)):
+        return engine.split_chunk(data, coeffs_chunks)
+
+
+def split(secret_stream, share_streams, shares_count, shares_threshold, x_values=None,
+          chunk_size=DEFAULT_CHUNK_SIZE, backend=None, random_source=None, field=None, stats=None):
     """
     Split bytes from 'secret_stream' into 'shares_count' share streams,
     with a combine threshold of "shares_threshold".
     If 'x_values' is provided from the outside, they aren't written to the shares.
+    The secret is processed in blocks of 'chunk_size' bytes, using engine 'backend'
+    ("python" or "numpy", by default "numpy" if NumPy is available).
+    Random X values and coefficients are drawn from 'random_source', a callable
+    returning the requested amount of random bytes (by default the system CSPRNG).
+    Arithmetic is done in GF256Field 'field' (by default the gfshare compatible 0x11d field).
+    If 'stats' (a stats.Stats object) is provided, the time and bytes of every stage are recorded in it.
     """
     if len(share_streams) != shares_count:
         raise Exception(f'Amount of streams {len(share_streams)} must be identical to shares count {shares_count}')
+    check_chunk_size(chunk_size)
 
     if x_values is None:
-        # Pick and emit random X values
-        x_values = pick_random_x_values(shares_count)
+        # Write X values
+        x_values = pick_random_x_values(shares_count, random_source)
         for i in range(0, shares_count):
             share_streams[i].write(bytes([x_values[i]]))
 
-    # Loop through the stream bytes
-    while True:
-        data = secret_stream.read(1)
-        if len(data) == 0:
-            break
-        byte = data[0]
+    blocks = iter_blocks(secret_stream, chunk_size, stats)
+    for shares in iter_split(blocks, shares_count, shares_threshold, x_values, backend, random_source, field, stats):
+        with stage(stats, "write", len(shares[0]) * shares_count):
+            for i in range(0, shares_count):
+                share_streams[i].write(shares[i])
+        if stats is not None:
+            stats.chunk(len(shares[0]))
 
-        shares = split_byte(byte, shares_count, shares_threshold, x_values)
 
-        for i in range(0, shares_count):
-            share_streams[i].write(shares[i])
+def select_shares(shares, x_values, shares_threshold):
+    """
+    Return the first 'shares_threshold' of 'shares' and of 'x_values' (which may be None),
+    all of them if 'shares_threshold' is None.
+    """
+    if shares_threshold is None:
+        return shares, x_values
+
+    if shares_threshold < 1:
+        raise Exception(f'Threshold {shares_threshold} must be positive')
+    if len(shares) < shares_threshold:
+        raise Exception(f'Amount of shares {len(shares)} must be at least the threshold {shares_threshold}')
 
+    return shares[:shares_threshold], x_values[:shares_threshold] if x_values is not None else None
 
-def combine(share_streams, secret_stream, x_values=None):
+
+def combine(share_streams, secret_stream, x_values=None, chunk_size=DEFAULT_CHUNK_SIZE, backend=None,
+            field=None, shares_threshold=None, stats=None):
     """
     Combine shares from 'share_streams' into 'secret_stream'.
     If 'x_values' is provided from the outside, they aren't read from the shares.
+    If 'shares_threshold' is provided, only the first 'shares_threshold' shares are used
+    (and read), otherwise all of them are.
+    The shares are processed in blocks of 'chunk_size' bytes, using engine 'backend'
+    ("python" or "numpy", by default "numpy" if NumPy is available).
+    Arithmetic is done in GF256Field 'field' (by default the gfshare compatible 0x11d field).
+    If 'stats' (a stats.Stats object) is provided, the time and bytes of every stage are recorded in it.
     """
-    interpolator = PGF256Interpolator()
-    zero = GF256elt(0)
+    if len(share_streams) == 0:
+        raise Exception('At least one share is required')
+    check_chunk_size(chunk_size)
+
+    share_streams, x_values = select_shares(share_streams, x_values, shares_threshold)
 
     if x_values is None:
         # Read X values
@@ -107,32 +201,357 @@ def combine(share_streams, secret_stream, x_values=None):
                 raise Exception(f'Unexpected EOF while reading X of share {i}')
             x_values.append(data[0])
 
-    end_of_share = False
-    while not end_of_share:
-        points = []
-        i = 0
+    combine_blocks(share_streams, secret_stream, combine_engine(x_values, backend, field), chunk_size, None, stats)
+
+
+def combine_blocks(share_streams, secret_stream, engine, chunk_size, remaining=None, stats=None):
+    """
+    Combine blocks of 'chunk_size' bytes from 'share_streams' into 'secret_stream' using combine 'engine',
+    up to the end of the first share, or up to 'remaining' bytes if provided.
+    """
+    while remaining is None or remaining > 0:
+        # Extract a block of Ys from every share, the first share determines the block length
+        size = chunk_size if remaining is None else min(chunk_size, remaining)
+        with stage(stats, "read"):
+            blocks = [read_block(share_streams[0], size)]
+            length = len(blocks[0])
+            if length == 0:
+                break
+
+            for i in range(1, len(share_streams)):
+                data = read_block(share_streams[i], length)
+                if len(data) < length:
+                    raise Exception(f'Unexpected EOF while reading share {i}')
+                blocks.append(data)
+
+        # Decode the whole block
+        with stage(stats, "compute", length):
+            secret = engine.combine_chunk(blocks)
+        with stage(stats, "write", length):
+            secret_stream.write(secret)
+
+        if stats is not None:
+            stats.count("read", length * len(share_streams))
+            stats.chunk(length)
+
+        if remaining is not None:
+            remaining -= length
+
+
+def combine_range(share_streams, secret_stream, offset, length=None, x_values=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                  backend=None, field=None, shares_threshold=None, stats=None):
+    """
+    Combine bytes [offset,offset+length) of the secret (up to its end if 'length' is None)
+    from seekable 'share_streams' into 'secret_stream'. Only that range of the shares is read.
+    If 'x_values' is provided from the outside, they aren't read from the shares, otherwise
+    they are read from the first byte of every share, and share offsets are shifted by one.
+    Other arguments are the same as combine().
+    """
+    if len(share_streams) == 0:
+        raise Exception('At least one share is required')
+    if offset < 0 or (length is not None and length < 0):
+        raise Exception(f'Offset {offset} and length {length} must not be negative')
+    check_chunk_size(chunk_size)
+
+    share_streams, x_values = select_shares(share_streams, x_values, shares_threshold)
+
+    base = 0
+    if x_values is None:
+        # Read X values
+        x_values = []
         for i in range(0, len(share_streams)):
-            # Extract Y
+            share_streams[i].seek(0)
             data = share_streams[i].read(1)
             if len(data) == 0:
-                end_of_share = True
-                break
-            y = data[0]
+                raise Exception(f'Unexpected EOF while reading X of share {i}')
+            x_values.append(data[0])
+        base = 1
 
-            # Push point
-            points.append((GF256elt(x_values[i]), GF256elt(y)))
+    engine = combine_engine(x_values, backend, field)
 
-        if end_of_share:
-            if i != 0:
-                raise Exception(f'Unexpected EOF while reading share {i}')
+    for stream in share_streams:
+        stream.seek(base + offset)
+
+    combine_blocks(share_streams, secret_stream, engine, chunk_size, length, stats)
+
+
+def iter_split(chunks, shares_count, shares_threshold, x_values=None, backend=None, random_source=None,
+               field=None, stats=None):
+    """
+    Split the secret given as an iterable of bytes-like 'chunks' into 'shares_count' shares,
+    with a combine threshold of "shares_threshold".
+    Yield a tuple of 'shares_count' share chunks for every secret chunk.
+    If 'x_values' isn't provided from the outside, random X values are picked
+    and the first tuple holds them (a single byte per share).
+    Memory use is bounded by the chunk size times the shares count.
+    """
+    if x_values is None:
+        x_values = pick_random_x_values(shares_count, random_source)
+        yield tuple(bytes([x]) for x in x_values)
+    elif len(x_values) != shares_count:
+        raise Exception(f'Amount of X values {len(x_values)} must be identical to shares count {shares_count}')
+
+    engine = split_engine(x_values, shares_threshold, backend, field)
+
+    for chunk in chunks:
+        if len(chunk) == 0:
+            continue
+        yield tuple(split_block(engine, chunk, shares_threshold, random_source, stats))
+
+
+def iter_combine(share_chunk_iters, x_values=None, backend=None, field=None):
+    """
+    Combine shares given as iterables of bytes-like chunks, one iterable per share.
+    Yield the secret chunks.
+    Chunks of different shares don't have to be aligned, the first share determines
+    the secret chunks.
+    If 'x_values' is provided from the outside, they aren't read from the shares.
+    """
+    if len(share_chunk_iters) == 0:
+        raise Exception('At least one share is required')
+
+    iterators = [iter(chunks) for chunks in share_chunk_iters]
+    buffers = [bytearray() for _ in iterators]
+    exhausted = [False] * len(iterators)
+
+    def fill(i, size):
+        """Pull chunks of share 'i' until at least 'size' bytes are buffered, or its end."""
+        while len(buffers[i]) < size and not exhausted[i]:
+            chunk = next(iterators[i], None)
+            if chunk is None:
+                exhausted[i] = True
+            else:
+                buffers[i] += chunk
+
+    if x_values is None:
+        # Read X values
+        x_values = []
+        for i in range(0, len(iterators)):
+            fill(i, 1)
+            if len(buffers[i]) == 0:
+                raise Exception(f'Unexpected EOF while reading X of share {i}')
+            x_values.append(buffers[i][0])
+            del buffers[i][:1]
+
+    engine = combine_engine(x_values, backend, field)
+
+    while True:
+        fill(0, 1)
+        length = len(buffers[0])
+        if length == 0:
             break
 
-        # Decode next byte
-        byte_value = interpolator.interpolate(points).f(zero)
-        secret_stream.write(bytes([int(byte_value)]))
+        blocks = []
+        for i in range(0, len(iterators)):
+            fill(i, length)
+            if len(buffers[i]) < length:
+                raise Exception(f'Unexpected EOF while reading share {i}')
+            blocks.append(bytes(buffers[i][:length]))
+            del buffers[i][:length]
+
+        yield engine.combine_chunk(blocks)
+
+
+def split_many(secrets, shares_count, shares_threshold, x_values=None, chunk_size=DEFAULT_CHUNK_SIZE, backend=None,
+               random_source=None, field=None):
+    """
+    Split every one of the bytes-like 'secrets' (any iterable) into 'shares_count' shares, with a combine
+    threshold of "shares_threshold", all of them with the same X values.
+    The secrets are split together in a single pass, 'chunk_size' bytes at a time.
+    Return (x_values, blobs, offsets) - blobs[i] holds share i of all the secrets back to back,
+    share i of secret j being blobs[i][offsets[j]:offsets[j + 1]].
+    If 'x_values' isn't provided from the outside, random X values are picked.
+    """
+    if x_values is None:
+        x_values = pick_random_x_values(shares_count, random_source)
+    check_chunk_size(chunk_size)
+
+    # 'secrets' is iterated twice (it may be a generator)
+    secrets = list(secrets)
+
+    offsets = [0]
+    for secret in secrets:
+        offsets.append(offsets[-1] + len(secret))
+
+    # Bytes of different secrets are independent, so their concatenation is split as one
+    data = b"".join(secrets)
+
+    blobs = [bytearray() for _ in range(0, shares_count)]
+    with memoryview(data) as view:
+        chunks = (view[pos:pos + chunk_size] for pos in range(0, len(data), chunk_size))
+        for shares in iter_split(chunks, shares_count, shares_threshold, x_values, backend, random_source, field):
+            for blob, share in zip(blobs, shares):
+                blob += share
+
+    return x_values, [bytes(blob) for blob in blobs], offsets
+
+
+def combine_many(share_sets, backend=None, field=None):
+    """
+    Combine many secrets, given as an iterable of (x_values, shares) pairs, 'shares' holding
+    a bytes-like share per X value. Return the list of secrets.
+    Secrets with the same X values are combined together in a single pass.
+    """
+    # Indices and shares of the secrets per tuple of X values
+    groups = {}
+    count = 0
+    for x_values, shares in share_sets:
+        if len(x_values) == 0:
+            raise Exception(f'At least one share of secret {count} is required')
+        if len(shares) != len(x_values):
+            raise Exception(f'Amount of shares {len(shares)} of secret {count} must be identical to '
+                            f'amount of X values {len(x_values)}')
+        if any(len(share) != len(shares[0]) for share in shares):
+            raise Exception(f'Shares of secret {count} must have the same length')
+
+        groups.setdefault(tuple(x_values), []).append((count, shares))
+        count += 1
+
+    secrets = [b""] * count
+    for x_values, members in groups.items():
+        engine = combine_engine(x_values, backend, field)
+
+        data = engine.combine_chunk([b"".join(shares[i] for _, shares in members) for i in range(0, len(x_values))])
+
+        pos = 0
+        for index, shares in members:
+            secrets[index] = data[pos:pos + len(shares[0])]
+            pos += len(shares[0])
+
+    return secrets
+
+
+def is_mappable_output(path):
+    # Output files are preallocated and mapped, which requires a new or a regular file
+    return not os.path.exists(path) or os.path.isfile(path)
+
+
+def split_file(secret_path, share_paths, shares_threshold, x_values, jobs=1,
+               chunk_size=DEFAULT_CHUNK_SIZE, backend=None, field=None, stats=None):
+    """
+    Split file 'secret_path' into files 'share_paths', one per X value in 'x_values'.
+    X values aren't written to the shares (gfshare style).
+    Regular files are split through mmap, and with 'jobs' > 1, byte ranges of the
+    file are split by a pool of 'jobs' processes. Other files are split as streams.
+    Stages aren't recorded in 'stats' with 'jobs' > 1, only the ranges split by the processes.
+    """
+    check_chunk_size(chunk_size)
+
+    if os.path.isfile(secret_path) and all(is_mappable_output(path) for path in share_paths):
+        if jobs > 1:
+            from pygfssss import parallel
+            parallel.split_file(secret_path, share_paths, shares_threshold, x_values, jobs, chunk_size, backend,
+                                field, stats)
+        else:
+            from pygfssss import mmapio
+            mmapio.split_file(secret_path, share_paths, shares_threshold, x_values, chunk_size, backend, field, stats)
+        return
+
+    with open(secret_path, "rb") as secret_file:
+        shares = [open(path, "wb") for path in share_paths]
+        try:
+            split(secret_file, shares, len(shares), shares_threshold, x_values, chunk_size, backend, field=field,
+                  stats=stats)
+        finally:
+            for share in shares:
+                share.close()
+
+
+def check_consistency(share_streams, x_values, shares_threshold, samples, field=None, random_source=None):
+    """
+    Check that 'samples' random offsets of seekable 'share_streams' (one per X value in 'x_values')
+    lie on the polynomials through the first 'shares_threshold' shares, raise an exception otherwise.
+    Offsets are relative to the current positions of the streams, the first share determines the length.
+    Only the sampled bytes are read.
+    """
+    if len(share_streams) <= shares_threshold or samples <= 0:
+        return
+
+    mul = default_field(field).mul_table()
+
+    bases = [stream.tell() for stream in share_streams]
+    length = share_streams[0].seek(0, os.SEEK_END) - bases[0]
+    if length <= 0:
+        return
+
+    # Lagrange weights of the first shares at the X values of the others
+    weights = [lagrange_weights(x_values[:shares_threshold], x, field) for x in x_values[shares_threshold:]]
+
+    for _ in range(0, samples):
+        offset = random_below(random_source, length)
+
+        values = []
+        for i, stream in enumerate(share_streams):
+            stream.seek(bases[i] + offset)
+            data = stream.read(1)
+            if len(data) == 0:
+                raise Exception(f'Unexpected EOF while reading share {i}')
+            values.append(data[0])
+
+        for u, share_weights in enumerate(weights):
+            expected = 0
+            for weight, value in zip(share_weights, values):
+                expected ^= mul[weight][value]
+            if values[shares_threshold + u] != expected:
+                raise Exception(f'Share {shares_threshold + u} is inconsistent with the first {shares_threshold} '
+                                f'shares at offset {offset}')
+
+    for i, stream in enumerate(share_streams):
+        stream.seek(bases[i])
+
+
+def combine_file(share_paths, secret_path, x_values, jobs=1, chunk_size=DEFAULT_CHUNK_SIZE, backend=None,
+                 field=None, shares_threshold=None, check_samples=0, stats=None):
+    """
+    Combine files 'share_paths', one per X value in 'x_values', into file 'secret_path'.
+    If 'shares_threshold' is provided, only 'shares_threshold' of the shares are combined,
+    preferring regular files in the order given. With 'check_samples' > 0, that amount of
+    random offsets of the other shares are checked to be consistent with the combined ones.
+    Regular files are combined through mmap, and with 'jobs' > 1, byte ranges of the
+    files are combined by a pool of 'jobs' processes. Other files are combined as streams.
+    Stages aren't recorded in 'stats' with 'jobs' > 1, only the ranges combined by the processes.
+    """
+    check_chunk_size(chunk_size)
+
+    if shares_threshold is not None:
+        # Regular files first, the others (pipes, devices) may be slow and can't be mapped
+        order = sorted(range(0, len(share_paths)), key=lambda i: not os.path.isfile(share_paths[i]))
+        share_paths = [share_paths[i] for i in order]
+        x_values = [x_values[i] for i in order]
+
+        if check_samples > 0:
+            # Sampled offsets are read at random, which streams (pipes, devices) don't allow
+            if not all(os.path.isfile(path) for path in share_paths):
+                raise Exception('Consistency checks require all the shares to be regular files')
+            shares = [open(path, "rb") for path in share_paths]
+            try:
+                check_consistency(shares, x_values, shares_threshold, check_samples, field)
+            finally:
+                for share in shares:
+                    share.close()
+
+        share_paths, x_values = select_shares(share_paths, x_values, shares_threshold)
+
+    if all(os.path.isfile(path) for path in share_paths) and is_mappable_output(secret_path):
+        if jobs > 1:
+            from pygfssss import parallel
+            parallel.combine_file(share_paths, secret_path, x_values, jobs, chunk_size, backend, field, stats)
+        else:
+            from pygfssss import mmapio
+            mmapio.combine_file(share_paths, secret_path, x_values, chunk_size, backend, field, stats)
+        return
+
+    shares = [open(path, "rb") for path in share_paths]
+    try:
+        with open(secret_path, "wb") as secret_file:
+            combine(shares, secret_file, x_values, chunk_size, backend, field, stats=stats)
+    finally:
+        for share in shares:
+            share.close()
 
 
 def main():
+    import secrets
     from io import BytesIO
 
     secret = BytesIO(b"Too many secrets, Marty!")
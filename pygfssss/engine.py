@@ -0,0 +1,297 @@
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+import functools
+
+from pygfssss.GF256Field import GF256Field
+from pygfssss.GF256elt import GF256Array, GF256elt, import_numpy
+
+# Available engine backends, "numpy" is used by default when NumPy is importable
+BACKENDS = ("python", "numpy")
+
+# Below this amount of secret bytes, importing NumPy takes longer than the numpy backend saves
+NUMPY_MIN_SIZE = 1024 * 1024
+
+
+def default_backend(size=None):
+    """
+    Return the default backend - "numpy" when NumPy is importable, unless the amount of secret
+    bytes 'size' is known to be below NUMPY_MIN_SIZE (NumPy isn't imported then).
+    """
+    if size is not None and size < NUMPY_MIN_SIZE:
+        return "python"
+    return "numpy" if import_numpy() is not None else "python"
+
+
+def default_field(field):
+    """Return 'field', or the gfshare compatible (0x11d) field if None."""
+    return field if field is not None else GF256Field.get()
+
+
+def split_engine(x_values, shares_threshold, backend=None, field=None):
+    """
+    Return a split engine for 'x_values' using 'backend' (the default backend if None),
+    over GF256Field 'field' (the gfshare compatible field if None).
+    Engines are cached, so the tables are only computed once per set of X values.
+    """
+    if backend is None:
+        backend = default_backend()
+
+    return cached_split_engine(tuple(x_values), shares_threshold, backend, default_field(field))
+
+
+@functools.lru_cache(maxsize=64)
+def cached_split_engine(x_values, shares_threshold, backend, field):
+    if backend == "python":
+        return SplitEngine(x_values, shares_threshold, field)
+    if backend == "numpy":
+        return NumpySplitEngine(x_values, shares_threshold, field)
+
+    raise Exception(f'Unknown backend {backend}, must be one of {", ".join(BACKENDS)}')
+
+
+def combine_engine(x_values, backend=None, field=None):
+    """
+    Return a combine engine for 'x_values' using 'backend' (the default backend if None),
+    over GF256Field 'field' (the gfshare compatible field if None).
+    """
+    if backend is None:
+        backend = default_backend()
+
+    if backend == "python":
+        return CombineEngine(x_values, field)
+    if backend == "numpy":
+        return NumpyCombineEngine(x_values, field)
+
+    raise Exception(f'Unknown backend {backend}, must be one of {", ".join(BACKENDS)}')
+
+
+def vandermonde_matrix(x_values, shares_threshold, field=None):
+    """
+    Return the Vandermonde matrix of 'x_values', as a list of rows [x^0, x^1, ..., x^(threshold-1)].
+    Shares of a chunk are the product of this matrix and of the matrix whose rows are
+    the secret chunk and the threshold-1 random coefficient chunks.
+    """
+    if shares_threshold < 1:
+        raise Exception(f'Threshold {shares_threshold} must be positive')
+
+    mul = default_field(field).mul_table()
+
+    matrix = []
+    for x in x_values:
+        if not 1 <= x <= 255:
+            raise Exception(f'X value {x} must be within the range [1,255]')
+
+        row = [1]
+        for _ in range(1, shares_threshold):
+            row.append(mul[row[-1]][x])
+        matrix.append(row)
+
+    return matrix
+
+
+def lagrange_weights(x_values, x=0, field=None):
+    """
+    Return the Lagrange basis polynomials of 'x_values' evaluated at 'x', one weight per X value.
+    The value at 'x' of the polynomial through points (x_values[j], y[j]) is the sum of weight[j] * y[j].
+    Weights are cached per set of X values (whatever their order), see weights_cache_info().
+    """
+    if len(set(x_values)) != len(x_values):
+        raise Exception("Duplicate point exception")
+
+    sorted_x_values = tuple(sorted(x_values))
+    weights = dict(zip(sorted_x_values, cached_lagrange_weights(sorted_x_values, x, default_field(field))))
+
+    return [weights[xj] for xj in x_values]
+
+
+def weights_cache_info():
+    """Return the hits, misses, maxsize and currsize of the Lagrange weights cache (a functools cache_info)."""
+    return cached_lagrange_weights.cache_info()
+
+
+def set_weights_cache_size(maxsize):
+    """Replace the Lagrange weights cache by an empty one holding up to 'maxsize' sets of X values."""
+    global cached_lagrange_weights
+    cached_lagrange_weights = functools.lru_cache(maxsize=maxsize)(compute_lagrange_weights)
+
+
+def compute_lagrange_weights(x_values, x, field):
+    mul = field.mul_table()
+    inv = field.inv_table()
+
+    #
+    # Lj(x) = pi(i != j, (x - xi)/(xj - xi)) = pi(i != j, (x + xi)/(xj + xi))
+    #
+
+    weights = []
+    for j, xj in enumerate(x_values):
+        numerator = 1
+        denominator = 1
+        for i, xi in enumerate(x_values):
+            if i == j:
+                continue
+            numerator = mul[numerator][x ^ xi]
+            denominator = mul[denominator][xj ^ xi]
+        weights.append(mul[numerator][inv[denominator]])
+
+    return tuple(weights)
+
+
+# Default amount of sets of X values whose Lagrange weights are cached
+WEIGHTS_CACHE_SIZE = 256
+
+cached_lagrange_weights = functools.lru_cache(maxsize=WEIGHTS_CACHE_SIZE)(compute_lagrange_weights)
+
+
+class SplitEngine:
+    """Table-driven share generation for a fixed set of X values.
+    The Vandermonde matrix of the X values is precomputed, along with a 256 bytes
+    translate table per entry, so a share of a whole chunk is the XOR of the
+    secret chunk and of the random coefficient chunks translated by the
+    entries of its row."""
+
+    def __init__(self, x_values, shares_threshold, field=None):
+        field = default_field(field)
+        mul = field.mul_table()
+
+        self.__shares_threshold = shares_threshold
+        self.__tables = []
+
+        for row in vandermonde_matrix(x_values, shares_threshold, field):
+            # Entries equal to 1 don't need a translation, their table is None
+            self.__tables.append([mul[entry] if entry != 1 else None for entry in row[1:]])
+
+    def split_chunk(self, secret_chunk, coeffs_chunks):
+        """
+        Return the share chunks of bytes-like 'secret_chunk', one per X value.
+        'coeffs_chunks' holds threshold-1 random chunks of the same length as
+        'secret_chunk', element j-1 being the coefficients of x^j.
+        """
+        if len(coeffs_chunks) != self.__shares_threshold - 1:
+            raise Exception(f'Amount of coefficient chunks {len(coeffs_chunks)} must be threshold - 1 '
+                            f'({self.__shares_threshold - 1})')
+
+        length = len(secret_chunk)
+        secret_int = int.from_bytes(secret_chunk, "little")
+
+        shares = []
+        for tables in self.__tables:
+            # XOR over whole chunks is done on (arbitrary precision) integers
+            y = secret_int
+            for coeffs, table in zip(coeffs_chunks, tables):
+                if table is not None:
+                    coeffs = coeffs.translate(table)
+                y ^= int.from_bytes(coeffs, "little")
+            shares.append(y.to_bytes(length, "little"))
+
+        return shares
+
+
+class CombineEngine:
+    """Table-driven secret reconstruction for a fixed set of X values.
+    The Lagrange basis polynomials are evaluated at 0 once, giving a weight per
+    share, so a secret chunk is the XOR of the share chunks translated by
+    their weights."""
+
+    def __init__(self, x_values, field=None):
+        mul = default_field(field).mul_table()
+
+        self.__weights = lagrange_weights(x_values, 0, field)
+        self.__tables = [mul[w] for w in self.__weights]
+
+    def weights(self):
+        """Return the Lagrange basis weights at 0, one per X value."""
+        return list(self.__weights)
+
+    def combine_chunk(self, share_chunks):
+        """
+        Return the secret chunk reconstructed from 'share_chunks', one per X value.
+        All share chunks must be bytes-like objects of the same length.
+        """
+        if len(share_chunks) != len(self.__tables):
+            raise Exception(f'Amount of share chunks {len(share_chunks)} must be identical to '
+                            f'amount of X values {len(self.__tables)}')
+
+        length = len(share_chunks[0])
+
+        secret_int = 0
+        for chunk, table in zip(share_chunks, self.__tables):
+            if not isinstance(chunk, (bytes, bytearray)):
+                # translate() isn't available on other bytes-like objects (memoryview, mmap)
+                chunk = bytes(chunk)
+            secret_int ^= int.from_bytes(chunk.translate(table), "little")
+
+        return secret_int.to_bytes(length, "little")
+
+
+class NumpySplitEngine:
+    """Vectorized share generation, same interface as SplitEngine.
+    Chunks are GF256Array objects, every coefficient chunk is multiplied by a matrix entry
+    through a single translation, and added (XORed) in place into the share."""
+
+    def __init__(self, x_values, shares_threshold, field=None):
+        if import_numpy() is None:
+            raise Exception('The numpy backend requires NumPy')
+
+        self.__field = default_field(field)
+        self.__shares_threshold = shares_threshold
+        # Entries equal to 1 don't need a multiplication, their element is None
+        self.__elements = [[GF256elt(entry) if entry != 1 else None for entry in row[1:]]
+                           for row in vandermonde_matrix(x_values, shares_threshold, self.__field)]
+
+    def split_chunk(self, secret_chunk, coeffs_chunks):
+        if len(coeffs_chunks) != self.__shares_threshold - 1:
+            raise Exception(f'Amount of coefficient chunks {len(coeffs_chunks)} must be threshold - 1 '
+                            f'({self.__shares_threshold - 1})')
+
+        coeffs = [GF256Array(c, self.__field) for c in coeffs_chunks]
+
+        shares = []
+        for elements in self.__elements:
+            y = GF256Array(bytearray(secret_chunk), self.__field)
+            for c, element in zip(coeffs, elements):
+                y += c * element if element is not None else c
+            shares.append(y.tobytes())
+
+        return shares
+
+
+class NumpyCombineEngine:
+    """Vectorized secret reconstruction, same interface as CombineEngine.
+    Every share chunk is multiplied by its weight through a single translation, and added in place into the secret."""
+
+    def __init__(self, x_values, field=None):
+        if import_numpy() is None:
+            raise Exception('The numpy backend requires NumPy')
+
+        self.__field = default_field(field)
+        self.__weights = lagrange_weights(x_values, 0, self.__field)
+        self.__elements = [GF256elt(w) for w in self.__weights]
+
+    def weights(self):
+        return list(self.__weights)
+
+    def combine_chunk(self, share_chunks):
+        if len(share_chunks) != len(self.__elements):
+            raise Exception(f'Amount of share chunks {len(share_chunks)} must be identical to '
+                            f'amount of X values {len(self.__elements)}')
+
+        secret = GF256Array(bytearray(len(share_chunks[0])), self.__field)
+        for chunk, element in zip(share_chunks, self.__elements):
+            secret += GF256Array(chunk, self.__field) * element
+
+        return secret.tobytes()
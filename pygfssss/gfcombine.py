@@ -16,10 +16,15 @@
 #
 
 import argparse
-import pathlib
+import os
 import re
+import stat
+import sys
 
 from pygfssss import core
+from pygfssss.GF256Field import GF256Field, GFSHARE_PRIME_POLY
+from pygfssss.engine import default_backend
+from pygfssss.stats import Stats, profile, progress_printer
 
 
 def main():
@@ -33,6 +38,91 @@ def main():
                         default="",
                         help='filename to write the combined result to')
 
+    parser.add_argument('-j',
+                        dest='jobs',
+                        action='store',
+                        type=int,
+                        default=1,
+                        help='number of processes to combine with')
+
+    parser.add_argument('-n',
+                        dest='threshold',
+                        action='store',
+                        type=int,
+                        default=None,
+                        help='number of shares needed to recombine, only that many of the shares are read '
+                             '(default all of them)')
+
+    parser.add_argument('--check-samples',
+                        dest='check_samples',
+                        action='store',
+                        type=int,
+                        default=0,
+                        help='with -n, number of random offsets of the unused shares to check for consistency '
+                             '(default 0)')
+
+    parser.add_argument('--offset',
+                        dest='offset',
+                        action='store',
+                        type=int,
+                        default=None,
+                        help='offset of the first byte of the secret to combine, only the requested range of the '
+                             'shares is read (default 0)')
+
+    parser.add_argument('--length',
+                        dest='length',
+                        action='store',
+                        type=int,
+                        default=None,
+                        help='amount of bytes of the secret to combine (default up to its end)')
+
+    parser.add_argument('--prime-poly',
+                        dest='prime_poly',
+                        action='store',
+                        type=lambda t: int(t, 0),
+                        default=GFSHARE_PRIME_POLY,
+                        help='prime polynomial of the GF(256) field, e.g. 0x11b for Rijndael '
+                             '(default 0x11d, other values aren\'t gfshare compatible)')
+
+    parser.add_argument('--integrity',
+                        dest='integrity',
+                        action='store_true',
+                        help='verify the digests of shares split with pygfsplit --integrity, '
+                             'retrying other subsets of the shares on mismatch')
+
+    parser.add_argument('--container',
+                        dest='container',
+                        action='store_true',
+                        help='combine shares split with pygfsplit --container, the threshold, X values and field '
+                             'are read from the shares (which may be named anything)')
+
+    parser.add_argument('--pipeline',
+                        dest='pipeline',
+                        action='store_true',
+                        help='read the shares, combine them and write the result in concurrent threads')
+
+    parser.add_argument('--fsync',
+                        dest='fsync',
+                        action='store_true',
+                        help='with --pipeline, sync the result to disk before exiting')
+
+    parser.add_argument('--stats',
+                        dest='stats',
+                        action='store_true',
+                        help='print the throughput and the time spent reading, computing and writing to stderr')
+
+    parser.add_argument('--progress',
+                        dest='progress',
+                        action='store_true',
+                        help='print the progress to stderr')
+
+    parser.add_argument('--profile',
+                        dest='profile',
+                        action='store',
+                        type=str,
+                        default=None,
+                        help='profile the combine with cProfile, writing the results to PROFILE')
+
     parser.add_argument('input_file',
                         action='store',
                         type=str,
@@ -41,27 +131,133 @@ def main():
 
     args = parser.parse_args()
 
+    if args.fsync and not args.pipeline:
+        parser.error('--fsync requires --pipeline')
+    if args.pipeline and (args.integrity or args.container or args.offset is not None or args.length is not None):
+        parser.error('--pipeline can\'t be used with --integrity, --container, --offset or --length')
+    if (args.stats or args.progress) and (args.integrity or args.container or args.pipeline):
+        parser.error('--stats and --progress can\'t be used with --integrity, --container or --pipeline')
+    if args.integrity and args.container:
+        parser.error('--integrity can\'t be used with --container')
+    if args.container and args.prime_poly != GFSHARE_PRIME_POLY:
+        parser.error('--prime-poly can\'t be used with --container, the field is read from the shares')
+    if args.integrity and (args.offset is not None or args.length is not None):
+        parser.error('--offset and --length can\'t be used with --integrity')
+    if args.jobs != 1 and (args.integrity or args.container or args.pipeline or args.offset is not None or
+                           args.length is not None):
+        parser.error('-j can\'t be used with --integrity, --container, --pipeline, --offset or --length')
+    if args.check_samples > 0:
+        if args.threshold is None:
+            parser.error('--check-samples requires -n')
+        if args.integrity or args.container or args.pipeline or args.offset is not None or args.length is not None:
+            parser.error('--check-samples can\'t be used with --integrity, --container, --pipeline, --offset or '
+                         '--length')
+    if args.threshold is not None and (args.integrity or args.container):
+        # Integrity retries other subsets of all the shares, containers hold their threshold
+        parser.error('-n can\'t be used with --integrity or --container')
+
+    stats = None
+    if args.stats or args.progress:
+        stats = Stats(progress_printer(secret_size(args)) if args.progress else None)
+
+    with profile(args.profile):
+        combine(args, stats)
+
+    if args.progress:
+        print(file=sys.stderr)
+    if args.stats:
+        print(stats.report(), file=sys.stderr)
+
+
+def secret_size(args):
+    """
+    Return the amount of secret bytes to combine (at most) according to parsed command line 'args',
+    None if unknown (the first share isn't a regular file).
+    """
+    if args.length is not None:
+        return args.length
+
+    share_stat = os.stat(args.input_file[0])
+    if not stat.S_ISREG(share_stat.st_mode):
+        return None
+    return max(0, share_stat.st_size - (args.offset or 0))
+
+
+def combine(args, stats=None):
+    """Combine the input files as requested by parsed command line 'args', recording 'stats' if provided."""
+
     x_values = []
-    shares = []
     for input_file in args.input_file:
+        # Containers hold their X values
+        if args.container:
+            continue
         matches = re.match(".*[.]([0-9][0-9][0-9])", input_file)
         if matches is None:
             raise Exception(f"Share files must be with a numeric .NNN suffix, '{input_file}' isn't")
         x_values.append(int(matches[1]))
-        shares.append(open(input_file, "rb"))
 
     output_file_path = args.output_file
     if output_file_path == "":
-        p = pathlib.Path(args.input_file[0])
-        output_file_path = str(p.parents[0] / p.stem)
+        output_file_path = os.path.join(os.path.dirname(args.input_file[0]),
+                                        os.path.splitext(os.path.basename(args.input_file[0]))[0])
+
+    field = GF256Field.get(args.prime_poly)
+
+    # NumPy isn't imported for small secrets
+    backend = default_backend(secret_size(args))
+
+    ranged = args.offset is not None or args.length is not None
+    offset = args.offset if args.offset is not None else 0
+
+    # The other modes are only imported when used
+    if args.container:
+        from pygfssss import container
+        shares = [open(path, "rb") for path in args.input_file]
+        try:
+            with open(output_file_path, "wb") as output_file:
+                container.combine_range(shares, output_file, offset, args.length, backend)
+        finally:
+            for share in shares:
+                share.close()
+        return
+
+    if ranged:
+        shares, x_values = core.select_shares(args.input_file, x_values, args.threshold)
+        shares = [open(path, "rb") for path in shares]
+        try:
+            with open(output_file_path, "wb") as output_file:
+                core.combine_range(shares, output_file, offset, args.length, x_values, backend=backend, field=field,
+                                   stats=stats)
+        finally:
+            for share in shares:
+                share.close()
+        return
 
-    output_file = open(output_file_path, "wb")
+    if args.integrity:
+        from pygfssss import integrity
+        shares = [open(path, "rb") for path in args.input_file]
+        try:
+            with open(output_file_path, "wb") as output_file:
+                integrity.combine(shares, output_file, x_values, backend=backend, field=field)
+        finally:
+            for share in shares:
+                share.close()
+        return
 
-    core.combine(shares, output_file, x_values)
+    if args.pipeline:
+        from pygfssss import pipeline
+        shares, x_values = core.select_shares(args.input_file, x_values, args.threshold)
+        shares = [open(path, "rb") for path in shares]
+        try:
+            with open(output_file_path, "wb") as output_file:
+                pipeline.combine(shares, output_file, x_values, backend=backend, field=field, fsync=args.fsync)
+        finally:
+            for share in shares:
+                share.close()
+        return
 
-    output_file.close()
-    for share in shares:
-        share.close()
+    core.combine_file(args.input_file, output_file_path, x_values, args.jobs, backend=backend, field=field,
+                      shares_threshold=args.threshold, check_samples=args.check_samples, stats=stats)
 
 
 if __name__ == '__main__':
@@ -16,9 +16,13 @@
 #
 
 import argparse
-import pathlib
+import os
+import sys
 
 from pygfssss import core
+from pygfssss.GF256Field import GF256Field, GFSHARE_PRIME_POLY
+from pygfssss.engine import default_backend
+from pygfssss.stats import Stats, profile, progress_printer
 
 
 def main():
@@ -39,6 +43,61 @@ def main():
                         default=5,
                         help='number of shares to build')
 
+    parser.add_argument('-j',
+                        dest='jobs',
+                        action='store',
+                        type=int,
+                        default=1,
+                        help='number of processes to split with')
+
+    parser.add_argument('--prime-poly',
+                        dest='prime_poly',
+                        action='store',
+                        type=lambda t: int(t, 0),
+                        default=GFSHARE_PRIME_POLY,
+                        help='prime polynomial of the GF(256) field, e.g. 0x11b for Rijndael '
+                             '(default 0x11d, other values aren\'t gfshare compatible)')
+
+    parser.add_argument('--integrity',
+                        dest='integrity',
+                        action='store_true',
+                        help='store a keyed digest per chunk in the shares, verified by pygfcombine --integrity '
+                             '(not gfshare compatible)')
+
+    parser.add_argument('--container',
+                        dest='container',
+                        action='store_true',
+                        help='write the shares as indexed containers, holding the threshold, the field and '
+                             'the secret length, combined by pygfcombine --container (not gfshare compatible)')
+
+    parser.add_argument('--pipeline',
+                        dest='pipeline',
+                        action='store_true',
+                        help='read, split and write the shares in concurrent threads')
+
+    parser.add_argument('--fsync',
+                        dest='fsync',
+                        action='store_true',
+                        help='with --pipeline, sync the shares to disk before exiting')
+
+    parser.add_argument('--stats',
+                        dest='stats',
+                        action='store_true',
+                        help='print the throughput and the time spent reading, drawing random bytes, computing '
+                             'and writing to stderr')
+
+    parser.add_argument('--progress',
+                        dest='progress',
+                        action='store_true',
+                        help='print the progress to stderr')
+
+    parser.add_argument('--profile',
+                        dest='profile',
+                        action='store',
+                        type=str,
+                        default=None,
+                        help='profile the split with cProfile, writing the results to PROFILE')
+
     parser.add_argument('input_file',
                         action='store',
                         type=argparse.FileType('rb'),
@@ -53,21 +112,79 @@ def main():
 
     args = parser.parse_args()
 
-    secret_file_path = pathlib.Path(args.input_file.name)
-    secret_file_dir = secret_file_path.parents[0]
+    if args.fsync and not args.pipeline:
+        parser.error('--fsync requires --pipeline')
+    if args.pipeline and (args.integrity or args.container):
+        parser.error('--pipeline can\'t be used with --integrity or --container')
+    if args.jobs != 1 and (args.integrity or args.container or args.pipeline):
+        parser.error('-j can\'t be used with --integrity, --container or --pipeline')
+    if args.jobs != 1 and args.input_file is sys.stdin.buffer:
+        # Only regular files are split with multiple processes
+        parser.error('-j can\'t be used when splitting stdin')
+    if (args.stats or args.progress) and (args.integrity or args.container or args.pipeline):
+        parser.error('--stats and --progress can\'t be used with --integrity, --container or --pipeline')
+
+    stats = None
+    if args.stats or args.progress:
+        total = None if args.input_file is sys.stdin.buffer else os.path.getsize(args.input_file.name)
+        stats = Stats(progress_printer(total) if args.progress else None)
+
+    with profile(args.profile):
+        split(args, stats)
+
+    if args.progress:
+        print(file=sys.stderr)
+    if args.stats:
+        print(stats.report(), file=sys.stderr)
+
+
+def split(args, stats=None):
+    """Split the input file as requested by parsed command line 'args', recording 'stats' if provided."""
+
+    secret_file_path = args.input_file.name
+    secret_file_dir = os.path.dirname(secret_file_path)
 
     output_stem = args.output_stem
     if output_stem == "":
-        output_stem = secret_file_path.name
+        output_stem = os.path.basename(secret_file_path)
+
+    field = GF256Field.get(args.prime_poly)
+
+    # NumPy isn't imported for small secrets
+    backend = default_backend(None if args.input_file is sys.stdin.buffer else os.path.getsize(secret_file_path))
 
     x_values = core.pick_random_x_values(args.shares_count)
 
-    shares = []
+    output_paths = []
     for t in range(args.shares_count):
-        output_path = secret_file_dir / (output_stem + "." + str(x_values[t]).zfill(3))
-        shares.append(output_path.open("wb"))
+        output_paths.append(os.path.join(secret_file_dir, output_stem + "." + str(x_values[t]).zfill(3)))
 
-    core.split(args.input_file, shares, args.shares_count, args.threshold, x_values)
+    if args.input_file is not sys.stdin.buffer and not args.integrity and not args.container and not args.pipeline:
+        # Regular files are split through mmap (and with multiple processes, if requested)
+        args.input_file.close()
+        core.split_file(secret_file_path, output_paths, args.threshold, x_values, args.jobs, backend=backend,
+                        field=field, stats=stats)
+        return
+
+    shares = []
+    for output_path in output_paths:
+        shares.append(open(output_path, "wb"))
+
+    # The other modes are only imported when used
+    if args.container:
+        from pygfssss import container
+        container.split(args.input_file, shares, args.threshold, x_values, backend=backend, field=field)
+    elif args.integrity:
+        from pygfssss import integrity
+        integrity.split(args.input_file, shares, args.shares_count, args.threshold, x_values, backend=backend,
+                        field=field)
+    elif args.pipeline:
+        from pygfssss import pipeline
+        pipeline.split(args.input_file, shares, args.shares_count, args.threshold, x_values, backend=backend,
+                       field=field, fsync=args.fsync)
+    else:
+        core.split(args.input_file, shares, args.shares_count, args.threshold, x_values, backend=backend,
+                   field=field, stats=stats)
 
     args.input_file.close()
     for share in shares:
@@ -16,42 +16,122 @@
 #
 
 import argparse
-import binascii
+import os
+import shutil
+import stat
 import sys
-from io import BytesIO
-
-from pygfssss import core
-
-
-def split(args):
-    shares = []
-    for _ in range(args.shares_count):
-        shares.append(BytesIO())
-
-    core.split(sys.stdin.buffer, shares, args.shares_count, args.threshold)
-
-    for share in shares:
-        print(share.getvalue().hex())
-
-
-def combine(_):
-    shares_text = sys.stdin.readlines()
-    shares_text = [t.strip() for t in shares_text]
-
-    shares = []
-    for share_text in shares_text:
-        share_bin = binascii.unhexlify(share_text)
-        shares.append(BytesIO(share_bin))
-
-    output_secret = BytesIO()
-    core.combine(shares, output_secret)
-    sys.stdout.buffer.write(output_secret.getvalue())
+import tempfile
+
+from pygfssss import core, hexio
+from pygfssss.GF256Field import GF256Field, GFSHARE_PRIME_POLY
+from pygfssss.engine import NUMPY_MIN_SIZE, default_backend
+from pygfssss.stats import Stats, profile, progress_printer
+
+
+def split(args, stats=None):
+    field = GF256Field.get(args.prime_poly)
+
+    x_values = core.pick_random_x_values(args.shares_count)
+
+    # NumPy isn't imported for small secrets. The size of piped secrets isn't known, so the start
+    # of the secret is read first - NumPy is only used if there is at least NUMPY_MIN_SIZE of it.
+    secret = sys.stdin.buffer
+    stdin_stat = os.fstat(secret.fileno())
+    if stat.S_ISREG(stdin_stat.st_mode):
+        backend = default_backend(stdin_stat.st_size)
+    else:
+        head = core.read_block(secret, NUMPY_MIN_SIZE)
+        backend = default_backend(len(head))
+        secret = hexio.PrefixedReader(head, secret)
+
+    if args.output_dir is not None:
+        os.makedirs(args.output_dir, exist_ok=True)
+        sinks = [open(os.path.join(args.output_dir, f"share.{x:03}"), "wb") for x in x_values]
+    else:
+        sinks = [tempfile.TemporaryFile() for _ in x_values]
+
+    try:
+        # Shares are hex encoded a chunk at a time, starting with their X value
+        shares = [hexio.HexWriter(sink) for sink in sinks]
+        for share, x in zip(shares, x_values):
+            share.write(bytes([x]))
+
+        if args.integrity:
+            from pygfssss import integrity
+            integrity.split(secret, shares, args.shares_count, args.threshold, x_values, backend=backend,
+                            field=field)
+        else:
+            core.split(secret, shares, args.shares_count, args.threshold, x_values, backend=backend,
+                       field=field, stats=stats)
+
+        for sink in sinks:
+            sink.write(b"\n")
+            if args.output_dir is None:
+                sink.seek(0)
+                shutil.copyfileobj(sink, sys.stdout.buffer, core.DEFAULT_CHUNK_SIZE)
+    finally:
+        for sink in sinks:
+            sink.close()
+
+
+def combine(args, stats=None):
+    if len(args.share_files) > 0:
+        # Share files are decoded as they are read
+        if args.threshold is not None:
+            args.share_files = args.share_files[:args.threshold]
+        sources = [open(path, "rb") for path in args.share_files]
+        shares = [hexio.HexReader(source) for source in sources]
+        # Hex digits per share byte
+        digits = 2
+    else:
+        # Shares are lines of stdin, so all but the last have to be spooled
+        sources = hexio.spool_lines(sys.stdin.buffer, args.threshold)
+        shares = sources
+        digits = 1
+
+    # NumPy isn't imported for small secrets
+    backend = default_backend(os.fstat(sources[0].fileno()).st_size // digits if len(sources) > 0 else None)
+
+    try:
+        if args.threshold is not None and len(shares) < args.threshold:
+            raise Exception(f'Amount of shares {len(shares)} must be at least the threshold {args.threshold}')
+
+        if args.integrity:
+            from pygfssss import integrity
+            integrity.combine(shares, sys.stdout.buffer, backend=backend, field=GF256Field.get(args.prime_poly))
+        elif args.offset is not None or args.length is not None:
+            # The X value prefix of the shares is accounted for by combine_range()
+            core.combine_range(shares, sys.stdout.buffer, args.offset if args.offset is not None else 0, args.length,
+                               backend=backend, field=GF256Field.get(args.prime_poly), stats=stats)
+        else:
+            core.combine(shares, sys.stdout.buffer, backend=backend, field=GF256Field.get(args.prime_poly),
+                         stats=stats)
+    finally:
+        for source in sources:
+            source.close()
+
+
+def add_stats_arguments(parser):
+    parser.add_argument('--stats',
+                        dest='stats',
+                        action='store_true',
+                        help='print the throughput and the time spent per stage to stderr')
+    parser.add_argument('--progress',
+                        dest='progress',
+                        action='store_true',
+                        help='print the progress to stderr')
+    parser.add_argument('--profile',
+                        dest='profile',
+                        action='store',
+                        type=str,
+                        default=None,
+                        help='profile the command with cProfile, writing the results to PROFILE')
 
 
 def main():
     parser = argparse.ArgumentParser(
         description='pygfssss - split and combine secrets using Shamir Secret Sharing Scheme ' +
-                    'over GF(256) with 0x11d prime polynomial')
+                    'over GF(256) with 0x11d prime polynomial (by default)')
 
     subparsers = parser.add_subparsers(title="commands",
                                        required=True,
@@ -71,14 +151,85 @@ def main():
                               nargs="?",
                               default=5,
                               help='number of shares to create')
+    split_parser.add_argument('--prime-poly',
+                              dest='prime_poly',
+                              action='store',
+                              type=lambda t: int(t, 0),
+                              default=GFSHARE_PRIME_POLY,
+                              help='prime polynomial of the GF(256) field, e.g. 0x11b for Rijndael (default 0x11d)')
+    split_parser.add_argument('--integrity',
+                              dest='integrity',
+                              action='store_true',
+                              help='store a keyed digest per chunk in the shares')
+    split_parser.add_argument('--output-dir',
+                              dest='output_dir',
+                              action='store',
+                              type=str,
+                              default=None,
+                              help='write every share to a share.NNN file in this directory (NNN being its '
+                                   'X value) instead of a line of stdout')
+    add_stats_arguments(split_parser)
     split_parser.set_defaults(func=split)
 
     split_parser = subparsers.add_parser('combine',
                                          help="combine shares back into a secret")
+    split_parser.add_argument('--prime-poly',
+                              dest='prime_poly',
+                              action='store',
+                              type=lambda t: int(t, 0),
+                              default=GFSHARE_PRIME_POLY,
+                              help='prime polynomial of the GF(256) field, e.g. 0x11b for Rijndael (default 0x11d)')
+    split_parser.add_argument('--integrity',
+                              dest='integrity',
+                              action='store_true',
+                              help='verify the digests of shares split with --integrity')
+    split_parser.add_argument('--threshold',
+                              dest='threshold',
+                              action='store',
+                              type=int,
+                              default=None,
+                              help='number of shares needed to combine, only that many shares are read '
+                                   '(default all of them)')
+    split_parser.add_argument('--offset',
+                              dest='offset',
+                              action='store',
+                              type=int,
+                              default=None,
+                              help='offset of the first byte of the secret to combine (default 0)')
+    split_parser.add_argument('--length',
+                              dest='length',
+                              action='store',
+                              type=int,
+                              default=None,
+                              help='amount of bytes of the secret to combine (default up to its end)')
+    split_parser.add_argument('share_files',
+                              action='store',
+                              type=str,
+                              nargs="*",
+                              help='files holding a share each (e.g. written by split --output-dir), '
+                                   'instead of lines of stdin')
+    add_stats_arguments(split_parser)
     split_parser.set_defaults(func=combine)
 
     args = parser.parse_args()
-    args.func(args)
+
+    if args.command == "combine" and args.integrity and (args.offset is not None or args.length is not None):
+        parser.error('--offset and --length can\'t be used with --integrity')
+    if (args.stats or args.progress) and args.integrity:
+        parser.error('--stats and --progress can\'t be used with --integrity')
+
+    stats = None
+    if args.stats or args.progress:
+        # Stdin size isn't known, progress is in bytes only
+        stats = Stats(progress_printer() if args.progress else None)
+
+    with profile(args.profile):
+        args.func(args, stats)
+
+    if args.progress:
+        print(file=sys.stderr)
+    if args.stats:
+        print(stats.report(), file=sys.stderr)
 
 
 if __name__ == '__main__':
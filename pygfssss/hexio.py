@@ -0,0 +1,134 @@
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+#
+# Streaming hex encoding and decoding of shares, as used by the pygfssss command line tool
+# (a share per line, in hex), and helpers for reading its stdin.
+# Shares are encoded and decoded a chunk at a time, so memory use doesn't depend on their size.
+#
+
+import binascii
+import tempfile
+
+from pygfssss.core import DEFAULT_CHUNK_SIZE, iter_blocks
+
+# Whitespace ignored within hex text
+WHITESPACE = b" \t\r\n"
+
+
+class HexWriter:
+    """Binary stream writing everything written to it as hex text to 'stream'."""
+
+    def __init__(self, stream):
+        self.__stream = stream
+
+    def write(self, data):
+        self.__stream.write(binascii.hexlify(data))
+        return len(data)
+
+
+class HexReader:
+    """Binary stream reading the bytes encoded as hex text by 'stream', ignoring whitespace."""
+
+    def __init__(self, stream):
+        self.__stream = stream
+        self.__pending = b""
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            text = self.__pending + self.__stream.read().translate(None, WHITESPACE)
+            self.__pending = b""
+            return binascii.unhexlify(text)
+
+        text = self.__pending
+        while len(text) < 2 * size:
+            data = self.__stream.read(2 * size - len(text))
+            if len(data) == 0:
+                break
+            text += data.translate(None, WHITESPACE)
+
+        text, self.__pending = text[:2 * size], text[2 * size:]
+        return binascii.unhexlify(text)
+
+    def seek(self, offset):
+        """Seek to byte 'offset', the hex text mustn't have whitespace before it (e.g. a single line)."""
+        self.__pending = b""
+        return self.__stream.seek(2 * offset) // 2
+
+
+class PrefixedReader:
+    """Binary stream reading 'head' (bytes already read from 'stream'), then the rest of 'stream'."""
+
+    def __init__(self, head, stream):
+        self.__head = head
+        self.__stream = stream
+
+    def read(self, size=-1):
+        if len(self.__head) == 0:
+            return self.__stream.read(size)
+
+        if size is None or size < 0:
+            data = self.__head + self.__stream.read()
+            self.__head = b""
+            return data
+
+        data, self.__head = self.__head[:size], self.__head[size:]
+        return data
+
+
+def spool_lines(stream, max_lines=None, chunk_size=2 * DEFAULT_CHUNK_SIZE):
+    """
+    Decode the hex lines of binary 'stream' into temporary files, one per non-empty line,
+    reading 'chunk_size' bytes at a time. Return the files, positioned at their start.
+    If 'max_lines' is provided, reading stops at the end of line number 'max_lines'.
+    """
+    sinks = []
+    sink = None
+    # Odd hex digit left from the previous chunk
+    pending = b""
+
+    for block in iter_blocks(stream, chunk_size):
+        for i, text in enumerate(block.split(b"\n")):
+            if i > 0:
+                # End of line
+                if len(pending) > 0:
+                    raise Exception(f'Odd amount of hex digits in share {len(sinks) - 1}')
+                sink = None
+                if len(sinks) == max_lines:
+                    return rewind(sinks)
+
+            text = pending + text.translate(None, WHITESPACE)
+            if len(text) == 0:
+                continue
+
+            if sink is None:
+                sink = tempfile.TemporaryFile()
+                sinks.append(sink)
+
+            even = len(text) // 2 * 2
+            sink.write(binascii.unhexlify(text[:even]))
+            pending = text[even:]
+
+    if len(pending) > 0:
+        raise Exception(f'Odd amount of hex digits in share {len(sinks) - 1}')
+
+    return rewind(sinks)
+
+
+def rewind(files):
+    for f in files:
+        f.seek(0)
+    return files
@@ -0,0 +1,220 @@
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+#
+# Share format extension with a keyed digest per chunk of the secret.
+#
+# Every share starts with a header -
+#   magic (4 bytes) | version (1 byte) | threshold (1 byte) | chunk size (4 bytes) | share of the digest key (32 bytes)
+# followed by a record per chunk of the secret -
+#   share chunk (chunk size bytes, shorter for the last chunk) | digest (16 bytes)
+# (preceded by the X value byte, if X values aren't provided from the outside).
+#
+# The digest is a BLAKE2b MAC of the chunk index, a last chunk flag and the secret
+# chunk. Its key is random and split like the secret, so it is only known to
+# holders of at least threshold shares.
+#
+
+import collections
+import hashlib
+import hmac
+import itertools
+
+from pygfssss.core import DEFAULT_CHUNK_SIZE, check_chunk_size, iter_blocks, pick_random_x_values, read_block, \
+    split_block
+from pygfssss.engine import combine_engine, split_engine
+from pygfssss.rng import random_bytes
+
+MAGIC = b"GFSI"
+VERSION = 1
+KEY_SIZE = 32
+DIGEST_SIZE = 16
+HEADER_SIZE = len(MAGIC) + 1 + 1 + 4 + KEY_SIZE
+
+
+class IntegrityError(Exception):
+    """Raised when a chunk of the secret doesn't match its digest with any subset of the shares."""
+
+
+def chunk_digest(key, index, last, data):
+    """Return the digest of chunk number 'index' of the secret, 'last' if it is the final chunk."""
+    digest = hashlib.blake2b(key=key, digest_size=DIGEST_SIZE)
+    digest.update(index.to_bytes(8, "big") + bytes([last]))
+    digest.update(data)
+    return digest.digest()
+
+
+def iter_last(blocks):
+    """Yield a (block, last) pair per block of 'blocks', or a single empty last block if there are none."""
+    iterator = iter(blocks)
+    current = next(iterator, b"")
+    for block in iterator:
+        yield current, False
+        current = block
+    yield current, True
+
+
+def split(secret_stream, share_streams, shares_count, shares_threshold, x_values=None,
+          chunk_size=DEFAULT_CHUNK_SIZE, backend=None, random_source=None, field=None):
+    """
+    Split bytes from 'secret_stream' into 'shares_count' share streams with per chunk digests,
+    with a combine threshold of "shares_threshold".
+    Arguments are the same as core.split(), the digests are computed per 'chunk_size' bytes.
+    """
+    if len(share_streams) != shares_count:
+        raise Exception(f'Amount of streams {len(share_streams)} must be identical to shares count {shares_count}')
+    check_chunk_size(chunk_size)
+    if chunk_size >= 2 ** 32:
+        raise Exception(f'Chunk size {chunk_size} must be below 4GB')
+
+    headers = [b""] * shares_count
+    if x_values is None:
+        x_values = pick_random_x_values(shares_count, random_source)
+        headers = [bytes([x]) for x in x_values]
+    elif len(x_values) != shares_count:
+        raise Exception(f'Amount of X values {len(x_values)} must be identical to shares count {shares_count}')
+
+    engine = split_engine(x_values, shares_threshold, backend, field)
+
+    key = random_bytes(random_source, KEY_SIZE)
+    key_shares = split_block(engine, key, shares_threshold, random_source)
+
+    for i in range(0, shares_count):
+        share_streams[i].write(headers[i] + MAGIC + bytes([VERSION, shares_threshold]) +
+                               chunk_size.to_bytes(4, "big") + key_shares[i])
+
+    for index, (chunk, last) in enumerate(iter_last(iter_blocks(secret_stream, chunk_size))):
+        digest = chunk_digest(key, index, last, chunk)
+
+        if len(chunk) > 0:
+            shares = split_block(engine, chunk, shares_threshold, random_source)
+        else:
+            shares = [b""] * shares_count
+
+        for i in range(0, shares_count):
+            share_streams[i].write(shares[i] + digest)
+
+
+def read_headers(share_streams, x_values):
+    """
+    Read the headers of 'share_streams', and the X values if 'x_values' is None.
+    Return (x_values, threshold, chunk_size, key_shares, indices), where 'indices' are the
+    indices of the shares whose header agrees with the majority of the shares.
+    """
+    if x_values is None:
+        # Read X values
+        x_values = []
+        for i in range(0, len(share_streams)):
+            data = share_streams[i].read(1)
+            if len(data) == 0:
+                raise Exception(f'Unexpected EOF while reading X of share {i}')
+            x_values.append(data[0])
+    elif len(x_values) != len(share_streams):
+        raise Exception(f'Amount of X values {len(x_values)} must be identical to amount of shares '
+                        f'{len(share_streams)}')
+
+    parameters = []
+    key_shares = []
+    for i in range(0, len(share_streams)):
+        header = read_block(share_streams[i], HEADER_SIZE)
+        if len(header) < HEADER_SIZE or header[:len(MAGIC)] != MAGIC or header[len(MAGIC)] != VERSION or \
+                header[len(MAGIC) + 1] == 0:
+            parameters.append(None)
+        else:
+            parameters.append((header[len(MAGIC) + 1], int.from_bytes(header[len(MAGIC) + 2:len(MAGIC) + 6], "big")))
+        key_shares.append(header[-KEY_SIZE:])
+
+    counts = collections.Counter(p for p in parameters if p is not None)
+    if len(counts) == 0:
+        raise Exception('No share has a valid integrity header')
+
+    (threshold, chunk_size), _ = counts.most_common(1)[0]
+    indices = [i for i in range(0, len(share_streams)) if parameters[i] == (threshold, chunk_size)]
+
+    if len(indices) < threshold:
+        raise Exception(f'Only {len(indices)} shares have consistent integrity headers, threshold is {threshold}')
+    check_chunk_size(chunk_size)
+
+    return x_values, threshold, chunk_size, key_shares, indices
+
+
+def combine(share_streams, secret_stream, x_values=None, backend=None, field=None):
+    """
+    Combine shares with per chunk digests from 'share_streams' into 'secret_stream'.
+    If 'x_values' is provided from the outside, they aren't read from the shares.
+    Every chunk is verified before it is written. If a chunk doesn't match its digest, it is
+    combined again from other subsets of threshold shares, and if none matches IntegrityError
+    is raised - 'secret_stream' then holds the verified chunks preceding it.
+    """
+    if len(share_streams) == 0:
+        raise Exception('At least one share is required')
+
+    x_values, threshold, chunk_size, key_shares, indices = read_headers(share_streams, x_values)
+
+    readers = [iter_last(iter_blocks(share_streams[i], chunk_size + DIGEST_SIZE)) for i in indices]
+
+    # Engine and digest key per subset (of positions in 'indices') of threshold shares
+    subset_keys = {}
+
+    def subset_key(subset):
+        if subset not in subset_keys:
+            engine = combine_engine([x_values[indices[j]] for j in subset], backend, field)
+            key = engine.combine_chunk([key_shares[indices[j]] for j in subset])
+            subset_keys[subset] = (engine, key)
+        return subset_keys[subset]
+
+    def verify(subset, index, records):
+        """Return the secret chunk combined from 'subset' if it matches its digest, None otherwise."""
+        members = [records[j] for j in subset]
+        if any(member is None or len(member[0]) < DIGEST_SIZE for member in members):
+            return None
+        length, last = len(members[0][0]), members[0][1]
+        if any(len(member[0]) != length or member[1] != last for member in members):
+            return None
+
+        engine, key = subset_key(subset)
+        data = engine.combine_chunk([member[0][:-DIGEST_SIZE] for member in members])
+        digest = chunk_digest(key, index, last, data)
+
+        # A corrupted copy of the digest in some of the shares doesn't matter
+        if any(hmac.compare_digest(digest, member[0][-DIGEST_SIZE:]) for member in members):
+            return data
+        return None
+
+    subset = tuple(range(0, threshold))
+    index = 0
+    while True:
+        records = [next(reader, None) for reader in readers]
+
+        data = verify(subset, index, records)
+        if data is None:
+            # Retry with the other subsets, the first one that matches is kept for the next chunks
+            for candidate in itertools.combinations(range(0, len(indices)), threshold):
+                if candidate != subset:
+                    data = verify(candidate, index, records)
+                    if data is not None:
+                        subset = candidate
+                        break
+
+        if data is None:
+            raise IntegrityError(f'Chunk {index} (offset {index * chunk_size}) doesn\'t match its digest with any '
+                                 f'{threshold} of the {len(indices)} shares')
+
+        secret_stream.write(data)
+
+        if records[subset[0]][1]:
+            break
+        index += 1
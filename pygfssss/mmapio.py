@@ -0,0 +1,174 @@
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+#
+# Memory-mapped split and combine of files.
+# The secret and the preallocated shares (or the shares and the preallocated secret)
+# are mapped, and the engines run directly on memoryviews of the maps, without
+# going through the stream API and its intermediate buffers.
+# Shares are gfshare style - X values aren't written to the shares.
+#
+
+import contextlib
+import mmap
+import os
+
+from pygfssss.core import split_block
+from pygfssss.engine import combine_engine, split_engine
+from pygfssss.stats import stage
+
+
+def map_file(f, writable):
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+
+
+def release(objects):
+    """
+    Release the memoryviews and close the maps of 'objects'. On errors, some may still be exported (e.g. to
+    arrays referenced by the traceback) - those are left to the garbage collector, so the original error is raised.
+    """
+    for obj in objects:
+        with contextlib.suppress(BufferError):
+            if isinstance(obj, memoryview):
+                obj.release()
+            else:
+                obj.close()
+
+
+def preallocate(path, length):
+    with open(path, "wb") as f:
+        f.truncate(length)
+
+
+def prepare_split(secret_path, share_paths, shares_threshold, x_values, backend, field):
+    """Validate the split parameters and preallocate the shares. Return the secret length."""
+    if len(share_paths) != len(x_values):
+        raise Exception(f'Amount of share files {len(share_paths)} must be identical to '
+                        f'amount of X values {len(x_values)}')
+
+    split_engine(x_values, shares_threshold, backend, field)
+
+    length = os.path.getsize(secret_path)
+    for path in share_paths:
+        preallocate(path, length)
+
+    return length
+
+
+def prepare_combine(share_paths, secret_path, x_values, backend, field):
+    """Validate the combine parameters and preallocate the secret. Return the secret length."""
+    if len(share_paths) == 0:
+        raise Exception('At least one share is required')
+    if len(share_paths) != len(x_values):
+        raise Exception(f'Amount of share files {len(share_paths)} must be identical to '
+                        f'amount of X values {len(x_values)}')
+
+    combine_engine(x_values, backend, field)
+
+    # The first share determines the secret length
+    length = os.path.getsize(share_paths[0])
+    for i in range(1, len(share_paths)):
+        if os.path.getsize(share_paths[i]) < length:
+            raise Exception(f'Unexpected EOF while reading share {i}')
+
+    preallocate(secret_path, length)
+
+    return length
+
+
+def split_range(secret_path, share_paths, shares_threshold, x_values, chunk_size, backend, field, start, end,
+                stats=None):
+    """
+    Split bytes [start,end) of 'secret_path' into the same range of every (preallocated) share file.
+    If 'stats' is provided, the stages are recorded in it (reading is part of the other stages, through the map).
+    """
+    engine = split_engine(x_values, shares_threshold, backend, field)
+
+    with open(secret_path, "rb") as secret_file:
+        secret_map = map_file(secret_file, False)
+        secret_view = memoryview(secret_map)
+        share_files = [open(path, "r+b") for path in share_paths]
+        share_maps = [map_file(f, True) for f in share_files]
+        try:
+            for pos in range(start, end, chunk_size):
+                data = secret_view[pos:min(pos + chunk_size, end)]
+                try:
+                    length = len(data)
+                    shares = split_block(engine, data, shares_threshold, None, stats)
+                finally:
+                    release([data])
+
+                with stage(stats, "write", length * len(share_maps)):
+                    for share_map, share in zip(share_maps, shares):
+                        share_map[pos:pos + length] = share
+                if stats is not None:
+                    stats.chunk(length)
+        finally:
+            # Maps can't be closed while views of them exist
+            release([secret_view, secret_map] + share_maps)
+            for f in share_files:
+                f.close()
+
+
+def combine_range(share_paths, secret_path, x_values, chunk_size, backend, field, start, end, stats=None):
+    """
+    Combine bytes [start,end) of every share file into the same range of the (preallocated) 'secret_path'.
+    If 'stats' is provided, the stages are recorded in it (reading is part of the other stages, through the map).
+    """
+    engine = combine_engine(x_values, backend, field)
+
+    with open(secret_path, "r+b") as secret_file, map_file(secret_file, True) as secret_map:
+        share_files = [open(path, "rb") for path in share_paths]
+        share_maps = [map_file(f, False) for f in share_files]
+        share_views = [memoryview(share_map) for share_map in share_maps]
+        try:
+            for pos in range(start, end, chunk_size):
+                blocks = [share_view[pos:min(pos + chunk_size, end)] for share_view in share_views]
+                try:
+                    length = len(blocks[0])
+                    with stage(stats, "compute", length):
+                        secret = engine.combine_chunk(blocks)
+                    with stage(stats, "write", length):
+                        secret_map[pos:pos + length] = secret
+                finally:
+                    release(blocks)
+                if stats is not None:
+                    stats.chunk(length)
+        finally:
+            # Maps can't be closed while views of them exist
+            release(share_views + share_maps)
+            for f in share_files:
+                f.close()
+
+
+def split_file(secret_path, share_paths, shares_threshold, x_values, chunk_size, backend=None, field=None,
+               stats=None):
+    """Split file 'secret_path' into files 'share_paths' (one per X value) through mmap."""
+    length = prepare_split(secret_path, share_paths, shares_threshold, x_values, backend, field)
+
+    # Empty files can't be mapped
+    if length > 0:
+        split_range(secret_path, share_paths, shares_threshold, x_values, chunk_size, backend, field, 0, length,
+                    stats)
+
+
+def combine_file(share_paths, secret_path, x_values, chunk_size, backend=None, field=None, stats=None):
+    """Combine files 'share_paths' (one per X value) into file 'secret_path' through mmap."""
+    length = prepare_combine(share_paths, secret_path, x_values, backend, field)
+
+    # Empty files can't be mapped
+    if length > 0:
+        combine_range(share_paths, secret_path, x_values, chunk_size, backend, field, 0, length, stats)
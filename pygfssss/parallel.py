@@ -0,0 +1,74 @@
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+#
+# Multi-process split and combine of files.
+# Every secret byte only depends on the same offset of every share (given the X values),
+# so the files are partitioned into byte ranges processed by a pool of processes.
+# Workers get file paths and offsets only, and access the data through mmap
+# (see mmapio) - no buffers are ever pickled between processes.
+#
+
+from concurrent.futures import ProcessPoolExecutor
+
+from pygfssss.mmapio import combine_range, prepare_combine, prepare_split, split_range
+
+
+def partition(length, jobs, chunk_size):
+    """
+    Partition [0,length) into (start, end) ranges for 'jobs' workers.
+    Ranges are multiples of 'chunk_size', a few per worker to balance the load.
+    """
+    range_size = -(-length // (jobs * 4))
+    range_size = max(chunk_size, -(-range_size // chunk_size) * chunk_size)
+
+    return [(start, min(start + range_size, length)) for start in range(0, length, range_size)]
+
+
+def run_ranges(jobs, ranges, function, *args, stats=None):
+    """
+    Call function(*args, start, end) for every range in a pool of 'jobs' processes.
+    If 'stats' is provided, every range is recorded in it as a chunk once done (stages aren't).
+    """
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(function, *args, start, end) for start, end in ranges]
+        # Propagate the first worker exception, if any
+        for future, (start, end) in zip(futures, ranges):
+            future.result()
+            if stats is not None:
+                stats.chunk(end - start)
+
+
+def split_file(secret_path, share_paths, shares_threshold, x_values, jobs, chunk_size, backend=None, field=None,
+               stats=None):
+    """
+    Split file 'secret_path' into files 'share_paths' (one per X value) using 'jobs' processes.
+    X values aren't written to the shares.
+    """
+    length = prepare_split(secret_path, share_paths, shares_threshold, x_values, backend, field)
+
+    run_ranges(jobs, partition(length, jobs, chunk_size), split_range,
+               secret_path, share_paths, shares_threshold, x_values, chunk_size, backend, field, stats=stats)
+
+
+def combine_file(share_paths, secret_path, x_values, jobs, chunk_size, backend=None, field=None, stats=None):
+    """
+    Combine files 'share_paths' (one per X value) into file 'secret_path' using 'jobs' processes.
+    """
+    length = prepare_combine(share_paths, secret_path, x_values, backend, field)
+
+    run_ranges(jobs, partition(length, jobs, chunk_size), combine_range,
+               share_paths, secret_path, x_values, chunk_size, backend, field, stats=stats)
@@ -0,0 +1,177 @@
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+#
+# Pipelined split and combine of streams.
+# Reading, computing and writing run concurrently - reader threads feed bounded queues
+# of chunks to the computing (calling) thread, which feeds bounded queues of chunks to
+# a writer thread per output stream. Throughput is then bound by the slowest stage,
+# instead of by the sum of all of them.
+#
+
+import os
+import queue
+import threading
+
+from pygfssss.core import DEFAULT_CHUNK_SIZE, check_chunk_size, iter_blocks, iter_combine, iter_split
+
+# Default amount of chunks queued between stages, per stream
+DEFAULT_QUEUE_SIZE = 4
+
+# Marks the end of the chunks of a queue
+END = None
+
+
+def put(chunks, item, stop):
+    """Put 'item' in queue 'chunks', unless 'stop' is set first. Return whether 'item' was put."""
+    while not stop.is_set():
+        try:
+            chunks.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def get(chunks, stop):
+    """Return the next item of queue 'chunks', or END if 'stop' is set first."""
+    while not stop.is_set():
+        try:
+            return chunks.get(timeout=0.1)
+        except queue.Empty:
+            pass
+    return END
+
+
+def read_stage(blocks, chunks, stop):
+    """Put the blocks of iterable 'blocks' in queue 'chunks', followed by END (or by an exception raised)."""
+    try:
+        for block in blocks:
+            if not put(chunks, block, stop):
+                return
+        put(chunks, END, stop)
+    except Exception as e:
+        put(chunks, e, stop)
+
+
+def iter_queue(chunks, stop):
+    """Yield the chunks of queue 'chunks' up to END, raising exceptions put in it."""
+    while True:
+        item = get(chunks, stop)
+        if item is END:
+            return
+        if isinstance(item, Exception):
+            raise item
+        yield item
+
+
+def write_stage(stream, chunks, stop, errors, fsync):
+    """Write the chunks of queue 'chunks' to 'stream' up to END, then fsync it if 'fsync' is set."""
+    try:
+        while True:
+            item = get(chunks, stop)
+            if item is END:
+                break
+            stream.write(item)
+
+        if fsync and not stop.is_set():
+            stream.flush()
+            os.fsync(stream.fileno())
+    except Exception as e:
+        errors.append(e)
+        stop.set()
+
+
+def run(readers, compute, output_streams, queue_size, fsync):
+    """
+    Run reader threads for iterables of blocks 'readers', calling 'compute' with an iterable of
+    chunks per reader and writing the tuples of chunks it yields (one per output stream) by a
+    writer thread per output stream.
+    """
+    stop = threading.Event()
+    errors = []
+
+    input_queues = [queue.Queue(queue_size) for _ in readers]
+    output_queues = [queue.Queue(queue_size) for _ in output_streams]
+
+    reader_threads = [threading.Thread(target=read_stage, args=(blocks, chunks, stop), daemon=True)
+                      for blocks, chunks in zip(readers, input_queues)]
+    writer_threads = [threading.Thread(target=write_stage, args=(stream, chunks, stop, errors, fsync), daemon=True)
+                      for stream, chunks in zip(output_streams, output_queues)]
+    for thread in reader_threads + writer_threads:
+        thread.start()
+
+    try:
+        for outputs in compute([iter_queue(chunks, stop) for chunks in input_queues]):
+            for chunks, output in zip(output_queues, outputs):
+                put(chunks, output, stop)
+            if stop.is_set():
+                break
+
+        # Let the writers drain their queues
+        for chunks in output_queues:
+            put(chunks, END, stop)
+        for thread in writer_threads:
+            thread.join()
+    except Exception:
+        # A failed writer stops the other stages, its error is the one to report
+        if len(errors) == 0:
+            raise
+    finally:
+        # Readers may still be blocked on unused chunks (or on an error)
+        stop.set()
+        for thread in reader_threads + writer_threads:
+            thread.join()
+
+    if len(errors) > 0:
+        raise errors[0]
+
+
+def split(secret_stream, share_streams, shares_count, shares_threshold, x_values=None,
+          chunk_size=DEFAULT_CHUNK_SIZE, backend=None, random_source=None, field=None,
+          queue_size=DEFAULT_QUEUE_SIZE, fsync=False):
+    """
+    Split bytes from 'secret_stream' into 'shares_count' share streams like core.split(), with a
+    reader thread, the calling thread computing the shares, and a writer thread per share.
+    Up to 'queue_size' chunks are queued between stages, per stream.
+    If 'fsync' is set, the share streams (files) are flushed and synced to disk at the end.
+    """
+    if len(share_streams) != shares_count:
+        raise Exception(f'Amount of streams {len(share_streams)} must be identical to shares count {shares_count}')
+    check_chunk_size(chunk_size)
+
+    def compute(chunk_iters):
+        return iter_split(chunk_iters[0], shares_count, shares_threshold, x_values, backend, random_source, field)
+
+    run([iter_blocks(secret_stream, chunk_size)], compute, share_streams, queue_size, fsync)
+
+
+def combine(share_streams, secret_stream, x_values=None, chunk_size=DEFAULT_CHUNK_SIZE, backend=None, field=None,
+            queue_size=DEFAULT_QUEUE_SIZE, fsync=False):
+    """
+    Combine shares from 'share_streams' into 'secret_stream' like core.combine(), with a reader
+    thread per share, the calling thread combining them, and a writer thread.
+    Up to 'queue_size' chunks are queued between stages, per stream.
+    If 'fsync' is set, 'secret_stream' (a file) is flushed and synced to disk at the end.
+    """
+    if len(share_streams) == 0:
+        raise Exception('At least one share is required')
+    check_chunk_size(chunk_size)
+
+    def compute(chunk_iters):
+        return ((chunk,) for chunk in iter_combine(chunk_iters, x_values, backend, field))
+
+    run([iter_blocks(stream, chunk_size) for stream in share_streams], compute, [secret_stream], queue_size, fsync)
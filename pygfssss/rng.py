@@ -0,0 +1,78 @@
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+#
+# A randomness source is any callable taking a byte count 'n' and returning
+# 'n' random bytes. The default source is os.urandom (as secrets.token_bytes, without importing secrets).
+#
+
+import os
+
+
+def system_random_bytes(n):
+    """Return 'n' bytes from the operating system CSPRNG."""
+    return os.urandom(n)
+
+
+def random_bytes(random_source, n):
+    """Return 'n' bytes from 'random_source' (the system CSPRNG if None), checking their amount."""
+    if random_source is None:
+        random_source = system_random_bytes
+
+    data = random_source(n)
+    if len(data) != n:
+        raise Exception(f'Randomness source returned {len(data)} bytes instead of {n}')
+
+    return data
+
+
+def random_below(random_source, bound):
+    """Return a uniformly distributed integer in the range [0,bound), with bound >= 1."""
+    # Single bytes for bounds up to 256, as many bytes as needed otherwise
+    size = max(1, ((bound - 1).bit_length() + 7) // 8)
+    span = 256 ** size
+
+    # Reject values above the largest multiple of 'bound' to avoid modulo bias
+    limit = span - span % bound
+    while True:
+        value = int.from_bytes(random_bytes(random_source, size), "big")
+        if value < limit:
+            return value % bound
+
+
+class ShakeDRBG:
+    """Deterministic randomness source based on SHAKE-256.
+   Every call returns the SHAKE-256 output for the seed and a call counter, so the
+   same seed always gives the same sequence of calls the same bytes.
+   Intended for reproducible benchmarks and tests only, never for real secrets."""
+
+    def __init__(self, seed):
+        if isinstance(seed, str):
+            seed = seed.encode("utf-8")
+
+        self.__seed = bytes(seed)
+        self.__counter = 0
+
+    def __call__(self, n):
+        # Only imported when used, most commands don't need hashlib
+        import hashlib
+
+        shake = hashlib.shake_256()
+        shake.update(self.__counter.to_bytes(8, "big"))
+        shake.update(self.__seed)
+        self.__counter += 1
+
+        return shake.digest(n)
@@ -0,0 +1,138 @@
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+#
+# Instrumentation of split and combine.
+# A Stats object passed to split or combine accumulates the time spent and the bytes
+# processed by every stage - "read" (secret or shares), "random" (coefficients),
+# "compute" (field arithmetic) and "write" (shares or secret) - and counts the chunks.
+#
+
+import contextlib
+import sys
+import time
+
+STAGES = ("read", "random", "compute", "write")
+
+
+class Stats:
+    """Per stage timers, byte counters and chunk count of a split or combine.
+   'callback', if provided, is called with the Stats object after every chunk."""
+
+    def __init__(self, callback=None):
+        self.__callback = callback
+        self.__start = time.perf_counter()
+        self.__seconds = dict.fromkeys(STAGES, 0.0)
+        self.__bytes = dict.fromkeys(STAGES, 0)
+        self.__chunks = 0
+        self.__secret_bytes = 0
+
+    @contextlib.contextmanager
+    def stage(self, name, count=0):
+        """Context manager timing stage 'name', which processes 'count' bytes."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.__seconds[name] = self.__seconds.get(name, 0.0) + time.perf_counter() - start
+            self.__bytes[name] = self.__bytes.get(name, 0) + count
+
+    def count(self, name, count):
+        """Add 'count' bytes processed by stage 'name'."""
+        self.__bytes[name] = self.__bytes.get(name, 0) + count
+
+    def chunk(self, count):
+        """Record a chunk of 'count' secret bytes as done."""
+        self.__chunks += 1
+        self.__secret_bytes += count
+        if self.__callback is not None:
+            self.__callback(self)
+
+    def seconds(self, name):
+        return self.__seconds.get(name, 0.0)
+
+    def bytes(self, name):
+        return self.__bytes.get(name, 0)
+
+    def stages(self):
+        return list(self.__seconds)
+
+    def chunks(self):
+        return self.__chunks
+
+    def secret_bytes(self):
+        """Return the amount of secret bytes split or combined so far."""
+        return self.__secret_bytes
+
+    def elapsed(self):
+        """Return the seconds elapsed since the creation of the Stats object."""
+        return time.perf_counter() - self.__start
+
+    def throughput(self):
+        """Return the secret bytes per second so far."""
+        elapsed = self.elapsed()
+        return self.__secret_bytes / elapsed if elapsed > 0 else 0.0
+
+    def report(self):
+        """Return a human readable summary of the throughput and of the stages."""
+        elapsed = self.elapsed()
+        lines = [f'{self.__secret_bytes} bytes in {self.__chunks} chunks, {elapsed:.3f}s, '
+                 f'{self.throughput() / 1e6:.2f} MB/s']
+
+        for name in self.stages():
+            share = 100 * self.seconds(name) / elapsed if elapsed > 0 else 0.0
+            lines.append(f'  {name:8} {self.seconds(name):8.3f}s {share:5.1f}% {self.bytes(name):14} bytes')
+
+        return "\n".join(lines)
+
+
+def stage(stats, name, count=0):
+    """Return stats.stage(name, count), or a context manager doing nothing if 'stats' is None."""
+    return stats.stage(name, count) if stats is not None else contextlib.nullcontext()
+
+
+def progress_printer(total=None, stream=None):
+    """
+    Return a Stats callback printing the progress to 'stream' (by default stderr),
+    as a percentage of 'total' secret bytes if it is known.
+    """
+    def callback(stats):
+        done = stats.secret_bytes()
+        text = f'{done} bytes'
+        if total:
+            text += f' ({100 * done / total:.1f}%)'
+        print(f'\r{text}, {stats.throughput() / 1e6:.2f} MB/s', end="", file=stream or sys.stderr, flush=True)
+
+    return callback
+
+
+@contextlib.contextmanager
+def profile(path=None):
+    """Context manager profiling its body with cProfile, and dumping the results to 'path' (if not None)."""
+    if path is None:
+        yield
+        return
+
+    # Only imported when profiling
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+import pickle
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from pygfssss import core, tables
+from pygfssss.GF256Field import GF256Field, RIJNDAEL_PRIME_POLY
+from pygfssss.GF256elt import GF256elt
+
+
+class TestGF256Field(unittest.TestCase):
+
+    def test_mul_table(self):
+        mul = GF256Field.get().mul_table()
+        for a in range(256):
+            for b in range(256):
+                self.assertEqual(mul[a][b], int(GF256elt(a) * GF256elt(b)))
+
+    def test_precomputed_tables(self):
+        exptable, logtable, invtable, multable = tables.compute_tables(tables.PRIME_POLY, tables.GENERATOR)
+        self.assertEqual(tables.EXPTABLE, exptable)
+        self.assertEqual(tables.LOGTABLE, logtable)
+        self.assertEqual(tables.INVTABLE, invtable)
+        self.assertEqual(tables.MULTABLE, multable)
+
+        field = GF256Field.get()
+        self.assertEqual(field.generator(), tables.GENERATOR)
+        self.assertEqual(field.exptable(), list(exptable))
+        self.assertEqual(field.logtable(), list(logtable))
+        self.assertEqual(field.inv_table(), invtable)
+        self.assertEqual(b"".join(field.mul_table()), multable)
+        self.assertEqual(b"".join(GF256elt.mul_table()), multable)
+
+        # Tables computed by the field for the same prime polynomial with another generator
+        other = GF256Field(tables.PRIME_POLY, 0x04)
+        self.assertEqual(b"".join(other.mul_table()), multable)
+        self.assertEqual(other.inv_table(), invtable)
+
+    def test_inv_table(self):
+        for field in [GF256Field.get(), GF256Field.get(RIJNDAEL_PRIME_POLY)]:
+            for a in range(1, 256):
+                self.assertEqual(field.mul(a, field.inv(a)), 1)
+                self.assertEqual(field.div(field.mul(a, 0x35), a), 0x35)
+
+    def test_rijndael(self):
+        field = GF256Field.get(RIJNDAEL_PRIME_POLY)
+        self.assertEqual(field.generator(), 0x03)
+        # From FIPS-197 section 4.2
+        self.assertEqual(field.mul(0x57, 0x83), 0xc1)
+        self.assertEqual(field.mul(0x57, 0x13), 0xfe)
+
+    def test_get_cached(self):
+        self.assertIs(GF256Field.get(), GF256Field.get(0x11d))
+        self.assertIsNot(GF256Field.get(), GF256Field.get(RIJNDAEL_PRIME_POLY))
+        self.assertIs(pickle.loads(pickle.dumps(GF256Field.get(RIJNDAEL_PRIME_POLY))),
+                      GF256Field.get(RIJNDAEL_PRIME_POLY))
+
+    def test_invalid(self):
+        with self.assertRaises(Exception):
+            GF256Field(0x11)
+        with self.assertRaisesRegex(Exception, "not irreducible"):
+            # x^8 + 1 = (x + 1)^8
+            GF256Field(0x101)
+        with self.assertRaisesRegex(Exception, "not a generator"):
+            GF256Field(RIJNDAEL_PRIME_POLY, 0x02)
+
+    def test_fields_side_by_side(self):
+        secret = b"Two fields, one process." * 50
+        fields = [GF256Field.get(), GF256Field.get(RIJNDAEL_PRIME_POLY)]
+
+        def split_combine(field):
+            shares = [BytesIO() for _ in range(4)]
+            core.split(BytesIO(secret), shares, 4, 3, x_values=[1, 2, 3, 4], chunk_size=100, field=field)
+            output_secret = BytesIO()
+            core.combine([BytesIO(share.getvalue()) for share in shares[1:]], output_secret, [2, 3, 4],
+                         chunk_size=100, field=field)
+            return [share.getvalue() for share in shares], output_secret.getvalue()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(split_combine, fields * 4))
+
+        for shares, output_secret in results:
+            self.assertEqual(output_secret, secret)
+
+        # Shares of the same secret depend on the field, so combining in the wrong field fails
+        shares, _ = results[1]
+        output_secret = BytesIO()
+        core.combine([BytesIO(share) for share in shares[1:]], output_secret, [2, 3, 4])
+        self.assertNotEqual(output_secret.getvalue(), secret)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+import copy
+import pickle
+import unittest
+
+from pygfssss.GF256elt import GF256Array, GF256elt, numpy
+
+
+class TestGF256elt(unittest.TestCase):
+
+    def test_interned(self):
+        self.assertIs(GF256elt(7), GF256elt(7))
+        self.assertIs(GF256elt(263), GF256elt(7))
+        self.assertIs(GF256elt(3) + GF256elt(5), GF256elt(6))
+        self.assertIs(copy.copy(GF256elt(9)), GF256elt(9))
+        self.assertIs(pickle.loads(pickle.dumps(GF256elt(200))), GF256elt(200))
+
+        with self.assertRaises(AttributeError):
+            GF256elt(1).value = 2
+
+    def test_hash(self):
+        self.assertEqual(len({GF256elt(1), GF256elt(1), GF256elt(2)}), 2)
+        self.assertNotEqual(GF256elt(1), 1)
+
+    def test_arithmetic(self):
+        for a in range(256):
+            self.assertEqual(GF256elt(a) + GF256elt(a), GF256elt(0))
+            self.assertEqual(GF256elt(a) * GF256elt(1), GF256elt(a))
+            self.assertEqual(GF256elt(a) * GF256elt(0), GF256elt(0))
+            if a != 0:
+                self.assertEqual(GF256elt(a) / GF256elt(a), GF256elt(1))
+                self.assertEqual(GF256elt(a) * GF256elt(0x53) / GF256elt(a), GF256elt(0x53))
+
+        # 0x80 * 2 overflows and is reduced with the 0x11d prime polynomial
+        self.assertEqual(GF256elt(0x80) * GF256elt(2), GF256elt(0x1d))
+
+    def test_invalid_operands(self):
+        with self.assertRaises(Exception):
+            _ = GF256elt(1) + 1
+        with self.assertRaises(Exception):
+            _ = GF256elt(1) * 1
+        with self.assertRaises(Exception):
+            _ = GF256elt(1) / GF256elt(0)
+
+    def test_subclass(self):
+        class Elt(GF256elt):
+            __slots__ = ()
+
+        self.assertIsInstance(Elt(5), Elt)
+        self.assertEqual(Elt(5) * GF256elt(1), GF256elt(5))
+
+
+@unittest.skipIf(numpy is None, "NumPy is not available")
+class TestGF256Array(unittest.TestCase):
+
+    def setUp(self):
+        # All pairs of elements
+        self.a = GF256Array([a for a in range(256) for _ in range(256)])
+        self.b = GF256Array([b for _ in range(256) for b in range(256)])
+
+    def test_add_sub(self):
+        self.assertEqual((self.a + self.b).tobytes(),
+                         bytes([int(GF256elt(a) + GF256elt(b)) for a in range(256) for b in range(256)]))
+        self.assertEqual(self.a - self.b, self.a + self.b)
+
+    def test_mul(self):
+        self.assertEqual((self.a * self.b).tobytes(),
+                         bytes([int(GF256elt(a) * GF256elt(b)) for a in range(256) for b in range(256)]))
+
+    def test_mul_scalar(self):
+        for b in [0, 1, 2, 0x53, 0xff]:
+            self.assertEqual((self.a * GF256elt(b)).tobytes(),
+                             bytes([int(GF256elt(a) * GF256elt(b)) for a in range(256) for _ in range(256)]))
+
+    def test_mul_scalar_views(self):
+        # Arrays of bytes are translated in place, other arrays and views are copied first
+        data = bytes(range(256))
+        expected = bytes([int(GF256elt(a) * GF256elt(0x53)) for a in range(256)])
+        self.assertEqual((GF256Array(data) * GF256elt(0x53)).tobytes(), expected)
+        self.assertEqual((GF256Array(data)[::-1] * GF256elt(0x53)).tobytes(), expected[::-1])
+        self.assertEqual((GF256Array(data)[16:] * GF256elt(0x53)).tobytes(), expected[16:])
+
+    def test_iadd(self):
+        a = GF256Array(bytearray(self.a.tobytes()))
+        a += self.b
+        self.assertEqual(a, self.a + self.b)
+
+    def test_div(self):
+        a = GF256Array([a for a in range(256) for _ in range(1, 256)])
+        b = GF256Array([b for _ in range(256) for b in range(1, 256)])
+        self.assertEqual(a * b / b, a)
+        self.assertEqual((a / b).tobytes(),
+                         bytes([int(GF256elt(a) / GF256elt(b)) for a in range(256) for b in range(1, 256)]))
+
+        with self.assertRaises(Exception):
+            _ = self.a / self.b
+
+    def test_pow(self):
+        a = GF256Array(range(256))
+        self.assertEqual(a ** 0, GF256Array([1] * 256))
+        self.assertEqual(a ** 1, a)
+        self.assertEqual(a ** 3, a * a * a)
+        self.assertEqual(a ** 300, (a ** 255) * (a ** 45))
+
+    def test_getitem(self):
+        a = GF256Array(b"\x00\x07\xff")
+        self.assertEqual(len(a), 3)
+        self.assertEqual(a[1], GF256elt(7))
+        self.assertEqual(a[1:].tobytes(), b"\x07\xff")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+import random
+import unittest
+
+from pygfssss.GF256elt import GF256elt
+from pygfssss.PGF256 import PGF256
+from pygfssss.PGF256Interpolator import PGF256Interpolator
+
+
+def elts(values):
+    return [GF256elt(v) for v in values]
+
+
+class TestPGF256(unittest.TestCase):
+
+    def setUp(self):
+        rnd = random.Random("TestPGF256")
+        self.a = PGF256(elts([rnd.randint(0, 255) for _ in range(5)]))
+        self.b = PGF256(elts([rnd.randint(0, 255) for _ in range(3)]))
+
+    def test_coeffs(self):
+        p = PGF256(elts([1, 0, 7]))
+        self.assertEqual(p.deg(), 2)
+        self.assertEqual(p.coeffs(), elts([1, 0, 7]))
+        self.assertEqual(p.coeff(2), GF256elt(7))
+        self.assertEqual(p.coeff(3), GF256elt(0))
+        self.assertEqual(p.to_bytes(), b"\x01\x00\x07")
+        self.assertEqual(PGF256.from_bytes(b"\x01\x00\x07").coeffs(), p.coeffs())
+        self.assertEqual(repr(p), "7*x^2 + 1")
+
+        with self.assertRaises(Exception):
+            PGF256([1, 2])
+
+    def test_add_sub(self):
+        expected = [self.a.coeff(i) + self.b.coeff(i) for i in range(5)]
+        self.assertEqual((self.a + self.b).coeffs(), expected)
+        self.assertEqual((self.b + self.a).coeffs(), expected)
+        self.assertEqual((self.a - self.b).coeffs(), expected)
+
+        self.assertEqual((self.a + GF256elt(3)).coeffs(), [self.a.coeff(0) + GF256elt(3)] + self.a.coeffs()[1:])
+
+    def test_mul(self):
+        expected = [GF256elt(0)] * 7
+        for i in range(5):
+            for j in range(3):
+                expected[i + j] += self.a.coeff(i) * self.b.coeff(j)
+        self.assertEqual((self.a * self.b).coeffs(), expected)
+        self.assertEqual((self.b * self.a).coeffs(), expected)
+
+        self.assertEqual((self.a * GF256elt(9)).coeffs(), [c * GF256elt(9) for c in self.a.coeffs()])
+
+    def test_f(self):
+        for x in range(256):
+            expected = GF256elt(0)
+            power = GF256elt(1)
+            for c in self.a.coeffs():
+                expected += c * power
+                power *= GF256elt(x)
+            self.assertEqual(self.a.f(GF256elt(x)), expected)
+
+    def test_interpolate(self):
+        for k in [1, 2, 3, 6]:
+            points = [(GF256elt(x), GF256elt(x * 7 + 3)) for x in range(1, k + 1)]
+            p = PGF256Interpolator().interpolate(points)
+            self.assertEqual(p.deg(), k - 1)
+            for x, y in points:
+                self.assertEqual(p.f(x), y)
+
+    def test_interpolate_at(self):
+        interpolator = PGF256Interpolator()
+        points = [(GF256elt(x), GF256elt(x * 11 + 5)) for x in [3, 30, 130, 230]]
+        p = interpolator.interpolate(points)
+        weights = PGF256Interpolator.barycentric_weights([x for x, _ in points])
+
+        for x in range(256):
+            self.assertEqual(interpolator.interpolate_at(points, GF256elt(x)), p.f(GF256elt(x)))
+            self.assertEqual(interpolator.interpolate_at(points, GF256elt(x), weights), p.f(GF256elt(x)))
+
+        # Weights can be reused for other Ys
+        other_points = [(x, y * GF256elt(7)) for x, y in points]
+        self.assertEqual(interpolator.interpolate_at(other_points, GF256elt(0), weights),
+                         interpolator.interpolate(other_points).f(GF256elt(0)))
+
+    def test_duplicate_points(self):
+        interpolator = PGF256Interpolator()
+        points = [(GF256elt(1), GF256elt(2)), (GF256elt(3), GF256elt(4)), (GF256elt(1), GF256elt(5))]
+
+        with self.assertRaisesRegex(Exception, "Duplicate point exception"):
+            interpolator.interpolate(points)
+        with self.assertRaisesRegex(Exception, "Duplicate point exception"):
+            interpolator.interpolate_at(points, GF256elt(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
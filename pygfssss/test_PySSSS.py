@@ -16,10 +16,16 @@
 #
 
 import itertools
+import os
+import pathlib
+import tempfile
 import unittest
 from io import BytesIO
+from unittest import mock
 
-from pygfssss import core
+from pygfssss import core, mmapio
+from pygfssss.GF256elt import numpy
+from pygfssss.rng import ShakeDRBG
 
 
 class TestPySSSS(unittest.TestCase):
@@ -194,6 +200,338 @@ class TestPySSSS(unittest.TestCase):
 
         self.assertEqual(output_secret.getvalue(), secret.getvalue())
 
+    def test_chunk_sizes(self):
+
+        secret = BytesIO(b"Three may keep a secret, if two of them are dead.")
+        shares_count = 5
+        shares_threshold = 3
+
+        for chunk_size in [1, 2, 7, 48, 49, 50, 1024]:
+            shares = []
+            for _ in range(shares_count):
+                shares.append(BytesIO())
+
+            secret.seek(0)
+            core.split(secret, shares, shares_count, shares_threshold, chunk_size=chunk_size)
+
+            # Pick a subset of the shares
+            shares_subset = shares[0:shares_threshold]
+            for share in shares_subset:
+                share.seek(0)
+
+            output_secret = BytesIO()
+            core.combine(shares_subset, output_secret, chunk_size=chunk_size)
+
+            self.assertEqual(output_secret.getvalue(), secret.getvalue())
+
+    def test_truncated_share(self):
+
+        secret = BytesIO(b"A secret's worth depends on the people from whom it must be kept.")
+        shares_count = 3
+        shares_threshold = 3
+        shares = []
+        for _ in range(shares_count):
+            shares.append(BytesIO())
+
+        core.split(secret, shares, shares_count, shares_threshold)
+
+        # Truncate the last share
+        shares[2] = BytesIO(shares[2].getvalue()[:-1])
+        for share in shares:
+            share.seek(0)
+
+        output_secret = BytesIO()
+        with self.assertRaisesRegex(Exception, "Unexpected EOF while reading share 2"):
+            core.combine(shares, output_secret, chunk_size=16)
+
+    def test_deterministic_random_source(self):
+
+        secret = b"Secrets, silent, stony sit in the dark palaces of both our hearts."
+        shares_count = 6
+        shares_threshold = 4
+
+        def split_with_seed(seed):
+            shares = []
+            for _ in range(shares_count):
+                shares.append(BytesIO())
+            core.split(BytesIO(secret), shares, shares_count, shares_threshold, chunk_size=10,
+                       random_source=ShakeDRBG(seed))
+            return [share.getvalue() for share in shares]
+
+        shares = split_with_seed("seed")
+        self.assertEqual(shares, split_with_seed("seed"))
+        self.assertNotEqual(shares, split_with_seed("another seed"))
+
+        x_values = [share[0] for share in shares]
+        self.assertEqual(len(set(x_values)), shares_count)
+        self.assertNotIn(0, x_values)
+
+        output_secret = BytesIO()
+        core.combine([BytesIO(share) for share in shares[2:]], output_secret)
+
+        self.assertEqual(output_secret.getvalue(), secret)
+
+    def test_pick_random_x_values(self):
+
+        x_values = core.pick_random_x_values(255)
+        self.assertEqual(sorted(x_values), list(range(1, 256)))
+
+        with self.assertRaises(Exception):
+            core.pick_random_x_values(256)
+
+    def test_split_combine_file_jobs(self):
+
+        secret = bytes(range(256)) * 40
+        x_values = [7, 77, 177, 217]
+        shares_threshold = 3
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir_path = pathlib.Path(temp_dir)
+            secret_path = temp_dir_path / "secret"
+            secret_path.write_bytes(secret)
+            share_paths = [temp_dir_path / f"secret.{x:03}" for x in x_values]
+            output_path = temp_dir_path / "output"
+
+            core.split_file(secret_path, share_paths, shares_threshold, x_values, jobs=3, chunk_size=1000)
+            core.combine_file(share_paths[1:], output_path, x_values[1:], jobs=2, chunk_size=999)
+            self.assertEqual(output_path.read_bytes(), secret)
+
+            # Shares split by processes can be combined by a single process, and vice versa
+            core.combine_file(share_paths[:3], output_path, x_values[:3])
+            self.assertEqual(output_path.read_bytes(), secret)
+
+            core.split_file(secret_path, share_paths, shares_threshold, x_values)
+            core.combine_file(share_paths[:3], output_path, x_values[:3], jobs=2, chunk_size=4096)
+            self.assertEqual(output_path.read_bytes(), secret)
+
+            # Empty secret
+            secret_path.write_bytes(b"")
+            core.split_file(secret_path, share_paths, shares_threshold, x_values)
+            core.combine_file(share_paths[:3], output_path, x_values[:3])
+            self.assertEqual(output_path.read_bytes(), b"")
+
+            # Truncated share
+            secret_path.write_bytes(secret)
+            core.split_file(secret_path, share_paths, shares_threshold, x_values)
+            share_paths[3].write_bytes(share_paths[3].read_bytes()[:-1])
+            with self.assertRaisesRegex(Exception, "Unexpected EOF while reading share 2"):
+                core.combine_file(share_paths[1:], output_path, x_values[1:], jobs=2)
+
+    def test_combine_threshold(self):
+
+        class UnreadableStream:
+            def read(self, size=-1):
+                raise Exception("Unused share was read")
+
+        secret = b"Whoever keeps a secret is a master, whoever reveals one is a slave."
+        shares_count = 7
+        shares_threshold = 4
+        shares = []
+        for _ in range(shares_count):
+            shares.append(BytesIO())
+
+        core.split(BytesIO(secret), shares, shares_count, shares_threshold)
+
+        shares_subset = shares[2:6] + [UnreadableStream()]
+        for share in shares_subset[:shares_threshold]:
+            share.seek(0)
+
+        output_secret = BytesIO()
+        core.combine(shares_subset, output_secret, shares_threshold=shares_threshold)
+
+        self.assertEqual(output_secret.getvalue(), secret)
+
+        with self.assertRaisesRegex(Exception, "must be at least the threshold 4"):
+            core.combine(shares[:3], BytesIO(), shares_threshold=shares_threshold)
+
+    def test_file_engine_failure(self):
+
+        class FailingEngine:
+            """Engine failing on any chunk, optionally keeping NumPy arrays of the chunks alive."""
+
+            def __init__(self, export):
+                self.export = export
+
+            def fail(self, chunks):
+                # The arrays are referenced by the traceback, so the chunks stay exported
+                arrays = [numpy.frombuffer(chunk, dtype=numpy.uint8) for chunk in chunks] if self.export else []
+                raise Exception(f"Engine failure {len(arrays)}")
+
+            def split_chunk(self, secret_chunk, coeffs_chunks):
+                self.fail([secret_chunk])
+
+            def combine_chunk(self, share_chunks):
+                self.fail(share_chunks)
+
+        secret = bytes(range(256)) * 4
+        x_values = [1, 2, 3]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir_path = pathlib.Path(temp_dir)
+            secret_path = temp_dir_path / "secret"
+            secret_path.write_bytes(secret)
+            share_paths = [temp_dir_path / f"secret.{x:03}" for x in x_values]
+            output_path = temp_dir_path / "output"
+            core.split_file(secret_path, share_paths, 2, x_values)
+
+            for export in (False, True) if numpy is not None else (False,):
+                # The engine error is raised, not an error closing the maps
+                engine = FailingEngine(export)
+                with mock.patch.object(mmapio, "split_engine", lambda *args: engine):
+                    with self.assertRaisesRegex(Exception, "Engine failure"):
+                        mmapio.split_file(secret_path, share_paths, 2, x_values, 100)
+                with mock.patch.object(mmapio, "combine_engine", lambda *args: engine):
+                    with self.assertRaisesRegex(Exception, "Engine failure"):
+                        mmapio.combine_file(share_paths[:2], output_path, x_values[:2], 100)
+
+    def test_combine_file_threshold(self):
+
+        secret = bytes(range(256)) * 10
+        x_values = [3, 30, 130, 230, 250]
+        shares_threshold = 3
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir_path = pathlib.Path(temp_dir)
+            secret_path = temp_dir_path / "secret"
+            secret_path.write_bytes(secret)
+            share_paths = [temp_dir_path / f"secret.{x:03}" for x in x_values]
+            output_path = temp_dir_path / "output"
+
+            core.split_file(secret_path, share_paths, shares_threshold, x_values)
+            core.combine_file(share_paths, output_path, x_values, shares_threshold=shares_threshold,
+                              check_samples=100)
+            self.assertEqual(output_path.read_bytes(), secret)
+
+            # A corrupted unused share is found by the consistency check, and only by it
+            corrupted = bytearray(secret)
+            corrupted[::2] = bytes(len(corrupted[::2]))
+            share_paths[4].write_bytes(bytes(corrupted))
+
+            core.combine_file(share_paths, output_path, x_values, shares_threshold=shares_threshold)
+            self.assertEqual(output_path.read_bytes(), secret)
+
+            with self.assertRaisesRegex(Exception, "Share 4 is inconsistent with the first 3 shares"):
+                core.combine_file(share_paths, output_path, x_values, shares_threshold=shares_threshold,
+                                  check_samples=100)
+
+            # Shares that aren't regular files can't be checked
+            with self.assertRaisesRegex(Exception, "Consistency checks require all the shares to be regular files"):
+                core.combine_file(share_paths[:4] + [os.devnull], output_path, x_values,
+                                  shares_threshold=shares_threshold, check_samples=100)
+
+    def test_split_many(self):
+
+        secrets = [bytes([t]) * (t % 40) for t in range(100)]
+        shares_count = 5
+        shares_threshold = 3
+
+        x_values, blobs, offsets = core.split_many(secrets, shares_count, shares_threshold, chunk_size=64)
+
+        self.assertEqual(len(x_values), shares_count)
+        self.assertEqual(len(offsets), len(secrets) + 1)
+        for blob in blobs:
+            self.assertEqual(len(blob), sum(len(secret) for secret in secrets))
+
+        for j, secret in enumerate(secrets):
+            shares_subset = [BytesIO(blob[offsets[j]:offsets[j + 1]]) for blob in blobs[2:]]
+            output_secret = BytesIO()
+            core.combine(shares_subset, output_secret, x_values[2:])
+            self.assertEqual(output_secret.getvalue(), secret)
+
+        x_values, blobs, offsets = core.split_many([], 3, 2, x_values=[1, 2, 3])
+        self.assertEqual((x_values, blobs, offsets), ([1, 2, 3], [b"", b"", b""], [0]))
+
+        # Secrets given by a generator
+        x_values, blobs, offsets = core.split_many((bytes([t]) * 4 for t in range(3)), 3, 2)
+        self.assertEqual(offsets, [0, 4, 8, 12])
+        self.assertEqual([len(blob) for blob in blobs], [12, 12, 12])
+        self.assertEqual(core.combine_many([(x_values[:2], [blob[4:8] for blob in blobs[:2]])]), [bytes([1]) * 4])
+
+    def test_combine_many(self):
+
+        secrets = [bytes([t]) * t for t in range(50)]
+        x_values, blobs, offsets = core.split_many(secrets, 4, 2)
+
+        # A different pair of shares per secret, in a varying order
+        pairs = list(itertools.permutations(range(0, 4), 2))
+        share_sets = []
+        for j in range(len(secrets)):
+            pair = pairs[j % len(pairs)]
+            share_sets.append(([x_values[i] for i in pair], [blobs[i][offsets[j]:offsets[j + 1]] for i in pair]))
+
+        self.assertEqual(core.combine_many(share_sets), secrets)
+        self.assertEqual(core.combine_many([]), [])
+
+        with self.assertRaisesRegex(Exception, "Shares of secret 0 must have the same length"):
+            core.combine_many([([1, 2], [b"ab", b"a"])])
+
+    def test_combine_range(self):
+
+        secret = bytes(range(256)) * 10
+        shares_count = 4
+        shares_threshold = 3
+        shares = []
+        for _ in range(shares_count):
+            shares.append(BytesIO())
+
+        core.split(BytesIO(secret), shares, shares_count, shares_threshold)
+
+        for offset, length in ((0, 10), (1000, 1), (2550, 100), (100, None), (3000, 5), (7, 0)):
+            output_secret = BytesIO()
+            core.combine_range(shares[1:], output_secret, offset, length, chunk_size=64)
+            self.assertEqual(output_secret.getvalue(), secret[offset:offset + length if length is not None else None])
+
+        # External X values, only the requested range is read
+        x_values = [1, 2, 3]
+        shares = []
+        for _ in range(3):
+            shares.append(BytesIO())
+        core.split(BytesIO(secret), shares, 3, shares_threshold, x_values)
+        shares[2].truncate(2000)
+
+        output_secret = BytesIO()
+        core.combine_range(shares, output_secret, 1500, 100, x_values)
+        self.assertEqual(output_secret.getvalue(), secret[1500:1600])
+
+        with self.assertRaisesRegex(Exception, "Unexpected EOF while reading share 2"):
+            core.combine_range(shares, BytesIO(), 1500, 1000, x_values)
+
+    def test_iter_split_combine(self):
+
+        secret_chunks = [b"Secrets ", b"", b"have a way ", b"of coming out."]
+        secret = b"".join(secret_chunks)
+        shares_count = 4
+        shares_threshold = 2
+
+        share_chunks = list(core.iter_split(secret_chunks, shares_count, shares_threshold))
+        # X values, then one tuple per non-empty secret chunk
+        self.assertEqual(len(share_chunks), 4)
+        for chunks in share_chunks:
+            self.assertEqual(len(chunks), shares_count)
+
+        shares = [b"".join(chunks) for chunks in zip(*share_chunks)]
+
+        # Shares are identical to the stream API ones
+        output_secret = BytesIO()
+        core.combine([BytesIO(share) for share in shares[:2]], output_secret)
+        self.assertEqual(output_secret.getvalue(), secret)
+
+        # Unaligned share chunks
+        share_chunk_iters = [
+            [shares[1][:3], shares[1][3:]],
+            (shares[3][t:t + 1] for t in range(len(shares[3]))),
+        ]
+        self.assertEqual(b"".join(core.iter_combine(share_chunk_iters)), secret)
+
+    def test_iter_combine_truncated_share(self):
+
+        share_chunks = list(core.iter_split([b"abc", b"def"], 3, 3, x_values=[1, 2, 3]))
+        share_chunk_iters = [list(chunks) for chunks in zip(*share_chunks)]
+        share_chunk_iters[2] = share_chunk_iters[2][:1]
+
+        with self.assertRaisesRegex(Exception, "Unexpected EOF while reading share 2"):
+            b"".join(core.iter_combine(share_chunk_iters, x_values=[1, 2, 3]))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+import asyncio
+import unittest
+from io import BytesIO
+
+from pygfssss import core
+from pygfssss.aio import async_combine, async_split
+
+
+def stream_reader(data):
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+class AsyncSink:
+    """An 'async def write(data)' callable collecting the written data."""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    async def __call__(self, data):
+        # Let other writes run in between
+        await asyncio.sleep(0)
+        self.data += data
+
+
+class TestAio(unittest.TestCase):
+
+    def test_split_combine(self):
+
+        secret = b"Tell me a secret, and I'll tell you no lies." * 10
+        shares_count = 5
+        shares_threshold = 3
+
+        async def run():
+            sinks = [AsyncSink() for _ in range(shares_count)]
+            await async_split(stream_reader(secret), sinks, shares_count, shares_threshold, chunk_size=64)
+
+            # Shares are identical to the blocking API ones
+            output_secret = BytesIO()
+            core.combine([BytesIO(sink.data) for sink in sinks[2:]], output_secret)
+            self.assertEqual(output_secret.getvalue(), secret)
+
+            output_sink = AsyncSink()
+            await async_combine([stream_reader(bytes(sink.data)) for sink in sinks[:3]], output_sink,
+                                chunk_size=100)
+            self.assertEqual(bytes(output_sink.data), secret)
+
+        asyncio.run(run())
+
+    def test_external_x_values(self):
+
+        secret = b"Three can keep a secret."
+        x_values = [1, 2, 3]
+
+        async def run():
+            sinks = [AsyncSink() for _ in x_values]
+            await async_split(stream_reader(secret), sinks, 3, 2, x_values)
+
+            output_sink = AsyncSink()
+            await async_combine([stream_reader(bytes(sink.data)) for sink in sinks[1:]], output_sink, x_values[1:])
+            self.assertEqual(bytes(output_sink.data), secret)
+
+        asyncio.run(run())
+
+    def test_truncated_share(self):
+
+        async def run():
+            sinks = [AsyncSink() for _ in range(3)]
+            await async_split(stream_reader(b"no secret at all"), sinks, 3, 3)
+
+            readers = [stream_reader(bytes(sink.data)) for sink in sinks]
+            readers[1] = stream_reader(bytes(sinks[1].data[:-3]))
+            await async_combine(readers, AsyncSink())
+
+        with self.assertRaisesRegex(Exception, "Unexpected EOF while reading share 1"):
+            asyncio.run(run())
+
+
+if __name__ == '__main__':
+    unittest.main()
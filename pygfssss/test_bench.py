@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+import json
+import subprocess
+import sys
+import unittest
+
+from pygfssss import bench
+
+
+class TestBench(unittest.TestCase):
+
+    def test_parse_size(self):
+        self.assertEqual(bench.parse_size("100"), 100)
+        self.assertEqual(bench.parse_size("1K"), 1024)
+        self.assertEqual(bench.parse_size("64m"), 64 * 1024 ** 2)
+        self.assertEqual(bench.parse_size("1GB"), 1024 ** 3)
+
+    def test_run_benchmarks(self):
+        report = bench.run_benchmarks([100], [2, 4], [3], ["python"], [64], cli=True)
+
+        # Threshold 4 is skipped for 3 shares, then 2 library and 4 command line results
+        results = report["results"]
+        self.assertEqual(len(results), 6)
+        self.assertEqual([r["path"] for r in results], ["library", "library", "pygfsplit", "pygfcombine",
+                                                        "pygfssss", "pygfssss"])
+        for result in results:
+            self.assertEqual(result["size"], 100)
+            self.assertGreater(result["seconds"], 0)
+
+        json.dumps(report)
+
+    def test_bench_startup(self):
+        results = bench.bench_startup(1)
+
+        self.assertEqual([r["operation"] for r in results],
+                         ["python"] + [f"import {module}" for module in bench.STARTUP_MODULES] +
+                         ["pygfsplit", "pygfcombine"])
+        for result in results:
+            self.assertEqual(result["path"], "startup")
+            self.assertGreater(result["seconds"], 0)
+            self.assertLessEqual(result["min_seconds"], result["seconds"])
+
+    def test_command_line(self):
+        python_bin = sys.executable
+
+        result = subprocess.run(
+            f"{python_bin} bench.py --sizes 10 --thresholds 2 --shares 2 --backends python",
+            capture_output=True,
+            check=True,
+            shell=True)
+
+        report = json.loads(result.stdout)
+        self.assertEqual([r["operation"] for r in report["results"]], ["split", "combine"])
+
+
+if __name__ == '__main__':
+    unittest.main()
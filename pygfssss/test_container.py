@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+import unittest
+from io import BytesIO
+
+from pygfssss import container
+from pygfssss.GF256Field import GF256Field, RIJNDAEL_PRIME_POLY
+
+
+class TestContainer(unittest.TestCase):
+
+    def split(self, secret, shares_count, shares_threshold, chunk_size, x_values=None, field=None):
+        shares = [BytesIO() for _ in range(shares_count)]
+        container.split(BytesIO(secret), shares, shares_threshold, x_values, chunk_size, field=field)
+        return [share.getvalue() for share in shares]
+
+    def combine(self, shares):
+        output_secret = BytesIO()
+        container.combine([BytesIO(share) for share in shares], output_secret)
+        return output_secret.getvalue()
+
+    def test_header(self):
+        shares = self.split(b"x" * 100, 4, 3, 16, x_values=[5, 6, 7, 8],
+                            field=GF256Field.get(RIJNDAEL_PRIME_POLY))
+
+        header = container.ContainerHeader.unpack(shares[1])
+        self.assertEqual((header.x(), header.shares_threshold(), header.shares_count(), header.prime_poly(),
+                          header.length(), header.chunk_size(), header.chunk_count()),
+                         (6, 3, 4, RIJNDAEL_PRIME_POLY, 100, 16, 7))
+        self.assertEqual(len(shares[1]), header.container_size())
+
+        self.assertIsNone(container.ContainerHeader.unpack(b"GFSC"))
+        self.assertIsNone(container.ContainerHeader.unpack(bytes(container.HEADER_SIZE)))
+
+    def test_split_combine(self):
+        for length in (0, 1, 16, 17, 100):
+            secret = bytes(range(length))
+            shares = self.split(secret, 5, 3, 16)
+            self.assertEqual(self.combine(shares[2:]), secret)
+            self.assertEqual(self.combine(shares), secret)
+
+        # The field is read from the shares
+        secret = b"Secrets are made to be found out with time."
+        shares = self.split(secret, 3, 2, 10, field=GF256Field.get(RIJNDAEL_PRIME_POLY))
+        self.assertEqual(self.combine(shares[1:]), secret)
+
+    def test_corrupted_chunk_replaced(self):
+        secret = bytes(range(256)) * 4
+        shares = self.split(secret, 4, 2, 100)
+
+        corrupted = bytearray(shares[0])
+        corrupted[container.HEADER_SIZE + 550] ^= 0x01
+        shares[0] = bytes(corrupted)
+
+        self.assertEqual(self.combine(shares), secret)
+
+        with self.assertRaisesRegex(Exception, "Chunk 5 of share .* is corrupted"):
+            self.combine(shares[:2])
+
+    def test_combine_range(self):
+        secret = bytes(range(256)) * 4
+        shares = self.split(secret, 3, 2, 100)
+
+        for offset, length in ((0, 10), (99, 2), (150, 300), (1000, None), (1024, 10), (5, 0)):
+            output_secret = BytesIO()
+            container.combine_range([BytesIO(share) for share in shares[1:]], output_secret, offset, length)
+            self.assertEqual(output_secret.getvalue(), secret[offset:offset + length if length is not None else None])
+
+    def test_invalid_containers(self):
+        shares = self.split(b"secret", 4, 3, 16)
+
+        # Truncated and foreign shares aren't used
+        with self.assertRaisesRegex(Exception, "Only 2 shares are valid containers, threshold is 3"):
+            self.combine([shares[0][:-1], shares[1], shares[2], b"gfshare"])
+
+        with self.assertRaisesRegex(Exception, "No share is a valid container"):
+            self.combine([b"gfshare"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+import random
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from pygfssss.GF256elt import GF256elt, numpy
+from pygfssss.PGF256 import PGF256
+from pygfssss.PGF256Interpolator import PGF256Interpolator
+from pygfssss.engine import CombineEngine, SplitEngine, combine_engine, default_backend, lagrange_weights, \
+    set_weights_cache_size, split_engine, vandermonde_matrix, weights_cache_info, NUMPY_MIN_SIZE, WEIGHTS_CACHE_SIZE
+
+
+class TestEngine(unittest.TestCase):
+
+    def test_split_chunk_matches_polynomial(self):
+        rnd = random.Random("test_split_chunk_matches_polynomial")
+        shares_threshold = 4
+        x_values = [1, 2, 77, 200, 255]
+        secret_chunk = bytes([rnd.randint(0, 255) for _ in range(50)])
+        coeffs_chunks = [bytes([rnd.randint(0, 255) for _ in range(50)]) for _ in range(shares_threshold - 1)]
+
+        shares = SplitEngine(x_values, shares_threshold).split_chunk(secret_chunk, coeffs_chunks)
+
+        for pos in range(len(secret_chunk)):
+            poly = PGF256([GF256elt(secret_chunk[pos])] + [GF256elt(c[pos]) for c in coeffs_chunks])
+            for i, x in enumerate(x_values):
+                self.assertEqual(shares[i][pos], int(poly.f(GF256elt(x))))
+
+    def test_vandermonde_matrix(self):
+        matrix = vandermonde_matrix([1, 2, 3], 4)
+        self.assertEqual(matrix[0], [1, 1, 1, 1])
+        self.assertEqual(matrix[1], [1, 2, 4, 8])
+        self.assertEqual(matrix[2], [1, 3, 5, 15])
+
+        with self.assertRaises(Exception):
+            vandermonde_matrix([0, 1], 2)
+        with self.assertRaises(Exception):
+            vandermonde_matrix([1, 2], 0)
+
+    def test_split_engine_cached(self):
+        self.assertIs(split_engine([1, 2, 3], 2, "python"), split_engine((1, 2, 3), 2, "python"))
+        self.assertIsNot(split_engine([1, 2, 3], 2, "python"), split_engine([1, 2, 3], 3, "python"))
+
+    def test_split_chunk_single_threshold(self):
+        shares = SplitEngine([3, 4], 1).split_chunk(b"secret", [])
+        self.assertEqual(shares, [b"secret", b"secret"])
+
+    def test_combine_chunk_matches_interpolator(self):
+        rnd = random.Random("test_combine_chunk_matches_interpolator")
+        x_values = [5, 9, 130, 254]
+        share_chunks = [bytes([rnd.randint(0, 255) for _ in range(20)]) for _ in x_values]
+
+        secret_chunk = CombineEngine(x_values).combine_chunk(share_chunks)
+
+        zero = GF256elt(0)
+        for pos in range(len(secret_chunk)):
+            points = [(GF256elt(x), GF256elt(c[pos])) for x, c in zip(x_values, share_chunks)]
+            self.assertEqual(secret_chunk[pos], int(PGF256Interpolator().interpolate(points).f(zero)))
+
+    def test_split_combine_chunk(self):
+        x_values = [17, 34, 51, 68, 85]
+        shares_threshold = 3
+        secret_chunk = b"Secrets are made to be found out with time."
+        coeffs_chunks = [bytes(reversed(secret_chunk)), secret_chunk.upper()]
+
+        shares = SplitEngine(x_values, shares_threshold).split_chunk(secret_chunk, coeffs_chunks)
+
+        self.assertEqual(CombineEngine(x_values[2:]).combine_chunk(shares[2:]), secret_chunk)
+        self.assertEqual(CombineEngine(x_values[:3]).combine_chunk(shares[:3]), secret_chunk)
+
+        # Any bytes-like objects can be used
+        views = [memoryview(share) for share in shares[1:4]]
+        self.assertEqual(CombineEngine(x_values[1:4]).combine_chunk(views), secret_chunk)
+
+    @unittest.skipIf(numpy is None, "NumPy is not available")
+    def test_numpy_backend(self):
+        rnd = random.Random("test_numpy_backend")
+        x_values = [3, 1, 4, 15, 92, 65]
+        shares_threshold = 4
+        secret_chunk = bytes([rnd.randint(0, 255) for _ in range(1000)])
+        coeffs_chunks = [bytes([rnd.randint(0, 255) for _ in range(1000)]) for _ in range(shares_threshold - 1)]
+
+        shares = split_engine(x_values, shares_threshold, "numpy").split_chunk(secret_chunk, coeffs_chunks)
+        self.assertEqual(shares, split_engine(x_values, shares_threshold, "python").split_chunk(secret_chunk,
+                                                                                                 coeffs_chunks))
+
+        engine = combine_engine(x_values[1:5], "numpy")
+        self.assertEqual(engine.weights(), combine_engine(x_values[1:5], "python").weights())
+        self.assertEqual(engine.combine_chunk(shares[1:5]), secret_chunk)
+
+    def test_default_backend(self):
+        self.assertEqual(default_backend(100), "python")
+        self.assertEqual(default_backend(NUMPY_MIN_SIZE), "numpy" if numpy is not None else "python")
+        self.assertEqual(default_backend(), "numpy" if numpy is not None else "python")
+
+    def test_numpy_not_imported(self):
+        # The command line tools only import NumPy when it's used
+        subprocess.check_call([sys.executable, "-c",
+                               "import sys; from pygfssss import engine, gfcombine, gfsplit, gfssss; "
+                               "engine.combine_engine([1, 2], engine.default_backend(100)).combine_chunk([b'a', b'b']); "
+                               "sys.exit('numpy' in sys.modules)"])
+
+        # Neither does pygfssss on a small secret, be it piped or a regular file
+        check_imports = "import sys; from pygfssss import gfssss; gfssss.main(); sys.exit('numpy' in sys.modules)"
+        shares = subprocess.run([sys.executable, "-c", check_imports, "split", "2", "3"], input=b"secret",
+                                stdout=subprocess.PIPE, check=True).stdout
+        with tempfile.TemporaryFile() as secret_file:
+            secret_file.write(b"secret")
+            secret_file.seek(0)
+            subprocess.check_call([sys.executable, "-c", check_imports, "split", "2", "3"], stdin=secret_file,
+                                  stdout=subprocess.DEVNULL)
+        secret = subprocess.run([sys.executable, "-c", check_imports, "combine"], input=shares,
+                                stdout=subprocess.PIPE, check=True).stdout
+        self.assertEqual(secret, b"secret")
+
+    @unittest.skipIf(numpy is None, "NumPy is not available")
+    def test_numpy_imported_for_piped_secret(self):
+        # A piped secret of at least NUMPY_MIN_SIZE bytes is split with NumPy
+        check_imports = "import sys; from pygfssss import gfssss; gfssss.main(); sys.exit('numpy' not in sys.modules)"
+        secret = bytes(random.getrandbits(8) for _ in range(NUMPY_MIN_SIZE + 10))
+        shares = subprocess.run([sys.executable, "-c", check_imports, "split", "2", "3"], input=secret,
+                                stdout=subprocess.PIPE, check=True).stdout
+        combined = subprocess.run([sys.executable, "-m", "pygfssss.gfssss", "combine"], input=shares,
+                                  stdout=subprocess.PIPE, check=True).stdout
+        self.assertEqual(combined, secret)
+
+    def test_unknown_backend(self):
+        with self.assertRaisesRegex(Exception, "Unknown backend"):
+            split_engine([1, 2], 2, "fortran")
+
+    def test_lagrange_weights(self):
+        x_values = [6, 28, 196]
+        y_values = [11, 222, 33]
+        points = [(GF256elt(x), GF256elt(y)) for x, y in zip(x_values, y_values)]
+        poly = PGF256Interpolator().interpolate(points)
+
+        for x in (0, 1, 28, 255):
+            value = GF256elt(0)
+            for weight, y in zip(lagrange_weights(x_values, x), y_values):
+                value = value + GF256elt(weight) * GF256elt(y)
+            self.assertEqual(value, poly.f(GF256elt(x)))
+
+        self.assertEqual(lagrange_weights(x_values), CombineEngine(x_values).weights())
+
+    def test_weights_cache(self):
+        set_weights_cache_size(2)
+        try:
+            weights = CombineEngine([9, 3, 27]).weights()
+            self.assertEqual(weights_cache_info().misses, 1)
+
+            # Permutations of the X values share the same cache entry
+            self.assertEqual(CombineEngine([27, 9, 3]).weights(), [weights[2], weights[0], weights[1]])
+            self.assertEqual(weights_cache_info().hits, 1)
+
+            CombineEngine([1, 2])
+            CombineEngine([4, 5])
+            CombineEngine([3, 9, 27])
+            info = weights_cache_info()
+            self.assertEqual((info.hits, info.misses, info.currsize), (1, 4, 2))
+        finally:
+            set_weights_cache_size(WEIGHTS_CACHE_SIZE)
+
+    def test_combine_duplicate_x(self):
+        with self.assertRaisesRegex(Exception, "Duplicate point exception"):
+            CombineEngine([1, 2, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,7 +15,9 @@
 #  limitations under the License.
 #
 
+import argparse
 import itertools
+import os
 import pathlib
 import random
 import subprocess
@@ -23,10 +25,13 @@ import sys
 import tempfile
 import unittest
 
+from pygfssss import gfcombine
+
 
 class TestGfsplitGfcombine(unittest.TestCase):
 
-    def run_gfsplit_gfcombine(self, threshold, shares_count_to_create, share_indices_to_combine, secret_bytes_count):
+    def run_gfsplit_gfcombine(self, threshold, shares_count_to_create, share_indices_to_combine, secret_bytes_count,
+                              jobs=1, options="", split_options="", combine_options="", secret_range=None):
         python_bin = sys.executable
 
         input_file_name = "input.txt"
@@ -44,8 +49,8 @@ class TestGfsplitGfcombine(unittest.TestCase):
         f.write(secret_bytes)
         f.close()
 
-        subprocess.check_call(f"{python_bin} gfsplit.py -n {threshold} -m {shares_count_to_create} {input_file_path}",
-                              shell=True)
+        subprocess.check_call(f"{python_bin} gfsplit.py -j {jobs} {options} {split_options} -n {threshold} "
+                              f"-m {shares_count_to_create} {input_file_path}", shell=True)
 
         shares = temp_dir_path.glob(f"{input_file_name}.*")
         shares = [str(share) for share in shares]
@@ -55,15 +60,49 @@ class TestGfsplitGfcombine(unittest.TestCase):
 
         output_file_path = temp_dir_path / "output.txt"
 
-        subprocess.check_call(f"{python_bin} gfcombine.py {shares_file_paths} -o {output_file_path}", shell=True)
+        subprocess.check_call(f"{python_bin} gfcombine.py -j {jobs} {options} {combine_options} {shares_file_paths} "
+                              f"-o {output_file_path}", shell=True)
 
         with open(output_file_path, "rb") as f:
             secret_bytes_output = f.read()
 
         temp_dir.cleanup()
 
+        if secret_range is not None:
+            offset, length = secret_range
+            secret_bytes = secret_bytes[offset:offset + length if length is not None else None]
+
         self.assertEqual(secret_bytes, secret_bytes_output)
 
+    def assert_gfcombine_usage_error(self, options, message):
+        result = subprocess.run(f"{sys.executable} gfcombine.py {options} share.001 share.002", shell=True,
+                                capture_output=True)
+        self.assertEqual(result.returncode, 2)
+        self.assertIn(message, result.stderr.decode())
+
+    def test_check_samples_usage_errors(self):
+        self.assert_gfcombine_usage_error("--check-samples 10", "--check-samples requires -n")
+        for options in ("--integrity", "--container", "--pipeline", "--offset 1", "--length 1"):
+            self.assert_gfcombine_usage_error(f"-n 2 --check-samples 10 {options}",
+                                              "--check-samples can't be used with")
+
+    def test_mode_usage_errors(self):
+        self.assert_gfcombine_usage_error("--integrity --offset 1", "--offset and --length can't be used with")
+        self.assert_gfcombine_usage_error("--integrity --length 1", "--offset and --length can't be used with")
+        for options in ("--integrity", "--container", "--pipeline", "--offset 1", "--length 1"):
+            self.assert_gfcombine_usage_error(f"-j 2 {options}", "-j can't be used with")
+        self.assert_gfcombine_usage_error("--integrity --container", "--integrity can't be used with --container")
+        self.assert_gfcombine_usage_error("--container --prime-poly 0x11b",
+                                          "--prime-poly can't be used with --container")
+        for options in ("--integrity", "--container"):
+            self.assert_gfcombine_usage_error(f"-n 2 {options}", "-n can't be used with --integrity or --container")
+
+    def test_gfsplit_usage_errors(self):
+        result = subprocess.run(f"{sys.executable} gfsplit.py -j 2 -n 2 -m 3 - share", shell=True, input=b"secret",
+                                capture_output=True)
+        self.assertEqual(result.returncode, 2)
+        self.assertIn("-j can't be used when splitting stdin", result.stderr.decode())
+
     def test_split_combine_simple(self):
         self.run_gfsplit_gfcombine(3, 5, [0, 1, 4], 20)
 
@@ -78,6 +117,57 @@ class TestGfsplitGfcombine(unittest.TestCase):
         for subset in itertools.permutations(share_indices, 2):
             self.run_gfsplit_gfcombine(2, 4, subset, 100)
 
+    def test_split_combine_jobs(self):
+        self.run_gfsplit_gfcombine(3, 5, [4, 2, 0], 1000000, jobs=3)
+        self.run_gfsplit_gfcombine(2, 3, [0, 1], 0, jobs=2)
+
+    def test_split_combine_rijndael(self):
+        self.run_gfsplit_gfcombine(3, 5, [3, 1, 2], 100, options="--prime-poly 0x11b")
+
+    def test_split_combine_threshold(self):
+        self.run_gfsplit_gfcombine(3, 7, [6, 0, 3, 1, 5], 1000, combine_options="-n 3 --check-samples 50")
+
+    def test_split_combine_container(self):
+        self.run_gfsplit_gfcombine(3, 5, [4, 1, 2], 300000, options="--container")
+        # The field is read from the container
+        self.run_gfsplit_gfcombine(2, 3, [2, 0], 0, options="--container", split_options="--prime-poly 0x11b")
+
+    def test_split_combine_range(self):
+        self.run_gfsplit_gfcombine(3, 5, [1, 2, 3], 100000, combine_options="--offset 70000 --length 1000",
+                                   secret_range=(70000, 1000))
+        self.run_gfsplit_gfcombine(2, 4, [3, 1, 0], 10000, combine_options="-n 2 --offset 9990 --length 100",
+                                   secret_range=(9990, 100))
+        self.run_gfsplit_gfcombine(2, 3, [0, 2], 300000, options="--container",
+                                   combine_options="--offset 200000", secret_range=(200000, None))
+        self.run_gfsplit_gfcombine(3, 4, [3, 0, 1], 300000, options="--container",
+                                   combine_options="--offset 1000 --length 270000", secret_range=(1000, 270000))
+
+    def test_split_combine_pipeline(self):
+        self.run_gfsplit_gfcombine(3, 5, [2, 0, 4], 1000000, options="--pipeline --fsync")
+        self.run_gfsplit_gfcombine(2, 4, [3, 1, 2], 1000, options="--pipeline", combine_options="-n 2")
+
+    def test_split_combine_integrity(self):
+        self.run_gfsplit_gfcombine(3, 5, [0, 2, 4, 1], 300000, options="--integrity")
+        self.run_gfsplit_gfcombine(2, 3, [2, 0], 0, options="--integrity")
+
+    def test_secret_size(self):
+        with tempfile.NamedTemporaryFile() as share:
+            share.write(bytes(101))
+            share.flush()
+            self.assertEqual(gfcombine.secret_size(argparse.Namespace(input_file=[share.name], offset=None,
+                                                                      length=None)), 101)
+            self.assertEqual(gfcombine.secret_size(argparse.Namespace(input_file=[share.name], offset=1,
+                                                                      length=None)), 100)
+        # The size of other files (e.g. pipes) isn't known
+        self.assertIsNone(gfcombine.secret_size(argparse.Namespace(input_file=[os.devnull], offset=None,
+                                                                   length=None)))
+
+    def test_split_combine_stats(self):
+        self.run_gfsplit_gfcombine(3, 5, [1, 4, 0], 300000, options="--stats --progress")
+        self.run_gfsplit_gfcombine(2, 3, [2, 1], 300000, jobs=2, options="--stats")
+        self.run_gfsplit_gfcombine(2, 3, [0, 1], 300000, options="--stats",
+                                   combine_options="--offset 1000 --length 500", secret_range=(1000, 500))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -16,15 +16,18 @@
 #
 
 import itertools
+import pathlib
 import random
 import subprocess
 import sys
+import tempfile
 import unittest
 
 
 class TestGfssss(unittest.TestCase):
 
-    def run_split_combine(self, threshold, shares_count_to_create, share_indices_to_combine, secret_bytes_count):
+    def run_split_combine(self, threshold, shares_count_to_create, share_indices_to_combine, secret_bytes_count,
+                          options="", combine_options="", secret_range=None):
         python_bin = sys.executable
 
         # Generate deterministic random bytes content using deterministic seed.
@@ -33,7 +36,7 @@ class TestGfssss(unittest.TestCase):
         secret_bytes = bytes([rnd.randint(0, 255) for _ in range(secret_bytes_count)])
 
         result = subprocess.run(
-            f"{python_bin} gfssss.py split {threshold} {shares_count_to_create}",
+            f"{python_bin} gfssss.py split {options} {threshold} {shares_count_to_create}",
             input=secret_bytes,
             capture_output=True,
             check=True,
@@ -49,7 +52,7 @@ class TestGfssss(unittest.TestCase):
         shares_subset_bin = bytes(shares_subset_text, "ascii")
 
         result = subprocess.run(
-            f"{python_bin} gfssss.py combine",
+            f"{python_bin} gfssss.py combine {options} {combine_options}",
             input=shares_subset_bin,
             capture_output=True,
             check=True,
@@ -57,6 +60,10 @@ class TestGfssss(unittest.TestCase):
 
         secret_bytes_output = result.stdout
 
+        if secret_range is not None:
+            offset, length = secret_range
+            secret_bytes = secret_bytes[offset:offset + length if length is not None else None]
+
         self.assertEqual(secret_bytes, secret_bytes_output)
 
     def test_split_combine_simple(self):
@@ -73,6 +80,48 @@ class TestGfssss(unittest.TestCase):
         for subset in itertools.permutations(share_indices, 2):
             self.run_split_combine(2, 4, subset, 100)
 
+    def test_split_combine_rijndael(self):
+        self.run_split_combine(3, 5, [3, 1, 2], 100, options="--prime-poly 0x11b")
+
+    def test_split_combine_threshold(self):
+        self.run_split_combine(4, 7, range(0, 7), 100, combine_options="--threshold 4")
+
+    def test_split_combine_output_dir(self):
+        python_bin = sys.executable
+        secret_bytes = bytes(range(256)) * 1000
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            subprocess.run(f"{python_bin} gfssss.py split --output-dir {temp_dir} 2 4", input=secret_bytes,
+                           check=True, shell=True)
+
+            share_paths = sorted(pathlib.Path(temp_dir).glob("share.*"))
+            self.assertEqual(len(share_paths), 4)
+
+            result = subprocess.run(f"{python_bin} gfssss.py combine {share_paths[3]} {share_paths[1]}",
+                                    capture_output=True, check=True, shell=True)
+            self.assertEqual(result.stdout, secret_bytes)
+
+            result = subprocess.run(f"{python_bin} gfssss.py combine --offset 1000 --length 300 "
+                                    f"{share_paths[0]} {share_paths[2]}", capture_output=True, check=True, shell=True)
+            self.assertEqual(result.stdout, secret_bytes[1000:1300])
+
+            # Share files are the same as lines of the standard output
+            shares_bin = b"".join(path.read_bytes() for path in share_paths[:2])
+            result = subprocess.run(f"{python_bin} gfssss.py combine", input=shares_bin, capture_output=True,
+                                    check=True, shell=True)
+            self.assertEqual(result.stdout, secret_bytes)
+
+    def test_split_combine_range(self):
+        self.run_split_combine(3, 5, [1, 2, 3], 1000, combine_options="--offset 500 --length 20",
+                               secret_range=(500, 20))
+        self.run_split_combine(2, 3, [1, 2], 100, combine_options="--length 1", secret_range=(0, 1))
+
+    def test_split_combine_integrity(self):
+        self.run_split_combine(3, 5, [4, 0, 2], 1000, options="--integrity")
+
+    def test_split_combine_stats(self):
+        self.run_split_combine(3, 5, [2, 3, 0], 1000, options="--stats --progress")
+
 
 if __name__ == '__main__':
     unittest.main()
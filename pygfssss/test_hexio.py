@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+import unittest
+from io import BytesIO
+
+from pygfssss import hexio
+
+
+class TestHexio(unittest.TestCase):
+
+    def test_hex_writer_reader(self):
+        data = bytes(range(256))
+
+        text = BytesIO()
+        writer = hexio.HexWriter(text)
+        for pos in range(0, len(data), 7):
+            writer.write(data[pos:pos + 7])
+        self.assertEqual(text.getvalue(), data.hex().encode("ascii"))
+
+        reader = hexio.HexReader(BytesIO(b" " + text.getvalue()[:100] + b"\r\n" + text.getvalue()[100:] + b"\n"))
+        self.assertEqual(reader.read(1) + reader.read(60) + reader.read(1000) + reader.read(1), data)
+
+        reader = hexio.HexReader(BytesIO(text.getvalue() + b"\n"))
+        reader.read(3)
+        self.assertEqual(reader.seek(200), 200)
+        self.assertEqual(reader.read(2), data[200:202])
+
+    def test_spool_lines(self):
+        lines = b"0102\r\n\n0a0b0c\n  ff\n"
+
+        for chunk_size in (1, 2, 3, 100):
+            shares = hexio.spool_lines(BytesIO(lines), chunk_size=chunk_size)
+            self.assertEqual([share.read() for share in shares], [b"\x01\x02", b"\x0a\x0b\x0c", b"\xff"])
+
+        stream = BytesIO(lines)
+        shares = hexio.spool_lines(stream, max_lines=1, chunk_size=2)
+        self.assertEqual([share.read() for share in shares], [b"\x01\x02"])
+        self.assertEqual(stream.tell(), 6)
+
+        with self.assertRaisesRegex(Exception, "Odd amount of hex digits in share 1"):
+            hexio.spool_lines(BytesIO(b"00\n012\n"), chunk_size=2)
+
+    def test_prefixed_reader(self):
+        reader = hexio.PrefixedReader(b"0123", BytesIO(b"456789"))
+        self.assertEqual(reader.read(3), b"012")
+        self.assertEqual(reader.read(3), b"3")
+        self.assertEqual(reader.read(3), b"456")
+        self.assertEqual(reader.read(), b"789")
+        self.assertEqual(reader.read(3), b"")
+
+        self.assertEqual(hexio.PrefixedReader(b"01", BytesIO(b"23")).read(), b"0123")
+
+
+if __name__ == '__main__':
+    unittest.main()
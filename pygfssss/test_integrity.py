@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+import unittest
+from io import BytesIO
+
+from pygfssss import integrity
+from pygfssss.rng import ShakeDRBG
+
+
+class TestIntegrity(unittest.TestCase):
+
+    def split(self, secret, shares_count, shares_threshold, chunk_size, x_values=None):
+        shares = [BytesIO() for _ in range(shares_count)]
+        integrity.split(BytesIO(secret), shares, shares_count, shares_threshold, x_values, chunk_size,
+                        random_source=ShakeDRBG(secret))
+        return [share.getvalue() for share in shares]
+
+    def combine(self, shares, x_values=None):
+        output_secret = BytesIO()
+        integrity.combine([BytesIO(share) for share in shares], output_secret, x_values)
+        return output_secret.getvalue()
+
+    def test_split_combine(self):
+        for length in (0, 1, 15, 16, 17, 64, 100):
+            secret = bytes(range(length))
+            shares = self.split(secret, 5, 3, 16)
+            self.assertEqual(self.combine(shares[1:4]), secret)
+            self.assertEqual(self.combine(shares), secret)
+
+    def test_external_x_values(self):
+        secret = b"The only secrets are the secrets that keep themselves."
+        shares = self.split(secret, 4, 2, 10, [10, 20, 30, 40])
+        self.assertEqual(self.combine(shares[2:], [30, 40]), secret)
+
+    def test_corrupted_share_retried(self):
+        secret = b"Three may keep a secret, if two of them are dead." * 10
+        shares = self.split(secret, 5, 3, 32)
+
+        corrupted = bytearray(shares[0])
+        corrupted[100] ^= 0x01
+        shares[0] = bytes(corrupted)
+
+        self.assertEqual(self.combine(shares), secret)
+
+        # A corrupted digest copy is ignored too
+        shares = self.split(secret, 3, 2, 32)
+        corrupted = bytearray(shares[0])
+        corrupted[1 + integrity.HEADER_SIZE + 32] ^= 0x01
+        shares[0] = bytes(corrupted)
+
+        self.assertEqual(self.combine(shares[:2]), secret)
+
+    def test_corrupted_share_early_abort(self):
+        secret = b"Three may keep a secret, if two of them are dead." * 10
+        shares = self.split(secret, 5, 3, 32)
+
+        # Corrupt the third chunk of one of exactly threshold shares
+        corrupted = bytearray(shares[0])
+        corrupted[1 + integrity.HEADER_SIZE + 2 * (32 + integrity.DIGEST_SIZE)] ^= 0x80
+        shares[0] = bytes(corrupted)
+
+        output_secret = BytesIO()
+        with self.assertRaisesRegex(integrity.IntegrityError, "Chunk 2"):
+            integrity.combine([BytesIO(share) for share in shares[:3]], output_secret)
+
+        # Only the verified chunks were written
+        self.assertEqual(output_secret.getvalue(), secret[:64])
+
+    def test_truncated_share(self):
+        secret = bytes(range(256)) * 4
+        shares = self.split(secret, 4, 2, 100)
+
+        shares[1] = shares[1][:-200]
+        self.assertEqual(self.combine(shares), secret)
+
+        # Truncation exactly on a chunk boundary is detected through the last chunk flag
+        shares = self.split(secret, 2, 2, 100)
+        shares[1] = shares[1][:1 + integrity.HEADER_SIZE + 5 * (100 + integrity.DIGEST_SIZE)]
+        with self.assertRaises(integrity.IntegrityError):
+            self.combine(shares)
+
+    def test_invalid_header(self):
+        with self.assertRaisesRegex(Exception, "No share has a valid integrity header"):
+            self.combine([b"\x01" + b"\x00" * 100, b"\x02" + b"\x00" * 100])
+
+        shares = self.split(b"secret", 3, 3, 16)
+        with self.assertRaisesRegex(Exception, "threshold is 3"):
+            self.combine(shares[:2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+import tempfile
+import unittest
+from io import BytesIO
+
+from pygfssss import core, pipeline
+from pygfssss.rng import ShakeDRBG
+
+
+class FailingStream:
+    """Stream failing on any read or write."""
+
+    def read(self, size=-1):
+        raise Exception("Read failure")
+
+    def write(self, data):
+        raise Exception("Write failure")
+
+
+class TestPipeline(unittest.TestCase):
+
+    def test_split_combine(self):
+        secret = bytes(range(256)) * 100
+        shares_count = 5
+        shares_threshold = 3
+
+        shares = [BytesIO() for _ in range(shares_count)]
+        pipeline.split(BytesIO(secret), shares, shares_count, shares_threshold, chunk_size=1000, queue_size=2,
+                       random_source=ShakeDRBG("test_split_combine"))
+
+        # Shares are identical to the sequential ones
+        expected_shares = [BytesIO() for _ in range(shares_count)]
+        core.split(BytesIO(secret), expected_shares, shares_count, shares_threshold, chunk_size=1000,
+                   random_source=ShakeDRBG("test_split_combine"))
+        self.assertEqual([share.getvalue() for share in shares], [share.getvalue() for share in expected_shares])
+
+        output_secret = BytesIO()
+        pipeline.combine([BytesIO(share.getvalue()) for share in shares[2:]], output_secret, chunk_size=999)
+        self.assertEqual(output_secret.getvalue(), secret)
+
+    def test_fsync(self):
+        secret = b"Secrets are made to be found out with time."
+
+        with tempfile.TemporaryFile() as share1, tempfile.TemporaryFile() as share2, \
+                tempfile.TemporaryFile() as output_secret:
+            pipeline.split(BytesIO(secret), [share1, share2], 2, 2, x_values=[1, 2], fsync=True)
+
+            share1.seek(0)
+            share2.seek(0)
+            pipeline.combine([share1, share2], output_secret, x_values=[1, 2], fsync=True)
+
+            output_secret.seek(0)
+            self.assertEqual(output_secret.read(), secret)
+
+    def test_errors(self):
+        secret = bytes(1000)
+
+        with self.assertRaisesRegex(Exception, "Write failure"):
+            pipeline.split(BytesIO(secret), [BytesIO(), FailingStream()], 2, 2, chunk_size=10, queue_size=1)
+
+        with self.assertRaisesRegex(Exception, "Read failure"):
+            pipeline.split(FailingStream(), [BytesIO(), BytesIO()], 2, 2)
+
+        shares = [BytesIO(), BytesIO()]
+        pipeline.split(BytesIO(secret), shares, 2, 2, x_values=[1, 2])
+
+        with self.assertRaisesRegex(Exception, "Unexpected EOF while reading share 1"):
+            pipeline.combine([BytesIO(shares[0].getvalue()), BytesIO(shares[1].getvalue()[:-1])], BytesIO(),
+                             x_values=[1, 2], chunk_size=100, queue_size=1)
+
+        with self.assertRaisesRegex(Exception, "Write failure"):
+            pipeline.combine([BytesIO(share.getvalue()) for share in shares], FailingStream(), x_values=[1, 2],
+                             chunk_size=10, queue_size=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
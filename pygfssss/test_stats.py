@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+#
+#  Copyright 2021 Nimrod Zimerman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+import os
+import pstats
+import tempfile
+import unittest
+from io import BytesIO, StringIO
+
+from pygfssss import core
+from pygfssss.rng import ShakeDRBG
+from pygfssss.stats import STAGES, Stats, profile, progress_printer, stage
+
+
+class TestStats(unittest.TestCase):
+
+    def test_stages(self):
+        stats = Stats()
+        with stats.stage("compute", 10):
+            pass
+        with stage(stats, "compute", 5):
+            pass
+        stats.count("read", 7)
+        stats.chunk(15)
+
+        self.assertEqual(stats.stages(), list(STAGES))
+        self.assertEqual(stats.bytes("compute"), 15)
+        self.assertEqual(stats.bytes("read"), 7)
+        self.assertGreaterEqual(stats.seconds("compute"), 0.0)
+        self.assertEqual(stats.chunks(), 1)
+        self.assertEqual(stats.secret_bytes(), 15)
+        self.assertIn("15 bytes in 1 chunks", stats.report())
+
+        # Without Stats, stages do nothing
+        with stage(None, "compute", 5):
+            pass
+
+    def test_split_combine(self):
+        secret = bytes(range(256)) * 40
+        shares = [BytesIO() for _ in range(5)]
+        split_stats = Stats()
+        core.split(BytesIO(secret), shares, 5, 3, chunk_size=1024, random_source=ShakeDRBG(b"seed"),
+                   stats=split_stats)
+
+        self.assertEqual(split_stats.chunks(), 10)
+        self.assertEqual(split_stats.secret_bytes(), len(secret))
+        self.assertEqual(split_stats.bytes("read"), len(secret))
+        self.assertEqual(split_stats.bytes("random"), 2 * len(secret))
+        self.assertEqual(split_stats.bytes("compute"), len(secret))
+        self.assertEqual(split_stats.bytes("write"), 5 * len(secret))
+
+        # Statistics don't change the shares
+        plain_shares = [BytesIO() for _ in range(5)]
+        core.split(BytesIO(secret), plain_shares, 5, 3, chunk_size=1024, random_source=ShakeDRBG(b"seed"))
+        self.assertEqual([s.getvalue() for s in shares], [s.getvalue() for s in plain_shares])
+
+        lines = []
+        combine_stats = Stats(lambda s: lines.append(s.secret_bytes()))
+        output_secret = BytesIO()
+        core.combine([BytesIO(s.getvalue()) for s in shares[1:4]], output_secret, chunk_size=4096,
+                     stats=combine_stats)
+
+        self.assertEqual(output_secret.getvalue(), secret)
+        self.assertEqual(lines, [4096, 8192, len(secret)])
+        self.assertEqual(combine_stats.bytes("read"), 3 * len(secret))
+        self.assertEqual(combine_stats.bytes("write"), len(secret))
+
+    def test_split_combine_file(self):
+        secret = bytes(range(256)) * 40
+        with tempfile.TemporaryDirectory() as temp_dir:
+            secret_path = os.path.join(temp_dir, "secret")
+            with open(secret_path, "wb") as f:
+                f.write(secret)
+
+            share_paths = [os.path.join(temp_dir, f"secret.{x:03}") for x in (1, 2, 3)]
+            for jobs in (1, 2):
+                stats = Stats()
+                core.split_file(secret_path, share_paths, 2, [1, 2, 3], jobs, chunk_size=1024, stats=stats)
+                self.assertEqual(stats.secret_bytes(), len(secret))
+
+                stats = Stats()
+                output_path = os.path.join(temp_dir, "output")
+                core.combine_file(share_paths[1:], output_path, [2, 3], jobs, chunk_size=1024, stats=stats)
+                self.assertEqual(stats.secret_bytes(), len(secret))
+                with open(output_path, "rb") as f:
+                    self.assertEqual(f.read(), secret)
+
+    def test_progress_printer(self):
+        stream = StringIO()
+        stats = Stats(progress_printer(200, stream))
+        stats.chunk(100)
+        self.assertIn("100 bytes (50.0%)", stream.getvalue())
+
+    def test_profile(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "split.prof")
+            with profile(path):
+                core.split(BytesIO(b"secret"), [BytesIO() for _ in range(3)], 3, 2)
+
+            functions = [function for _, _, function in pstats.Stats(path).stats]
+            self.assertIn("split", functions)
+
+        # Without a path nothing is profiled
+        with profile(None):
+            pass
+
+
+if __name__ == '__main__':
+    unittest.main()
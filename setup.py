@@ -24,6 +24,7 @@ setup(
             'pygfssss = pygfssss.gfssss:main',
             'pygfsplit = pygfssss.gfsplit:main',
             'pygfcombine = pygfssss.gfcombine:main',
+            'pygfssss-bench = pygfssss.bench:main',
         ]
     },
 )